@@ -2,15 +2,18 @@ __all__ = [
     "ModelProtocol",
     "ModelBase",
     "M",
+    "get_path_format",
 ]
 
 import abc
 import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Protocol, Self, TypeVar, runtime_checkable
+from typing import Literal, Protocol, Self, TypeVar, runtime_checkable
 
 import yaml  # type: ignore[import-untyped]
 
+from aibs_informatics_core.utils.file_operations import CompressionType, open_path
 from aibs_informatics_core.utils.json import JSONObject
 
 T = TypeVar("T")
@@ -21,6 +24,34 @@ DEFAULT_VALIDATE = True
 
 M = TypeVar("M", bound="ModelBase")
 
+PathFormat = Literal["json", "jsonl", "yaml"]
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+YAML_SUFFIXES = (".yml", ".yaml")
+
+
+def get_path_format(path: Path) -> PathFormat:
+    """Determine the serialization format of a model file from its suffix.
+
+    Compression suffixes (e.g. ``.gz``, ``.zst``) are ignored, so ``model.yaml.gz``
+    is treated as YAML and ``records.jsonl.zst`` as JSON-lines.
+
+    Args:
+        path: Path to the model file.
+
+    Returns:
+        One of "json", "jsonl" or "yaml".
+    """
+    if CompressionType.from_path(path) is not None:
+        path = path.with_suffix("")
+    suffix = path.suffix.lower()
+    if suffix in YAML_SUFFIXES:
+        return "yaml"
+    elif suffix in JSONL_SUFFIXES:
+        return "jsonl"
+    return "json"
+
+
 # --------------------------------------------------------------
 #                             ModelProtocol
 # --------------------------------------------------------------
@@ -181,28 +212,103 @@ class ModelBase:
     def from_path(cls, path: Path, **kwargs) -> Self:
         """Create an instance from a JSON or YAML file.
 
+        Files with a compression suffix (``.gz``, ``.zst``) are decompressed
+        transparently while being read.
+
         Args:
             path: Path to the file. Files with `.yml` or `.yaml` extensions
                 are parsed as YAML; all others are parsed as JSON.
             **kwargs: Additional keyword arguments passed to `from_dict`.
 
+        Raises:
+            ValueError: If the path is a JSON-lines file. Use `iter_from_path` instead.
+
         Returns:
             A new instance of the model.
         """
-        if path.suffix in (".yml", ".yaml"):
-            with open(path) as f:
+        path_format = get_path_format(path)
+        if path_format == "jsonl":
+            raise ValueError(f"Cannot load single model from JSON-lines file {path}")
+        with open_path(path, "rt") as f:
+            if path_format == "yaml":
                 return cls.from_dict(yaml.safe_load(f), **kwargs)
-        else:
-            return cls.from_dict(json.loads(path.read_text()), **kwargs)
+            return cls.from_dict(json.load(f), **kwargs)
 
     def to_path(self, path: Path, **kwargs):
         """Serialize the model and write it to a file as JSON.
 
+        The JSON document is streamed to the file rather than built as a single
+        string. Files with a compression suffix (``.gz``, ``.zst``) are compressed
+        while being written. JSON-lines files are written as a single line.
+
         Args:
             path: Path to the output file.
-            **kwargs: Additional keyword arguments passed to `to_json`.
+            **kwargs: Additional keyword arguments passed to `to_dict`.
+        """
+        with open_path(path, "wt") as f:
+            if get_path_format(path) == "jsonl":
+                f.write(json.dumps(self.to_dict(**kwargs)))
+                f.write("\n")
+            else:
+                json.dump(self.to_dict(**kwargs), f, indent=4)
+
+    @classmethod
+    def iter_from_path(cls, path: Path, **kwargs) -> Iterator[Self]:
+        """Iterate over models stored in a file.
+
+        JSON-lines files (``.jsonl``, ``.ndjson``) are read record by record, so only
+        one record is held in memory at a time. JSON and YAML files must contain
+        a top-level list; these are loaded fully before iterating.
+
+        Args:
+            path: Path to the file. Compression suffixes are handled transparently.
+            **kwargs: Additional keyword arguments passed to `from_dict`.
+
+        Raises:
+            ValueError: If a JSON or YAML file does not contain a list.
+
+        Yields:
+            Model instances in file order.
+        """
+        path_format = get_path_format(path)
+        with open_path(path, "rt") as f:
+            if path_format == "jsonl":
+                for line in f:
+                    if line.strip():
+                        yield cls.from_dict(json.loads(line), **kwargs)
+                return
+            data = yaml.safe_load(f) if path_format == "yaml" else json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"Expected a list of {cls.__name__} objects in {path}")
+        for item in data:
+            yield cls.from_dict(item, **kwargs)
+
+    @classmethod
+    def many_to_path(cls, models: Iterable[Self], path: Path, **kwargs):
+        """Serialize models and write them to a single file.
+
+        JSON-lines files (``.jsonl``, ``.ndjson``) get one compact record per line.
+        All other files get a JSON list. Models are written one at a time, so
+        ``models`` may be a generator.
+
+        Args:
+            models: Models to write.
+            path: Path to the output file. Compression suffixes are handled transparently.
+            **kwargs: Additional keyword arguments passed to `to_dict`.
         """
-        path.write_text(self.to_json(**kwargs))
+        with open_path(path, "wt") as f:
+            if get_path_format(path) == "jsonl":
+                for model in models:
+                    f.write(json.dumps(model.to_dict(**kwargs)))
+                    f.write("\n")
+                return
+            f.write("[")
+            for i, model in enumerate(models):
+                if i:
+                    f.write(",")
+                f.write("\n")
+                json.dump(model.to_dict(**kwargs), f)
+            f.write("\n]")
 
     @classmethod
     def is_valid(cls, data: JSONObject, **kwargs) -> bool:
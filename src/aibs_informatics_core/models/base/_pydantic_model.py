@@ -1,17 +1,60 @@
 from __future__ import annotations
 
-from typing import ClassVar, Self
+import io
+import json
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
+from functools import cache
+from itertools import islice
+from pathlib import Path
+from typing import IO, Annotated, Any, ClassVar, Self, TypeVar, cast
 
-from pydantic import AliasGenerator, ConfigDict
+from pydantic import AliasGenerator, ConfigDict, PrivateAttr, TypeAdapter, create_model
 from pydantic import BaseModel as _PydanticBaseModel
 from pydantic.alias_generators import to_camel
+from pydantic_core import SchemaSerializer, SchemaValidator, from_json
 from pydantic_core import ValidationError as PydanticValidationError
 
 from aibs_informatics_core.exceptions import ValidationError
-from aibs_informatics_core.models.base._base_model import ModelBase
-from aibs_informatics_core.utils.functions import filter_kwargs
+from aibs_informatics_core.models.base._base_model import ModelBase, get_path_format
+from aibs_informatics_core.utils.file_operations import open_path
+from aibs_informatics_core.utils.functions import filter_kwargs, get_callable_params
 from aibs_informatics_core.utils.json import JSONObject
 
+DEFAULT_JSONL_CHUNK_SIZE = 1000
+
+P = TypeVar("P", bound="PydanticBaseModel")
+
+
+@cache
+def _get_type_adapter(model_class: type) -> TypeAdapter:
+    return TypeAdapter(model_class)
+
+
+def _get_accepted_kwargs(func: Callable) -> frozenset[str] | None:
+    """Returns the keyword arguments accepted by func, or None if it accepts ``**kwargs``"""
+    params = get_callable_params(func, include_var_keyword=True)
+    if not params:
+        return None
+    return frozenset(params - {"self", "cls"})
+
+
+# Keyword arguments of the validation-only check used by ``is_valid``
+_IS_VALID_KWARGS = frozenset(
+    (_get_accepted_kwargs(SchemaValidator.isinstance_python) or frozenset()).difference(
+        {"input", "self_instance"}
+    )
+)
+
+
+def _select_kwargs(kwargs: dict[str, Any], accepted: frozenset[str] | None) -> dict[str, Any]:
+    if accepted is None:
+        return kwargs
+    return {k: v for k, v in kwargs.items() if k in accepted}
+
+
 # --------------------------------------------------------------
 #                     PydanticModel
 # --------------------------------------------------------------
@@ -32,6 +75,21 @@ class PydanticBaseModel(_PydanticBaseModel, ModelBase):
         ),
     )
 
+    # Keyword arguments accepted by ``model_validate``/``model_dump``. These are resolved
+    # once per class so that ``from_dict``/``to_dict`` do not inspect signatures per call.
+    _model_validate_kwargs: ClassVar[frozenset[str] | None]
+    _model_dump_kwargs: ClassVar[frozenset[str] | None]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._resolve_accepted_kwargs()
+
+    @classmethod
+    def _resolve_accepted_kwargs(cls) -> None:
+        cls._model_validate_kwargs = _get_accepted_kwargs(cls.model_validate)
+        cls._model_dump_kwargs = _get_accepted_kwargs(cls.model_dump)
+
     @classmethod
     def from_dict(cls, data: JSONObject, **kwargs) -> Self:
         """Create an instance from a dictionary using Pydantic validation.
@@ -47,12 +105,333 @@ class PydanticBaseModel(_PydanticBaseModel, ModelBase):
             ValidationError: If the data fails Pydantic validation.
         """
         try:
-            return cls.model_validate(data, **filter_kwargs(cls.model_validate, kwargs))
+            if not kwargs:
+                return cls.model_validate(data)
+            return cls.model_validate(data, **_select_kwargs(kwargs, cls._model_validate_kwargs))
         except PydanticValidationError as e:
             # TODO: Need to figure out whether to use Pydantic's ValidationError or our own,
             #       and how to best preserve error details
             raise ValidationError(str(e)) from e
 
+    @classmethod
+    def is_valid(cls, data: JSONObject, **kwargs) -> bool:
+        """Checks whether data is valid for this model.
+
+        Uses the class's cached pydantic-core validator in check mode, which returns
+        a bool rather than raising and discarding a ``ValidationError`` for invalid
+        data. Subclasses that override ``from_dict`` fall back to constructing the
+        model so that their customizations still apply.
+
+        Args:
+            data (JSONObject): data to validate against model
+            **kwargs: additional kwargs (e.g. ``strict``) to use for validation
+
+        Returns:
+            bool: True if the model is valid, False otherwise.
+        """
+        if not cls._is_default_method("from_dict"):
+            return super().is_valid(data, **kwargs)
+        try:
+            return cls.__pydantic_validator__.isinstance_python(
+                data, **_select_kwargs(kwargs, _IS_VALID_KWARGS)
+            )
+        except Exception:
+            return False
+
+    @classmethod
+    def from_dict_lazy(
+        cls, data: JSONObject, lazy_fields: Iterable[str] | None = None, **kwargs
+    ) -> Self:
+        """Create an instance whose selected fields are validated on first access.
+
+        Lazy fields are kept as raw JSON values and only validated (and cached) when
+        the attribute is first read. All other fields are validated immediately.
+        This is useful when only a few top-level fields of a large payload are needed.
+
+        The returned object is an instance of a generated subclass of this class.
+        ``to_dict`` validates all remaining lazy fields before serializing. Call
+        `validate_lazy_fields` to get a fully validated instance of this class.
+
+        Fields with field validators (``@field_validator``) cannot be validated lazily,
+        because the validators would receive the raw JSON value.
+
+        Args:
+            data: Dictionary representation of the model.
+            lazy_fields: Names of fields to validate lazily. Defaults to all fields
+                without field validators.
+            **kwargs: Additional keyword arguments passed to ``model_validate``.
+
+        Raises:
+            ValueError: If a lazy field is not a field of the model or has field validators.
+            ValidationError: If the non-lazy data fails Pydantic validation.
+
+        Returns:
+            A partially validated instance of the model.
+        """
+        validated_fields = _get_fields_with_validators(cls)
+        if lazy_fields is None:
+            lazy_fields = frozenset(cls.model_fields).difference(validated_fields)
+        lazy_fields = frozenset(lazy_fields)
+        if unknown_fields := lazy_fields.difference(cls.model_fields):
+            raise ValueError(f"{cls.__name__} has no fields named {sorted(unknown_fields)}")
+        if fields_with_validators := lazy_fields.intersection(validated_fields):
+            raise ValueError(
+                f"{cls.__name__} fields {sorted(fields_with_validators)} have field "
+                "validators and cannot be validated lazily"
+            )
+        lazy_model_class = _get_lazy_model_class(cls, lazy_fields)
+        return lazy_model_class.from_dict(data, **kwargs)
+
+    @classmethod
+    def from_json_lazy(
+        cls, data: str | bytes, lazy_fields: Iterable[str] | None = None, **kwargs
+    ) -> Self:
+        """Create an instance from a JSON string whose selected fields are validated lazily.
+
+        Args:
+            data: JSON string or bytes representation of the model.
+            lazy_fields: Names of fields to validate lazily. Defaults to all fields
+                without field validators.
+            **kwargs: Additional keyword arguments passed to `from_dict_lazy`.
+
+        Returns:
+            A partially validated instance of the model.
+        """
+        return cls.from_dict_lazy(from_json(data), lazy_fields=lazy_fields, **kwargs)
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether this instance still has lazy fields that have not been validated."""
+        return False
+
+    def validate_lazy_fields(self) -> Self:
+        """Return a fully validated instance of the model.
+
+        For instances created with `from_dict_lazy`, all remaining lazy fields are
+        validated and a new instance of the original model class is returned.
+        Otherwise the instance itself is returned.
+
+        Raises:
+            ValidationError: If a lazy field fails Pydantic validation.
+
+        Returns:
+            A fully validated model instance.
+        """
+        return self
+
+    @classmethod
+    def from_path(cls, path: Path, **kwargs) -> Self:
+        """Create an instance from a JSON or YAML file.
+
+        JSON files are validated directly from the raw file bytes with
+        ``model_validate_json``, which avoids building an intermediate string
+        and dictionary. Subclasses that override ``from_dict`` fall back to the
+        default dictionary-based loading so that their customizations still apply.
+
+        Args:
+            path: Path to the file. Compression suffixes are handled transparently.
+            **kwargs: Additional keyword arguments passed to ``model_validate_json``
+                (or ``from_dict`` for YAML files).
+
+        Returns:
+            A validated instance of the model.
+
+        Raises:
+            ValidationError: If the data fails Pydantic validation.
+        """
+        if get_path_format(path) != "json" or not cls._is_default_method("from_dict"):
+            return super().from_path(path, **kwargs)
+        with open_path(path, "rb") as f:
+            json_data = f.read()
+        try:
+            return cls.model_validate_json(
+                json_data, **filter_kwargs(cls.model_validate_json, kwargs)
+            )
+        except PydanticValidationError as e:
+            raise ValidationError(str(e)) from e
+
+    @classmethod
+    def iter_from_path(cls, path: Path, **kwargs) -> Iterator[Self]:
+        """Iterate over models stored in a file.
+
+        JSON-lines files are read with `iter_from_jsonl`. All other formats are
+        handled by `ModelBase.iter_from_path`.
+
+        Args:
+            path: Path to the file. Compression suffixes are handled transparently.
+            **kwargs: Additional keyword arguments passed to `iter_from_jsonl`
+                (or ``from_dict`` for other formats).
+
+        Returns:
+            An iterator of model instances in file order.
+        """
+        if get_path_format(path) == "jsonl":
+            return cls.iter_from_jsonl(path, **kwargs)
+        return super().iter_from_path(path, **kwargs)
+
+    @classmethod
+    def many_to_path(cls, models: Iterable[Self], path: Path, **kwargs):
+        """Serialize models and write them to a single file.
+
+        JSON-lines files are written with `write_jsonl`. All other formats are
+        handled by `ModelBase.many_to_path`.
+
+        Args:
+            models: Models to write.
+            path: Path to the output file. Compression suffixes are handled transparently.
+            **kwargs: Additional keyword arguments passed to `write_jsonl`
+                (or ``to_dict`` for other formats).
+        """
+        if get_path_format(path) == "jsonl":
+            cls.write_jsonl(models, path, **kwargs)
+        else:
+            super().many_to_path(models, path, **kwargs)
+
+    @classmethod
+    def iter_from_jsonl(
+        cls,
+        path_or_stream: str | Path | IO,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_JSONL_CHUNK_SIZE,
+        **kwargs,
+    ) -> Iterator[Self]:
+        """Iterate over models stored as JSON-lines, one record per line.
+
+        Each line is validated directly from its raw bytes using a cached
+        ``TypeAdapter`` for the class. Records are yielded as they are validated,
+        so the file is never loaded into memory as a whole.
+
+        Args:
+            path_or_stream: Path of a JSON-lines file (compression suffixes are handled
+                transparently) or an open text or binary stream.
+            max_workers: If greater than 1, chunks of lines are validated in a thread pool
+                of this size. Records are still yielded in file order. Defaults to None.
+            chunk_size: Number of lines per chunk in thread pool mode. Defaults to 1000.
+            **kwargs: Additional keyword arguments passed to ``validate_json``
+                (or ``from_dict`` if it is overridden by a subclass).
+
+        Raises:
+            ValidationError: If a line fails Pydantic validation.
+
+        Yields:
+            Model instances in file order.
+        """
+        if isinstance(path_or_stream, (str, Path)):
+            with open_path(path_or_stream, "rb") as f:
+                yield from cls._iter_from_jsonl_stream(f, max_workers, chunk_size, **kwargs)
+        else:
+            yield from cls._iter_from_jsonl_stream(
+                path_or_stream, max_workers, chunk_size, **kwargs
+            )
+
+    @classmethod
+    def write_jsonl(cls, models: Iterable[Self], path_or_stream: str | Path | IO, **kwargs):
+        """Write models as JSON-lines, one record per line.
+
+        Each model is serialized directly to JSON bytes with the Pydantic serializer of
+        its own class, so fields of subclass instances are kept. ``models`` may be a
+        generator; no intermediate list or dictionary is built.
+
+        Args:
+            models: Models to write.
+            path_or_stream: Path of the output file (compression suffixes are handled
+                transparently) or an open text or binary stream.
+            **kwargs: Additional keyword arguments passed to the Pydantic JSON serializer
+                (or ``to_dict`` if it is overridden by a subclass).
+                Supports ``exclude_none`` (default: True).
+        """
+        if isinstance(path_or_stream, (str, Path)):
+            with open_path(path_or_stream, "wb") as f:
+                cls._write_jsonl_stream(models, f, **kwargs)
+        else:
+            cls._write_jsonl_stream(models, path_or_stream, **kwargs)
+
+    @classmethod
+    def _iter_from_jsonl_stream(
+        cls, stream: IO, max_workers: int | None, chunk_size: int, **kwargs
+    ) -> Iterator[Self]:
+        adapter = _get_type_adapter(cls) if cls._is_default_method("from_dict") else None
+        if adapter is not None:
+            kwargs = filter_kwargs(adapter.validate_json, kwargs)
+
+        def validate_chunk(chunk: list[tuple[int, str | bytes]]) -> list[Self]:
+            return [
+                cls._validate_jsonl_line(line_number, line, adapter, kwargs)
+                for line_number, line in chunk
+            ]
+
+        lines = ((i, line) for i, line in enumerate(stream, start=1) if line.strip())
+        if not max_workers or max_workers <= 1:
+            for line_number, line in lines:
+                yield cls._validate_jsonl_line(line_number, line, adapter, kwargs)
+            return
+
+        # Bound the number of in-flight chunks so that memory stays proportional
+        # to max_workers * chunk_size rather than the size of the file.
+        pending: deque[Future[list[Self]]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while chunk := list(islice(lines, chunk_size)):
+                pending.append(executor.submit(validate_chunk, chunk))
+                if len(pending) >= 2 * max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    @classmethod
+    def _validate_jsonl_line(
+        cls,
+        line_number: int,
+        line: str | bytes,
+        adapter: TypeAdapter | None,
+        kwargs: dict[str, Any],
+    ) -> Self:
+        try:
+            if adapter is not None:
+                return adapter.validate_json(line, **kwargs)
+            return cls.from_dict(json.loads(line), **kwargs)
+        except PydanticValidationError as e:
+            raise ValidationError(f"Invalid {cls.__name__} on line {line_number}: {e}") from e
+
+    @classmethod
+    def _write_jsonl_stream(cls, models: Iterable[Self], stream: IO, **kwargs):
+        serialize: Callable[[Self], bytes]
+        if cls._is_default_method("to_dict"):
+            dump_kwargs: dict[str, Any] = {"exclude_none": True}
+            dump_kwargs.update(filter_kwargs(SchemaSerializer.to_json, kwargs))
+
+            def serialize(model: Self) -> bytes:
+                # Serialize with the schema of the model's own class, so that fields of
+                # subclass instances are kept.
+                model_class = type(model)
+                if model_class is not cls and not model_class._is_default_method("to_dict"):
+                    return json.dumps(model.to_dict(**kwargs)).encode()
+                return model.__pydantic_serializer__.to_json(model, **dump_kwargs)
+
+        else:
+
+            def serialize(model: Self) -> bytes:
+                return json.dumps(model.to_dict(**kwargs)).encode()
+
+        is_text_stream = isinstance(stream, io.TextIOBase)
+        for model in models:
+            data = serialize(model)
+            if is_text_stream:
+                stream.write(data.decode())
+                stream.write("\n")
+            else:
+                stream.write(data)
+                stream.write(b"\n")
+
+    @classmethod
+    def _is_default_method(cls, name: str) -> bool:
+        # Fast paths that bypass ``from_dict``/``to_dict`` are only safe if the
+        # method has not been customized by a subclass.
+        method = getattr(cls, name)
+        default_method = getattr(PydanticBaseModel, name)
+        return getattr(method, "__func__", method) is getattr(
+            default_method, "__func__", default_method
+        )
+
     def to_dict(self, **kwargs) -> JSONObject:
         """Serialize the model to a dictionary using Pydantic serialization.
 
@@ -70,14 +449,122 @@ class PydanticBaseModel(_PydanticBaseModel, ModelBase):
         Raises:
             ValidationError: If serialization fails Pydantic validation.
         """
-        # Ensure None values are excluded by default to mirror DataClassJsonMixin settings
-        exclude_none = kwargs.pop("exclude_none", True)
-        mode = kwargs.pop("mode", "json")
         try:
-            return self.model_dump(
-                mode=mode,  # Use JSON serialization mode
-                exclude_none=exclude_none,  # Exclude None values by default
-                **filter_kwargs(self.model_dump, kwargs),
-            )
+            if not kwargs:
+                # Use JSON serialization mode and exclude None values by default
+                # to mirror DataClassJsonMixin settings
+                return self.model_dump(mode="json", exclude_none=True)
+            dump_kwargs: dict[str, Any] = {"mode": "json", "exclude_none": True}
+            dump_kwargs.update(_select_kwargs(kwargs, self._model_dump_kwargs))
+            return self.model_dump(**dump_kwargs)
         except PydanticValidationError as e:
             raise ValidationError(str(e)) from e
+
+
+PydanticBaseModel._resolve_accepted_kwargs()
+
+
+# --------------------------------------------------------------
+#                     Lazy Models
+# --------------------------------------------------------------
+
+
+class _LazyModel(PydanticBaseModel):
+    """Base for generated models that validate selected fields on first access.
+
+    Lazy fields are declared as ``Any`` on the generated model, so the raw JSON
+    values are stored as-is during validation. On first attribute access the raw
+    value is validated with the original field's type and written back.
+    """
+
+    __lazy_model_class__: ClassVar[type[PydanticBaseModel]]
+    __lazy_field_adapters__: ClassVar[dict[str, TypeAdapter]]
+
+    _validated_lazy_fields: set[str] = PrivateAttr(default_factory=set)
+
+    def __getattribute__(self, name: str) -> Any:
+        adapters = type(self).__lazy_field_adapters__
+        if name not in adapters:
+            return super().__getattribute__(name)
+        values = object.__getattribute__(self, "__dict__")
+        private = object.__getattribute__(self, "__pydantic_private__")
+        validated = private["_validated_lazy_fields"] if private is not None else set()
+        if name not in validated and name in values:
+            try:
+                values[name] = adapters[name].validate_python(values[name])
+            except PydanticValidationError as e:
+                raise ValidationError(str(e)) from e
+            validated.add(name)
+        return values[name]
+
+    @property
+    def is_lazy(self) -> bool:
+        return not self._validated_lazy_fields.issuperset(
+            set(type(self).__lazy_field_adapters__).intersection(self.__dict__)
+        )
+
+    def validate_lazy_fields(self) -> Self:
+        model_class = type(self).__lazy_model_class__
+        # Values are used as stored: only lazy fields that were not accessed yet are
+        # validated here, all other values were validated on creation or on access.
+        values = dict(self.__dict__)
+        if model_class.__pydantic_decorators__.model_validators:
+            # Model validators must see the complete model, so they require a full pass.
+            data = {name: values[name] for name in self.model_fields_set}
+            try:
+                return model_class.model_validate(data)  # type: ignore[return-value]
+            except PydanticValidationError as e:
+                raise ValidationError(str(e)) from e
+        validated = self._validated_lazy_fields
+        try:
+            for name, adapter in type(self).__lazy_field_adapters__.items():
+                if name in values and name not in validated:
+                    values[name] = adapter.validate_python(values[name])
+        except PydanticValidationError as e:
+            raise ValidationError(str(e)) from e
+        return model_class.model_construct(  # type: ignore[return-value]
+            _fields_set=set(self.model_fields_set), **values, **(self.__pydantic_extra__ or {})
+        )
+
+    def to_dict(self, **kwargs) -> JSONObject:
+        return self.validate_lazy_fields().to_dict(**kwargs)
+
+
+@cache
+def _get_fields_with_validators(model_class: type[PydanticBaseModel]) -> frozenset[str]:
+    fields: set[str] = set()
+    for decorator in model_class.__pydantic_decorators__.field_validators.values():
+        if "*" in decorator.info.fields:
+            return frozenset(model_class.model_fields)
+        fields.update(decorator.info.fields)
+    return frozenset(fields)
+
+
+@cache
+def _get_lazy_model_class(model_class: type[P], lazy_fields: frozenset[str]) -> type[P]:
+    field_definitions: dict[str, Any] = {}
+    field_adapters: dict[str, TypeAdapter] = {}
+    for name in lazy_fields:
+        field_info = model_class.model_fields[name]
+        annotation = field_info.annotation
+        if field_info.metadata:
+            annotation = Annotated[(annotation, *field_info.metadata)]  # type: ignore[assignment]
+        field_adapters[name] = TypeAdapter(annotation)
+
+        lazy_field_info = copy(field_info)
+        lazy_field_info.annotation = Any
+        lazy_field_info.metadata = []
+        field_definitions[name] = (Any, lazy_field_info)
+
+    lazy_model_class = cast(
+        type[_LazyModel],
+        create_model(
+            f"Lazy{model_class.__name__}",
+            __base__=cast(Any, (_LazyModel, model_class)),
+            __module__=model_class.__module__,
+            **field_definitions,
+        ),
+    )
+    lazy_model_class.__lazy_model_class__ = model_class
+    lazy_model_class.__lazy_field_adapters__ = field_adapters
+    return cast(type[P], lazy_model_class)
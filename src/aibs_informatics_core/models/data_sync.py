@@ -15,9 +15,11 @@ __all__ = [
     "PrepareBatchDataSyncResponse",
 ]
 
+from functools import cache
 from pathlib import Path
 
-from pydantic import Field, JsonValue, model_validator
+from pydantic import AliasChoices, AliasPath, Field, JsonValue, model_validator
+from pydantic.fields import FieldInfo
 
 from aibs_informatics_core.models.aws.efs import EFSPath
 from aibs_informatics_core.models.aws.s3 import S3KeyPrefix, S3Path
@@ -141,6 +143,34 @@ class DataSyncResponse(PydanticBaseModel):
     result: DataSyncResult
 
 
+def _get_field_keys(field_name: str, field_info: FieldInfo) -> frozenset[str]:
+    """Returns the keys a field can be provided by: its name, alias and validation aliases"""
+    keys = {field_name}
+    if field_info.alias:
+        keys.add(field_info.alias)
+    validation_alias = field_info.validation_alias
+    choices: list[str | AliasPath] = []
+    if isinstance(validation_alias, AliasChoices):
+        choices.extend(validation_alias.choices)
+    elif validation_alias is not None:
+        choices.append(validation_alias)
+    for choice in choices:
+        key = choice.path[0] if isinstance(choice, AliasPath) else choice
+        if isinstance(key, str):
+            keys.add(key)
+    return frozenset(keys)
+
+
+@cache
+def _get_required_field_keys(model_class: type[PydanticBaseModel]) -> tuple[frozenset[str], ...]:
+    """Returns the keys each required field of a model can be provided by"""
+    return tuple(
+        _get_field_keys(field_name, field_info)
+        for field_name, field_info in model_class.model_fields.items()
+        if field_info.is_required()
+    )
+
+
 class BatchDataSyncRequest(PydanticBaseModel):
     """Request for a batch of data sync operations."""
 
@@ -150,7 +180,9 @@ class BatchDataSyncRequest(PydanticBaseModel):
     @model_validator(mode="before")
     @classmethod
     def _handle_single_flattened_request(cls, data: dict[str, JSON]) -> dict[str, JSON]:
-        if DataSyncRequest.is_valid(data=data):
+        # Only check for the keys of a flattened request here. The request is validated
+        # once, as part of `requests`, rather than once here and again afterwards.
+        if cls._is_single_flattened_request(data):
             data = {
                 "requests": [data],
                 "allow_partial_failure": False,
@@ -158,6 +190,12 @@ class BatchDataSyncRequest(PydanticBaseModel):
             }
         return data
 
+    @staticmethod
+    def _is_single_flattened_request(data: dict[str, JSON]) -> bool:
+        if not isinstance(data, dict):
+            return False
+        return all(not keys.isdisjoint(data) for keys in _get_required_field_keys(DataSyncRequest))
+
 
 class BatchDataSyncResult(DataSyncResult):
     """Aggregated result metrics for a batch data sync."""
@@ -9,11 +9,13 @@ __all__ = [
     "JobParamPair",
     "JobParamSetPair",
     "ParamPair",
+    "ParamPairGraph",
     "ParamSetPair",
     "ResolvedParamSetPair",
     "ResolvableJobParam",
     "DownloadableJobParam",
     "UploadableJobParam",
+    "dedupe_executions",
 ]
 
 from aibs_informatics_core.models.demand_execution.job_param import (
@@ -24,11 +26,15 @@ from aibs_informatics_core.models.demand_execution.job_param import (
     UploadableJobParam,
 )
 from aibs_informatics_core.models.demand_execution.metadata import DemandExecutionMetadata
-from aibs_informatics_core.models.demand_execution.model import DemandExecution
+from aibs_informatics_core.models.demand_execution.model import (
+    DemandExecution,
+    dedupe_executions,
+)
 from aibs_informatics_core.models.demand_execution.param_pair import (
     JobParamPair,
     JobParamSetPair,
     ParamPair,
+    ParamPairGraph,
     ParamSetPair,
     ResolvedParamSetPair,
 )
@@ -1,6 +1,7 @@
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from re import Match, Pattern
 from typing import ClassVar, TypeVar
 
@@ -11,6 +12,8 @@ from aibs_informatics_core.models.demand_execution.resolvables import Resolvable
 class JobParamEnvName(ValidatedStr):
     regex_pattern: ClassVar[Pattern] = re.compile(r"([_a-zA-Z][_a-zA-Z0-9]*)")
 
+    _raw: str
+
     def __new__(cls, value):
         normalized_value = value.replace("-", "_").replace(".", "_").upper()
         obj = super().__new__(cls, normalized_value)
@@ -54,22 +57,54 @@ class JobParamRef(ValidatedStr):
 
 T = TypeVar("T")
 
+# Param names are normalized very frequently, so envnames are shared process wide
+ENVNAME_CACHE_SIZE = 2**16
+
+
+@lru_cache(maxsize=ENVNAME_CACHE_SIZE)
+def _get_envname(name: str) -> JobParamEnvName:
+    return JobParamEnvName(name)
+
+
+# Instance attributes caching values derived from the fields of a JobParam
+_CACHED_ATTRS = frozenset({"_hash", "_envname"})
+
 
 @dataclass
 class JobParam:
     name: str
     value: str
 
+    def __setattr__(self, name: str, value) -> None:
+        # Params are mutable (e.g. replace_references), so drop the cached hash on change
+        self.__dict__.pop("_hash", None)
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict:
+        # Cached values are not pickled (or copied), str hashes differ between processes
+        return {k: v for k, v in self.__dict__.items() if k not in _CACHED_ATTRS}
+
     def __hash__(self) -> int:
-        return hash(self.name + str(self.value))
+        hash_value: int | None = self.__dict__.get("_hash")
+        if hash_value is None:
+            hash_value = self.__dict__["_hash"] = hash(self._get_hash_key())
+        return hash_value
+
+    def _get_hash_key(self) -> tuple:
+        return (self.name, self.value)
 
     @property
     def envname(self) -> JobParamEnvName:
         """Formats the name of the input to be an environment variable.
         For example: reference-path --> REFERENCE_PATH
         Replaces dashes with underscores and converts to upper case.
+
+        The envname is cached on the instance until `name` changes.
         """
-        return self.as_envname(self.name)
+        envname: JobParamEnvName | None = self.__dict__.get("_envname")
+        if envname is None or envname._raw != self.name:
+            envname = self.__dict__["_envname"] = self.as_envname(self.name)
+        return envname
 
     @property
     def envname_reference(self) -> JobParamRef:
@@ -92,7 +127,11 @@ class JobParam:
 
     @classmethod
     def as_envname(cls, name: str) -> JobParamEnvName:
-        return JobParamEnvName(name)
+        """Normalizes a name into an environment variable name
+
+        Results are memoized (bounded by `ENVNAME_CACHE_SIZE`) and shared across callers.
+        """
+        return _get_envname(name)
 
     @classmethod
     def as_envname_reference(cls, name) -> JobParamRef:
@@ -103,6 +142,21 @@ class JobParam:
             return JobParamRef.findall(self.value)
         return []
 
+    def find_reference_envnames(self) -> set[JobParamEnvName]:
+        """Finds the envnames of all references in values without building JobParamRef objects
+
+        Returns:
+            set of (normalized) envnames referenced by this param
+        """
+        return {
+            self.as_envname(raw_envname)
+            for value in self._get_reference_values()
+            for raw_envname in JobParamRef.regex_pattern.findall(value)
+        }
+
+    def _get_reference_values(self) -> list[str]:
+        return [self.value] if isinstance(self.value, str) else []
+
     def replace_references(self, reference_replacement: dict[str, str] | Callable[[Match], str]):
         self.value = JobParamRef.replace_references(
             value=self.value, reference_replacement=reference_replacement
@@ -116,12 +170,18 @@ RP = TypeVar("RP", bound="ResolvableJobParam")
 class ResolvableJobParam(JobParam):
     remote_value: str
 
-    def __hash__(self) -> int:
-        return hash(self.name + self.value + self.remote_value)
+    # dataclass(eq=True) would otherwise reset __hash__ to None
+    __hash__ = JobParam.__hash__
+
+    def _get_hash_key(self) -> tuple:
+        return (self.name, self.value, self.remote_value)
 
     def find_references(self) -> list[JobParamRef]:
         return super().find_references() + JobParamRef.findall(self.remote_value)
 
+    def _get_reference_values(self) -> list[str]:
+        return super()._get_reference_values() + [self.remote_value]
+
     def replace_references(self, reference_replacement: dict[str, str] | Callable[[Match], str]):
         super().replace_references(reference_replacement=reference_replacement)
         self.remote_value = JobParamRef.replace_references(
@@ -135,11 +195,9 @@ class ResolvableJobParam(JobParam):
 
 @dataclass
 class DownloadableJobParam(ResolvableJobParam):
-    def __hash__(self) -> int:
-        return hash(self.name + self.value + self.remote_value)
+    __hash__ = JobParam.__hash__
 
 
 @dataclass
 class UploadableJobParam(ResolvableJobParam):
-    def __hash__(self) -> int:
-        return hash(self.name + self.value + self.remote_value)
+    __hash__ = JobParam.__hash__
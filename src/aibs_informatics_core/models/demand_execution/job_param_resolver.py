@@ -1,9 +1,9 @@
 import collections
-from copy import deepcopy
+from copy import copy
 from re import Match
 
 from aibs_informatics_core.exceptions import ValidationError
-from aibs_informatics_core.models.demand_execution.job_param import JobParam, JobParamRef
+from aibs_informatics_core.models.demand_execution.job_param import JobParam, JobParamEnvName
 from aibs_informatics_core.utils.decorators import cache
 
 
@@ -30,6 +30,10 @@ class JobParamResolver:
     def resolve_references(cls, job_params: list[JobParam]) -> list[JobParam]:
         """Resolves param references found in values of param map
 
+        Params are resolved in topological order of their references (Kahn's algorithm), so
+        each param is substituted exactly once. Params without references are returned as is,
+        params with references are returned as resolved copies.
+
         Valid Cases:
 
             Example 1: Nested references
@@ -54,48 +58,100 @@ class JobParamResolver:
         Args:
             job_params (List[JobParam]): List of job params with unresolved references in values
 
+        Raises:
+            ValidationError: if params collide, reference missing params or form a cycle.
+                Cycles are reported as a path (e.g. "X -> Y -> X").
+
         Returns:
             list of job params with resolved references in values
         """
 
         cls.check_collisions(job_params)
 
-        # job_param.env_name -> job_param (with resolved values)
-        resolved_job_param_map: dict[str, JobParam] = dict()
-
-        # job_param.env_name -> job_param (with unresolved values)
-        unresolved_job_param_map: dict[str, JobParam] = dict()
+        envnames = [_.envname for _ in job_params]
+        job_param_map: dict[JobParamEnvName, JobParam] = dict(zip(envnames, job_params))
+        dependency_map, dependents_map = cls._build_dependency_maps(job_param_map)
 
-        # job_param.env_name -> Set of other job_param.env_name references found in job_param.value
-        job_param_dependency_map: dict[str, set[str]] = dict()
+        # Kahn's algorithm: resolve a param once all params it references are resolved
+        resolved_job_param_map: dict[str, JobParam] = {}
+        unresolved_counts = {k: len(v) for k, v in dependency_map.items()}
+        queue = collections.deque(k for k, v in unresolved_counts.items() if not v)
 
-        for job_param in deepcopy(job_params):
-            job_param_dependency_map[job_param.envname] = {
-                _.envname for _ in job_param.find_references()
+        def replace_reference(match: Match) -> str:
+            return resolved_job_param_map[JobParam.as_envname(match.group(1))].value
+
+        while queue:
+            envname = queue.popleft()
+            job_param = job_param_map[envname]
+            if dependency_map[envname]:
+                # Only params with references are copied (and modified)
+                job_param = copy(job_param)
+                job_param.replace_references(reference_replacement=replace_reference)
+            resolved_job_param_map[envname] = job_param
+            for dependent in dependents_map.get(envname, ()):
+                unresolved_counts[dependent] -= 1
+                if not unresolved_counts[dependent]:
+                    queue.append(dependent)
+
+        if len(resolved_job_param_map) < len(job_param_map):
+            unresolved_dependency_map = {
+                k: v for k, v in dependency_map.items() if k not in resolved_job_param_map
             }
-            if job_param_dependency_map[job_param.envname]:
-                unresolved_job_param_map[job_param.envname] = job_param
-            else:
-                resolved_job_param_map[job_param.envname] = job_param
+            cycle = cls._find_cycle(unresolved_dependency_map)
+            raise ValidationError(
+                f"Job params have cyclical references: {' -> '.join(cycle)}. "
+                f"Unresolved: {[job_param_map[_] for _ in unresolved_dependency_map]}"
+            )
+        return [resolved_job_param_map[_] for _ in envnames]
 
-        def replace_reference(match: Match) -> str:
-            ref = JobParamRef(match.group(0))
-            return resolved_job_param_map[JobParam.as_envname(ref.envname)].value
-
-        iter_resolved_count = len(resolved_job_param_map)
-        while unresolved_job_param_map:
-            for job_param_envname in list(unresolved_job_param_map.keys()):
-                job_param_dependencies = job_param_dependency_map[job_param_envname]
-                if all([_ in resolved_job_param_map for _ in job_param_dependencies]):
-                    job_param = unresolved_job_param_map[job_param_envname]
-                    job_param.replace_references(reference_replacement=replace_reference)
-                    resolved_job_param_map[job_param_envname] = job_param
-                    unresolved_job_param_map.pop(job_param_envname)
-            if iter_resolved_count == len(resolved_job_param_map):
-                raise ValidationError(
-                    "Could not resolve any more references: "
-                    f"Resolved: {resolved_job_param_map}, "
-                    f"Unresolved: {unresolved_job_param_map}, "
-                    f"Reference Dependencies: {job_param_dependency_map}"
-                )
-        return [resolved_job_param_map[_.envname] for _ in job_params]
+    @staticmethod
+    def _build_dependency_maps(
+        job_param_map: dict[JobParamEnvName, JobParam],
+    ) -> tuple[dict[JobParamEnvName, set[JobParamEnvName]], dict[str, list[JobParamEnvName]]]:
+        """Builds the reference graph of job params
+
+        Args:
+            job_param_map (Dict[JobParamEnvName, JobParam]): envname -> job param
+
+        Raises:
+            ValidationError: if a job param references a param that does not exist
+
+        Returns:
+            envname -> referenced envnames, and envname -> envnames referencing it
+        """
+        dependency_map = {k: v.find_reference_envnames() for k, v in job_param_map.items()}
+        dependents_map: dict[str, list[JobParamEnvName]] = collections.defaultdict(list)
+        missing_references: dict[str, set[JobParamEnvName]] = {}
+        for envname, dependencies in dependency_map.items():
+            if missing := dependencies.difference(job_param_map):
+                missing_references[envname] = missing
+            for dependency in dependencies:
+                dependents_map[dependency].append(envname)
+        if missing_references:
+            raise ValidationError(
+                f"Job params reference params that do not exist: {missing_references}"
+            )
+        return dependency_map, dependents_map
+
+    @staticmethod
+    def _find_cycle(dependency_map: dict[JobParamEnvName, set[JobParamEnvName]]) -> list[str]:
+        """Finds a reference cycle among params that could not be resolved
+
+        Every unresolved param references at least one other unresolved param, so following
+        those references from any of them must eventually revisit a param.
+
+        Args:
+            dependency_map (Dict[JobParamEnvName, Set[JobParamEnvName]]): unresolved
+                envname -> referenced envnames
+
+        Returns:
+            the envnames forming the cycle, starting and ending with the same envname
+        """
+        path: list[str] = []
+        path_index: dict[JobParamEnvName, int] = {}
+        envname = next(iter(dependency_map))
+        while envname not in path_index:
+            path_index[envname] = len(path)
+            path.append(envname)
+            envname = min(_ for _ in dependency_map[envname] if _ in dependency_map)
+        return path[path_index[envname] :] + [envname]
@@ -1,3 +1,5 @@
+import hashlib
+from collections.abc import Iterable, Iterator
 from typing import Any, cast
 
 from pydantic import Field
@@ -9,7 +11,7 @@ from aibs_informatics_core.models.demand_execution.platform import ExecutionPlat
 from aibs_informatics_core.models.demand_execution.resource_requirements import (
     DemandResourceRequirements,
 )
-from aibs_informatics_core.utils.hashing import sha256_hexdigest
+from aibs_informatics_core.utils.hashing import update_json_hash
 from aibs_informatics_core.utils.json import JSON
 from aibs_informatics_core.utils.time import get_current_time
 
@@ -28,6 +30,18 @@ class DemandExecution(PydanticBaseModel):
     )
 
     def get_execution_hash(self, strict: bool = True) -> str:
+        """Computes a hash identifying the execution
+
+        The hash is the SHA-256 of the canonical JSON of its components, which is streamed
+        into the hash rather than built as a string.
+
+        Args:
+            strict (bool, optional): Whether to include the execution id, params, inputs
+                and outputs. Defaults to True.
+
+        Returns:
+            SHA-256 hex digest of the execution
+        """
         hash_components: list[Any] = [
             self.execution_type,
             self.execution_image,
@@ -45,7 +59,9 @@ class DemandExecution(PydanticBaseModel):
                     self.execution_parameters.outputs,
                 ]
             )
-        return sha256_hexdigest(cast(JSON, hash_components))
+        hash_obj = hashlib.sha256()
+        update_json_hash(hash_obj, cast(JSON, hash_components))
+        return hash_obj.hexdigest()
 
     def generate_execution_name(self) -> str:
         """Creates a execution name for state machine execution
@@ -56,3 +72,24 @@ class DemandExecution(PydanticBaseModel):
 
         """
         return f"{self.execution_id}-{get_current_time().strftime('%Y%m%dT%H%M%S')}"
+
+
+def dedupe_executions(
+    executions: Iterable[DemandExecution], strict: bool = True
+) -> Iterator[DemandExecution]:
+    """Drops executions whose execution hash matches one seen before
+
+    Args:
+        executions (Iterable[DemandExecution]): executions to dedupe (consumed lazily)
+        strict (bool, optional): Whether to compare strict execution hashes (see
+            `DemandExecution.get_execution_hash`). Defaults to True.
+
+    Yields:
+        the first execution of each distinct execution hash, in order
+    """
+    seen_hashes: set[str] = set()
+    for execution in executions:
+        execution_hash = execution.get_execution_hash(strict=strict)
+        if execution_hash not in seen_hashes:
+            seen_hashes.add(execution_hash)
+            yield execution
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Annotated, Any, TypeAlias
+from typing import Annotated, Any, Generic, Protocol, TypeAlias, TypeVar
 
 from pydantic import BeforeValidator, Field
 
@@ -46,6 +46,20 @@ class ParamPair(PydanticBaseModel):
         return [ParamPair(input=input, output=output) for input in inputs for output in outputs]
 
 
+N = TypeVar("N", bound=Hashable)
+N_co = TypeVar("N_co", bound=Hashable, covariant=True)
+
+
+def _group_inputs_by_output(pairs: Iterable[Any]) -> dict[Any, dict[Any, None]]:
+    """Groups the inputs of pairs by output (preserving first-seen order)"""
+    inputs_by_output: dict[Any, dict[Any, None]] = {}
+    for pair in pairs:
+        inputs = inputs_by_output.setdefault(pair.output, {})
+        if pair.input is not None:
+            inputs[pair.input] = None
+    return inputs_by_output
+
+
 def _coerce_to_frozenset(v: Any) -> frozenset[str]:
     if isinstance(v, frozenset):
         return v
@@ -98,6 +112,22 @@ class ParamSetPair(PydanticBaseModel):
     def to_pairs(self) -> list[ParamPair]:
         return ParamPair.from_sets(inputs=self.inputs, outputs=self.outputs)
 
+    @classmethod
+    def from_sets(cls, inputs: Iterable[str], outputs: Iterable[str]) -> list[ParamSetPair]:
+        """Groups all pairs of inputs and outputs by output
+
+        Equivalent to `ParamSetPair.from_pairs(*ParamPair.from_sets(inputs, outputs))`,
+        without materializing the cross product of inputs and outputs.
+
+        Returns:
+            A list of ParamSetPairs
+        """
+        input_set = frozenset(inputs)
+        output_list = list(dict.fromkeys(outputs))
+        if not output_list:
+            return [ParamSetPair(inputs=input_set)] if input_set else []
+        return [ParamSetPair(inputs=input_set, outputs=frozenset({_})) for _ in output_list]
+
     @classmethod
     def from_pairs(cls, *pairs: ParamPair) -> list[ParamSetPair]:
         """Converts a list of ParamPairs to a list of ParamSetPairs
@@ -108,15 +138,13 @@ class ParamSetPair(PydanticBaseModel):
             A list of ParamSetPairs
         """
         # group pairs only by outputs
-        output_set_pairs: dict[str | None, ParamSetPair] = {}
-        for pair in pairs:
-            if pair.output not in output_set_pairs:
-                output_set_pairs[pair.output] = ParamSetPair(
-                    outputs=frozenset({pair.output}) if pair.output else frozenset()
-                )
-            if pair.input is not None:
-                output_set_pairs[pair.output].add_inputs(pair.input)
-        return list(output_set_pairs.values())
+        return [
+            ParamSetPair(
+                inputs=frozenset(inputs),
+                outputs=frozenset({output}) if output else frozenset(),
+            )
+            for output, inputs in _group_inputs_by_output(pairs).items()
+        ]
 
 
 @dataclass(frozen=True)
@@ -213,15 +241,101 @@ class JobParamSetPair(PydanticBaseModel):
             A list of JobParamSetPairs
         """
         # group pairs only by outputs
-        output_set_pairs: dict[ResolvableJobParam | None, JobParamSetPair] = {}
-        for pair in pairs:
-            if pair.output not in output_set_pairs:
-                output_set_pairs[pair.output] = JobParamSetPair(
-                    outputs=frozenset({pair.output}) if pair.output else frozenset()
-                )
-            if pair.input is not None:
-                output_set_pairs[pair.output].add_inputs(pair.input)
-        return list(output_set_pairs.values())
+        return [
+            JobParamSetPair(
+                inputs=frozenset(inputs),
+                outputs=frozenset({output}) if output else frozenset(),
+            )
+            for output, inputs in _group_inputs_by_output(pairs).items()
+        ]
+
+
+class _SetPair(Protocol[N_co]):
+    @property
+    def inputs(self) -> frozenset[N_co]: ...
+
+    @property
+    def outputs(self) -> frozenset[N_co]: ...
+
+
+class ParamPairGraph(Generic[N]):
+    """Lazy, bipartite representation of input/output pairs
+
+    Pairs are stored as a union of blocks, where each block (inputs, outputs) stands for
+    every pair in inputs x outputs, just like a ParamSetPair (an empty side pairs the other
+    side with None). Pairs are only generated while iterating, so 500 inputs and 500 outputs
+    take 1000 entries instead of 250k pair objects.
+
+    Supports iteration, `len`, membership of `(input, output)` tuples (or pair objects) and
+    adjacency queries (`get_outputs` / `get_inputs`).
+    """
+
+    def __init__(self, blocks: Iterable[tuple[Iterable[N], Iterable[N]]] = ()):
+        self._blocks: list[tuple[frozenset[N], frozenset[N]]] = [
+            (frozenset(inputs), frozenset(outputs)) for inputs, outputs in blocks
+        ]
+        self._input_index: dict[N | None, list[int]] | None = None
+        self._output_index: dict[N | None, list[int]] | None = None
+
+    @classmethod
+    def from_set_pairs(cls, *set_pairs: _SetPair[N]) -> ParamPairGraph[N]:
+        return cls((_.inputs, _.outputs) for _ in set_pairs)
+
+    @property
+    def inputs(self) -> frozenset[N]:
+        return frozenset().union(*(inputs for inputs, _ in self._blocks))
+
+    @property
+    def outputs(self) -> frozenset[N]:
+        return frozenset().union(*(outputs for _, outputs in self._blocks))
+
+    def get_outputs(self, input: N) -> frozenset[N]:
+        """Returns all outputs paired with (i.e. depending on) the input"""
+        blocks = self._get_index(0).get(input, [])
+        return frozenset().union(*(self._blocks[_][1] for _ in blocks))
+
+    def get_inputs(self, output: N) -> frozenset[N]:
+        """Returns all inputs paired with the output"""
+        blocks = self._get_index(1).get(output, [])
+        return frozenset().union(*(self._blocks[_][0] for _ in blocks))
+
+    def __iter__(self) -> Iterator[tuple[N | None, N | None]]:
+        for inputs, outputs in self._blocks:
+            if not inputs:
+                yield from ((None, output) for output in outputs)
+            elif not outputs:
+                yield from ((input, None) for input in inputs)
+            else:
+                yield from ((input, output) for input in inputs for output in outputs)
+
+    def __len__(self) -> int:
+        return sum(len(i) * len(o) or len(i) + len(o) for i, o in self._blocks)
+
+    def __contains__(self, pair: object) -> bool:
+        if isinstance(pair, (ParamPair, JobParamPair)):
+            pair = (pair.input, pair.output)
+        if not isinstance(pair, tuple) or len(pair) != 2:
+            return False
+        input, output = pair
+        for block in self._get_index(0).get(input, []):
+            outputs = self._blocks[block][1]
+            if (output in outputs) if output is not None else not outputs:
+                return True
+        return False
+
+    def _get_index(self, side: int) -> dict[N | None, list[int]]:
+        """Lazily indexes blocks by input (side=0) or output (side=1), empty sides by None"""
+        index = self._input_index if side == 0 else self._output_index
+        if index is None:
+            index = {}
+            for i, block in enumerate(self._blocks):
+                for node in block[side] or (None,):
+                    index.setdefault(node, []).append(i)
+            if side == 0:
+                self._input_index = index
+            else:
+                self._output_index = index
+        return index
 
 
 # ResolvableID = Union[S3Path, ...]
@@ -1,8 +1,12 @@
 import logging
 import os
-from collections.abc import Callable, Sequence
-from functools import wraps
-from typing import Any
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Any, Self, TypeVar
 
 from pydantic import BaseModel, Field, JsonValue, PrivateAttr, field_serializer, model_validator
 
@@ -22,6 +26,7 @@ from aibs_informatics_core.models.demand_execution.param_pair import (
     JobParamPair,
     JobParamSetPair,
     ParamPair,
+    ParamPairGraph,
     ParamSetPair,
 )
 from aibs_informatics_core.models.demand_execution.resolvables import (
@@ -30,21 +35,67 @@ from aibs_informatics_core.models.demand_execution.resolvables import (
     Uploadable,
     get_resolvable_from_value,
 )
-from aibs_informatics_core.utils.hashing import sha256_hexdigest
 from aibs_informatics_core.utils.json import JSON
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Fields whose reassignment invalidates the job params (or their validation)
+_JOB_PARAM_FIELDS = frozenset(
+    {"params", "inputs", "outputs", "output_s3_prefix", "param_pair_overrides"}
+)
+# Fields held in containers that report in place changes
+_TRACKED_FIELDS = ("params", "inputs", "outputs", "param_pair_overrides")
+# Param values that cannot be changed in place (so need no snapshot)
+_IMMUTABLE_PARAM_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=1024)
+def _compile_command_part(
+    command_part: str,
+) -> tuple[tuple[str, ...], tuple[JobParamEnvName, ...]]:
+    """Splits a command part into literal segments and the envnames referenced between them
+
+    Example:
+        "--x=${param_a}/${B}" -> (("--x=", "/", ""), ("PARAM_A", "B"))
+
+    Args:
+        command_part (str): command part with references
+
+    Returns:
+        literals (one more than envnames) and referenced envnames
+    """
+    literals: list[str] = []
+    envnames: list[JobParamEnvName] = []
+    position = 0
+    for match in JobParamRef.regex_pattern.finditer(command_part):
+        literals.append(command_part[position : match.start()])
+        envnames.append(JobParam.as_envname(match.group(1)))
+        position = match.end()
+    literals.append(command_part[position:])
+    return tuple(literals), tuple(envnames)
+
 
 def refresh_params(func: Callable | None = None, force: bool = True, pre_validate: bool = False):
-    """Decorator that triggers a refresh of DemandExecutionParameters after method execution."""
+    """Decorator that triggers a refresh of DemandExecutionParameters after method execution.
+
+    Inside of a `DemandExecutionParameters.batch_update` block (or a nested decorated
+    call), the refresh is deferred to the end of the outermost block.
+    """
 
     def decorator(fn: Callable) -> Callable:
         @wraps(fn)
         def wrapper(self: "DemandExecutionParameters", *args, **kwargs):
+            if self._batch_depth:
+                return fn(self, *args, **kwargs)
             if pre_validate:
                 self._refresh(force=False)
-            value = fn(self, *args, **kwargs)
+            self._batch_depth += 1
+            try:
+                value = fn(self, *args, **kwargs)
+            finally:
+                self._batch_depth -= 1
             self._refresh(force=force)
             return value
 
@@ -55,6 +106,125 @@ def refresh_params(func: Callable | None = None, force: bool = True, pre_validat
     return decorator
 
 
+class _TrackedContainer:
+    """Mixin for containers that report changes to the parameters holding them
+
+    A container can be shared by shallow copies of parameters, so it keeps (weak) references
+    to all of them, along with the field they hold it in.
+    """
+
+    __slots__ = ()
+    _owners: list[tuple[weakref.ref, str]]
+
+    def _add_owner(self, owner: "DemandExecutionParameters", field: str):
+        if not any(ref() is owner and _ == field for ref, _ in self._owners):
+            self._owners.append((weakref.ref(owner), field))
+
+    def _notify(self, names: Iterable[str] | None = None):
+        """Reports names of added (or set) items, or None for any other change"""
+        owners = []
+        for ref, field in self._owners:
+            owner = ref()
+            # Skip owners that no longer hold this container
+            if owner is not None and owner.__dict__.get(field) is self:
+                owners.append((ref, field))
+                owner._on_field_changed(field, names)
+        self._owners[:] = owners
+
+
+class _TrackedDict(_TrackedContainer, dict):
+    __slots__ = ("_owners",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owners = []
+
+    def __reduce__(self):
+        # Copies and pickles are plain dicts, their owners track them again
+        return (dict, (dict(self),))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._notify((key,))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._notify()
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        super().update(items)
+        self._notify(items)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._notify()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._notify()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._notify()
+
+
+def _notify_after(method_name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        value = getattr(list, method_name)(self, *args, **kwargs)
+        self._notify()
+        return value
+
+    method.__name__ = method_name
+    return method
+
+
+class _TrackedList(_TrackedContainer, list):
+    __slots__ = ("_owners",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._owners = []
+
+    def __reduce__(self):
+        # Copies and pickles are plain lists, their owners track them again
+        return (list, (list(self),))
+
+    def __iadd__(self, other):  # type: ignore[misc]
+        self.extend(other)
+        return self
+
+    def append(self, value):
+        super().append(value)
+        self._notify((value,))
+
+    def extend(self, values):
+        values = list(values)
+        super().extend(values)
+        self._notify(values)
+
+    __setitem__ = _notify_after("__setitem__")
+    __delitem__ = _notify_after("__delitem__")
+    __imul__ = _notify_after("__imul__")
+    insert = _notify_after("insert")
+    remove = _notify_after("remove")
+    pop = _notify_after("pop")
+    clear = _notify_after("clear")
+    sort = _notify_after("sort")
+    reverse = _notify_after("reverse")
+
+
 class DemandExecutionParameters(PydanticBaseModel):
     command: list[str] = Field(default_factory=list)
     params: dict[str, JsonValue | BaseModel] = Field(default_factory=dict)
@@ -65,14 +235,76 @@ class DemandExecutionParameters(PydanticBaseModel):
     param_pair_overrides: list[ParamSetPair | ParamPair] | None = None
     verbosity: bool = False
 
-    _refresh_hash: str = PrivateAttr(default="")
-    _job_params: list = PrivateAttr(default_factory=list)
+    # Dirty tracking: params, inputs and outputs are held in containers that record the names
+    # set or appended (e.g. `params.params["A"] = "2"`), any other change (and field
+    # assignments) request a full rebuild. Edits nested in param values or overrides are
+    # found by comparing against a snapshot of them as of the last refresh.
+    _refresh_all: bool = PrivateAttr(default=False)
+    _dirty_param_names: dict = PrivateAttr(default_factory=dict)
+    _mutable_params_snapshot: dict = PrivateAttr(default_factory=dict)
+    _overrides_snapshot: Any = PrivateAttr(default=None)
+    # Names (and envnames) of inputs/outputs, kept up to date as they change
+    _input_names: set = PrivateAttr(default_factory=set)
+    _input_envnames: set = PrivateAttr(default_factory=set)
+    _output_names: set = PrivateAttr(default_factory=set)
+    _output_envnames: set = PrivateAttr(default_factory=set)
+    # envname -> job param (resolved / as built from params) and envname -> referencing envnames
     _job_param_map: dict = PrivateAttr(default_factory=dict)
+    _unresolved_job_param_map: dict = PrivateAttr(default_factory=dict)
+    _job_param_dependents: dict = PrivateAttr(default_factory=dict)
+    # Number of open `batch_update` blocks (refreshes are deferred while non-zero)
+    _batch_depth: int = PrivateAttr(default=0)
+    # Incremented whenever job params change, used to invalidate derived caches
+    _job_params_version: int = PrivateAttr(default=0)
+    # Values derived from job params and inputs/outputs, valid for `_derived_cache_version`
+    _derived_cache: dict = PrivateAttr(default_factory=dict)
+    _derived_cache_version: int = PrivateAttr(default=-1)
 
     def model_post_init(self, __context: Any) -> None:
-        self._refresh_hash = self._compute_refresh_hash()
+        self._track_fields()
         self._refresh(True)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _JOB_PARAM_FIELDS:
+            if name in _TRACKED_FIELDS:
+                self._track_fields(name)
+            self._refresh_all = True
+
+    def __eq__(self, other: object) -> bool:
+        # Private attributes only hold refresh state and caches, which depend on the history
+        # of an instance rather than its content
+        if not isinstance(other, DemandExecutionParameters):
+            return NotImplemented
+        return type(self) is type(other) and all(
+            getattr(self, _) == getattr(other, _) for _ in type(self).model_fields
+        )
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        # Shallow copies share fields and private containers, which are updated in place
+        copied._track_fields()
+        copied._mark_stale()
+        copied._batch_depth = 0
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        copied._track_fields()
+        return copied
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._track_fields()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._batch_depth = 0
+        if update:
+            copied._track_fields()
+            copied._mark_stale()
+        return copied
+
     def validate_parameters(
         self, check_input_output_params: bool = True, check_param_pairs: bool = True
     ):
@@ -86,7 +318,7 @@ class DemandExecutionParameters(PydanticBaseModel):
         """
         # Validate params
         if check_input_output_params:
-            self._validate_params()
+            self._validate_params(self._input_envnames | self._output_envnames)
 
         # Validate input_output_map
         if check_param_pairs:
@@ -94,11 +326,12 @@ class DemandExecutionParameters(PydanticBaseModel):
 
         # TODO: we need to check command
 
-    def _validate_params(self):
+    def _validate_params(self, envnames: set[str]):
+        """Validates the given input/output envnames against all inputs/outputs and params"""
         # Validate that input/output job env name parameters do not collide
-        inp_envnames = [JobParam.as_envname(_) for _ in self.inputs]
-        out_envnames = [JobParam.as_envname(_) for _ in self.outputs]
-        envname_intersection = set(inp_envnames).intersection(out_envnames)
+        envname_intersection = {
+            _ for _ in envnames if _ in self._input_envnames and _ in self._output_envnames
+        }
         if envname_intersection:
             raise ValidationError(
                 f"Job inputs and outputs have overlapping env variable names: "
@@ -106,19 +339,34 @@ class DemandExecutionParameters(PydanticBaseModel):
             )
 
         # Validate that inputs/outputs are found in params
-        param_map = self.job_param_map
-        missing_param_envnames = set(inp_envnames).union(out_envnames).difference(param_map.keys())
+        missing_param_envnames = envnames.difference(self._job_param_map)
         if len(missing_param_envnames) > 0:
             raise ValidationError(
                 f"Batch Job inputs/outputs not found in param envnames: {missing_param_envnames}"
             )
 
+    def _validate_changed_params(self, names: Iterable[str]):
+        """Validates parameters after the named params (or inputs/outputs) were set or added
+
+        Other inputs/outputs were validated before and nothing was removed, so only the
+        changed inputs/outputs are validated. Param pairs need no validation: overrides are
+        unchanged (changing them triggers a full refresh) and pairs of inputs/outputs only
+        refer to inputs/outputs.
+        """
+        self._validate_params(
+            {
+                JobParam.as_envname(_)
+                for _ in names
+                if _ in self._input_names or _ in self._output_names
+            }
+        )
+
     def _validate_param_pairs(self):
         # Validate that all param pairs are inputs/outputs
         all_input_output_set = set().union(
-            *[_.inputs.union(_.outputs) for _ in self.param_set_pairs]
+            *[_.inputs.union(_.outputs) for _ in self._get_param_set_pairs()]
         )
-        diff = all_input_output_set.difference(set(self.inputs).union(set(self.outputs)))
+        diff = all_input_output_set.difference(self._input_names | self._output_names)
         if len(diff) > 0:
             raise ValidationError(
                 f"input_output_mapping contained value(s) not found in params: {diff}"
@@ -127,7 +375,7 @@ class DemandExecutionParameters(PydanticBaseModel):
         # Validate no duplicate output sets
         seen = set()
         duplicate_output_sets = []
-        for s in self.param_set_pairs:
+        for s in self._get_param_set_pairs():
             if s.outputs in seen:
                 duplicate_output_sets.append(s.outputs)
             if s.outputs:
@@ -144,7 +392,7 @@ class DemandExecutionParameters(PydanticBaseModel):
         Inputs provided without values are assumed to be in params already
         """
         for i in [*param_keys, *param_key_values.keys()]:
-            if i not in self.inputs:
+            if i not in self._input_names:
                 self.inputs.append(i)
         self.update_params(**param_key_values)
 
@@ -155,7 +403,7 @@ class DemandExecutionParameters(PydanticBaseModel):
         Outputs provided without values are assumed to be in params already
         """
         for i in [*param_keys, *param_key_values.keys()]:
-            if i not in self.outputs:
+            if i not in self._output_names:
                 self.outputs.append(i)
         self.update_params(**param_key_values)
 
@@ -165,6 +413,33 @@ class DemandExecutionParameters(PydanticBaseModel):
         params.update(param_key_values)
         self.params.update(params)
 
+    @contextmanager
+    def batch_update(self) -> Iterator[Self]:
+        """Defers refresh and validation of parameters until the block exits
+
+        Mutations made inside of the block (add_inputs, add_outputs, update_params or field
+        assignments) are refreshed and validated in a single pass on exit. Blocks can be
+        nested, in which case the outermost block refreshes. If the block raises, nothing is
+        refreshed and the pending changes are applied on the next access instead.
+
+        Job params read inside of the block reflect the state prior to the block.
+
+        Example:
+            with params.batch_update():
+                for name, value in inputs.items():
+                    params.add_inputs(**{name: value})
+
+        Yields:
+            these parameters
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self._refresh()
+
     def get_param(self, envname: str) -> Any | None:
         """Checks if param contains environment name or placeholder
 
@@ -189,9 +464,7 @@ class DemandExecutionParameters(PydanticBaseModel):
         return False
 
     def get_job_param(self, envname: str) -> JobParam | None:
-        if JobParamRef.is_valid(envname):
-            envname = JobParamRef(envname).envname
-        return self.job_param_map.get(JobParam.as_envname(envname))
+        return self.job_param_map.get(self._sanitize_envname(envname))
 
     def get_input_job_param(self, envname: str) -> DownloadableJobParam | None:
         job_param = self.get_job_param(envname)
@@ -207,10 +480,30 @@ class DemandExecutionParameters(PydanticBaseModel):
 
     @property
     def param_pairs(self) -> list[ParamPair]:
-        return [p for ps in self.param_set_pairs for p in ps.to_pairs()]
+        return [ParamPair(input=i, output=o) for i, o in self.param_pair_graph]
+
+    @property
+    def param_pair_graph(self) -> ParamPairGraph[str]:
+        """Input/output pairs of param set pairs, without materializing pairs
+
+        Useful to query e.g. the outputs depending on an input.
+        """
+        return self._get_derived(
+            "param_pair_graph", lambda: ParamPairGraph.from_set_pairs(*self._get_param_set_pairs())
+        )
 
     @property
     def param_set_pairs(self) -> list[ParamSetPair]:
+        """Param set pairs of overrides (or all inputs x outputs), cached until next refresh
+
+        Returns copies, so changing them does not affect the cached pairs.
+        """
+        return [_.model_copy() for _ in self._get_param_set_pairs()]
+
+    def _get_param_set_pairs(self) -> list[ParamSetPair]:
+        return self._get_derived("param_set_pairs", self._build_param_set_pairs)
+
+    def _build_param_set_pairs(self) -> list[ParamSetPair]:
         param_set_pairs: list[ParamSetPair] = []
         param_pairs: list[ParamPair] = []
         if self.param_pair_overrides:
@@ -234,47 +527,93 @@ class DemandExecutionParameters(PydanticBaseModel):
                     ParamSetPair(inputs=frozenset(self.inputs), outputs=frozenset(unseen_outputs))
                 )
         else:
-            param_pairs.extend(ParamPair.from_sets(inputs=self.inputs, outputs=self.outputs))
+            param_set_pairs.extend(
+                ParamSetPair.from_sets(inputs=self.inputs, outputs=self.outputs)
+            )
         param_set_pairs.extend(ParamSetPair.from_pairs(*param_pairs))
         return param_set_pairs
 
     @property
     def job_param_pairs(self) -> list[JobParamPair]:
-        set_pairs: list[JobParamPair] = []
-        for pair in self.param_pairs:
-            inp_job_param = self.get_input_job_param(pair.input) if pair.input else None
-            out_job_param = self.get_output_job_param(pair.output) if pair.output else None
-            set_pairs.append(JobParamPair(inp_job_param, out_job_param))
-        return set_pairs
+        param_pair_graph = self.param_pair_graph
+        job_param_map = self.job_param_map
+        # Look up each input/output once rather than once per pair
+        inp_job_params = {
+            _: job_param
+            for _ in param_pair_graph.inputs
+            if isinstance(
+                job_param := job_param_map.get(JobParam.as_envname(_)), DownloadableJobParam
+            )
+        }
+        out_job_params = {
+            _: job_param
+            for _ in param_pair_graph.outputs
+            if isinstance(
+                job_param := job_param_map.get(JobParam.as_envname(_)), UploadableJobParam
+            )
+        }
+        return [
+            JobParamPair(
+                inp_job_params.get(inp) if inp else None, out_job_params.get(out) if out else None
+            )
+            for inp, out in param_pair_graph
+        ]
 
     @property
     def job_param_set_pairs(self) -> list[JobParamSetPair]:
+        """Job param set pairs of `param_set_pairs`, cached until next refresh
+
+        Returns copies, so changing them does not affect the cached pairs.
+        """
+        return [
+            _.model_copy()
+            for _ in self._get_derived("job_param_set_pairs", self._build_job_param_set_pairs)
+        ]
+
+    def _build_job_param_set_pairs(self) -> list[JobParamSetPair]:
         r_job_param_map = {
-            k: v for k, v in self.job_param_map.items() if isinstance(v, ResolvableJobParam)
+            k: v for k, v in self._job_param_map.items() if isinstance(v, ResolvableJobParam)
         }
         return [
             JobParamSetPair(
                 inputs=frozenset({r_job_param_map[JobParam.as_envname(_)] for _ in pair.inputs}),
                 outputs=frozenset({r_job_param_map[JobParam.as_envname(_)] for _ in pair.outputs}),
             )
-            for pair in self.param_set_pairs
+            for pair in self._get_param_set_pairs()
         ]
 
     @property
     def resolved_command(self) -> list[str]:
-        environment: dict[str, str] = dict(os.environ)
-        environment.update({k: v.value for k, v in self.job_param_map.items()})
-        return [
-            JobParamRef.replace_references(command_part, environment)
-            for command_part in self.command
-        ]
+        """The command with references filled by job param values (or environment variables)
+
+        Command parts are compiled once into literal segments and references, so rendering
+        only joins the referenced values.
+        """
+        job_param_map = self.job_param_map
+        resolved_command: list[str] = []
+        for literals, envnames in map(_compile_command_part, self.command):
+            parts = [literals[0]]
+            for envname, literal in zip(envnames, literals[1:]):
+                if envname in job_param_map:
+                    parts.append(job_param_map[envname].value)
+                elif envname in os.environ:
+                    parts.append(os.environ[envname])
+                else:
+                    raise ValueError(
+                        f"Could not fill {JobParamRef.from_name(envname)}, "
+                        "no value in reference value map."
+                    )
+                parts.append(literal)
+            resolved_command.append("".join(parts))
+        return resolved_command
 
     @property
     def job_params(self) -> list[JobParam]:
-        return self._job_params
+        return list(self.job_param_map.values())
 
     @property
     def job_param_map(self) -> dict[JobParamEnvName, JobParam]:
+        self._refresh(force=False)
         return self._job_param_map
 
     @property
@@ -310,16 +649,21 @@ class DemandExecutionParameters(PydanticBaseModel):
             envname = JobParamRef(envname).envname
         return JobParam.as_envname(envname)
 
-    def _param_to_job_params(self) -> list[JobParam]:
+    def _param_to_job_params(self, names: Iterable[str] | None = None) -> list[JobParam]:
         """Convert param dictionary into List of JobParam objects
 
+        Args:
+            names (Iterable[str], optional): Only convert the params with these names.
+                Defaults to all params.
+
         Returns:
             A list of JobParam objects representing the parameters.
         """
         job_params: list[JobParam] = []
-        input_envnames = {JobParam.as_envname(i) for i in self.inputs}
-        output_envnames = {JobParam.as_envname(o) for o in self.outputs}
-        for k, v in self.params.items():
+        input_envnames = self._input_envnames
+        output_envnames = self._output_envnames
+        items = self.params.items() if names is None else ((k, self.params[k]) for k in names)
+        for k, v in items:
             job_param_envname = JobParam.as_envname(k)
             if job_param_envname in input_envnames:
                 job_params.append(self._param_to_job_params__build_input(k, v))
@@ -356,29 +700,227 @@ class DemandExecutionParameters(PydanticBaseModel):
             return UploadableJobParam(k, uploadable.local, uploadable.remote)
 
     def _set_job_params(self, job_params: list[JobParam]):
-        self._job_params = JobParamResolver.resolve_references(job_params)
-        self._job_param_map = {_.envname: _ for _ in self._job_params}
-        self.validate_parameters()
+        resolved_job_params = JobParamResolver.resolve_references(job_params)
+        self._job_param_map = {_.envname: _ for _ in resolved_job_params}
+        self._job_params_version += 1
+        self._unresolved_job_param_map = {_.envname: _ for _ in job_params}
+        dependents: dict[str, set[str]] = {}
+        for job_param in job_params:
+            for ref_envname in job_param.find_reference_envnames():
+                dependents.setdefault(ref_envname, set()).add(job_param.envname)
+        self._job_param_dependents = dependents
+
+    def _get_changed_param_names(self, names: Iterable[str]) -> list[str] | None:
+        """Maps changed names to the param keys whose job params must be rebuilt
+
+        Args:
+            names (Iterable[str]): names of params (or inputs/outputs) that changed
+
+        Returns:
+            param keys in `params` order, or None if the change cannot be applied
+            incrementally (e.g. a new param colliding with the envname of an existing one).
+        """
+        unresolved_map: dict[str, JobParam] = self._unresolved_job_param_map
+        param_names: list[str] = []
+        new_names: set[str] = set()
+        new_envnames: set[str] = set()
+        for name in names:
+            envname = JobParam.as_envname(name)
+            existing = unresolved_map.get(envname)
+            if existing is None:
+                if name in self.params:
+                    new_names.add(name)
+                    new_envnames.add(envname)
+            elif existing.name != name and name in self.params:
+                return None
+            else:
+                param_names.append(existing.name)
+        if new_names:
+            # New params are appended to `params`, so they must be its trailing keys
+            trailing_names = list(islice(reversed(self.params), len(new_names)))[::-1]
+            if len(new_envnames) != len(new_names) or set(trailing_names) != new_names:
+                return None
+            param_names.extend(trailing_names)
+        return param_names
+
+    def _update_job_params(self, param_names: list[str]):
+        """Rebuilds the job params of the given params and re-resolves their dependents
+
+        Args:
+            param_names (list[str]): keys of changed params (see `_get_changed_param_names`)
+        """
+        unresolved_map: dict[str, JobParam] = self._unresolved_job_param_map
+        dependents: dict[str, set[str]] = self._job_param_dependents
+        rebuilt_job_params = self._param_to_job_params(param_names)
+        for job_param in rebuilt_job_params:
+            envname = job_param.envname
+            if (old_job_param := unresolved_map.get(envname)) is not None:
+                for ref_envname in old_job_param.find_reference_envnames():
+                    dependents[ref_envname].discard(envname)
+            for ref_envname in job_param.find_reference_envnames():
+                dependents.setdefault(ref_envname, set()).add(envname)
+            unresolved_map[envname] = job_param
+
+        # Collect everything (transitively) referencing a rebuilt job param
+        affected = dict.fromkeys(_.envname for _ in rebuilt_job_params)
+        stack = list(affected)
+        while stack:
+            for dependent in dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected[dependent] = None
+                    stack.append(dependent)
+
+        job_param_map: dict[str, JobParam] = self._job_param_map
+        unresolved_job_params = [unresolved_map[_] for _ in affected]
+        referenced_envnames = (
+            set()
+            .union(*(_.find_reference_envnames() for _ in unresolved_job_params))
+            .difference(affected)
+        )
+        resolved_job_params = JobParamResolver.resolve_references(
+            unresolved_job_params
+            + [job_param_map[_] for _ in referenced_envnames if _ in job_param_map]
+        )
+        for job_param in resolved_job_params[: len(unresolved_job_params)]:
+            job_param_map[job_param.envname] = job_param
+        self._job_params_version += 1
 
     # ------------------------------------------------
     #                   Refresh methods
     # ------------------------------------------------
 
-    def _refresh(self, force: bool = False):
-        if force or self._should_refresh():
-            self._set_job_params(self._param_to_job_params())
-            self.validate_parameters()
-
-    def _should_refresh(self) -> bool:
-        old_refresh_hash = self._refresh_hash
-        new_refresh_hash = self._compute_refresh_hash()
-        if old_refresh_hash != new_refresh_hash:
-            self._refresh_hash = new_refresh_hash
-            return True
-        return False
+    def _get_derived(self, key: str, factory: Callable[[], T]) -> T:
+        """Returns a value derived from job params, cached until job params are refreshed
+
+        Values are not cached while changes are pending a refresh (inside of `batch_update`).
 
-    def _compute_refresh_hash(self) -> str:
-        return sha256_hexdigest(self.to_dict())
+        Args:
+            key (str): cache key of the derived value
+            factory (Callable[[], T]): computes the derived value
+
+        Returns:
+            the (cached) derived value
+        """
+        self._refresh(force=False)
+        if self._batch_depth and (self._refresh_all or self._dirty_param_names):
+            return factory()
+        if self._derived_cache_version != self._job_params_version:
+            self._derived_cache = {}
+            self._derived_cache_version = self._job_params_version
+        if key not in self._derived_cache:
+            self._derived_cache[key] = factory()
+        return self._derived_cache[key]
+
+    def _track_fields(self, *fields: str):
+        """Holds fields in containers that report in place changes to these parameters
+
+        Args:
+            *fields (str): names of fields to track. Defaults to all tracked fields.
+        """
+        for field in fields or _TRACKED_FIELDS:
+            value = self.__dict__.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, _TrackedContainer):
+                value = _TrackedDict(value) if isinstance(value, dict) else _TrackedList(value)
+                self.__dict__[field] = value
+            value._add_owner(self, field)
+            if field in ("inputs", "outputs"):
+                self._index_names(field)
+
+    def _index_names(self, field: str, names: Iterable[str] | None = None):
+        """Adds names (or, if None, indexes all names) of inputs/outputs
+
+        Sets are replaced rather than cleared, as shallow copies share them.
+        """
+        prefix = "_input" if field == "inputs" else "_output"
+        if names is None:
+            setattr(self, f"{prefix}_names", set())
+            setattr(self, f"{prefix}_envnames", set())
+            names = getattr(self, field)
+        names = list(names)
+        getattr(self, f"{prefix}_names").update(names)
+        getattr(self, f"{prefix}_envnames").update(JobParam.as_envname(_) for _ in names)
+
+    def _on_field_changed(self, field: str, names: Iterable[str] | None):
+        """Called by tracked fields with names of set/appended items, or None for other changes"""
+        if field == "param_pair_overrides" or names is None:
+            if field in ("inputs", "outputs"):
+                self._index_names(field)
+            self._mark_stale()
+            return
+        if field != "params":
+            self._index_names(field, names)
+        self._mark_dirty(*names)
+
+    def _mark_dirty(self, *names: str):
+        """Marks params (or inputs/outputs) as changed so the next refresh rebuilds them"""
+        self._dirty_param_names.update(dict.fromkeys(names))
+
+    def _mark_stale(self):
+        """Requests a full rebuild of job params on the next refresh"""
+        self._dirty_param_names = {}
+        self._refresh_all = True
+
+    def _take_snapshot(self):
+        """Snapshots param values and overrides that can be edited in place"""
+        self._mutable_params_snapshot = {
+            k: deepcopy(v)
+            for k, v in self.params.items()
+            if not isinstance(v, _IMMUTABLE_PARAM_TYPES)
+        }
+        self._overrides_snapshot = deepcopy(self.param_pair_overrides)
+
+    def _update_snapshot(self, names: Iterable[str]):
+        """Updates the snapshot of the named params in place"""
+        snapshot = self._mutable_params_snapshot
+        for name in names:
+            value = self.params.get(name)
+            if isinstance(value, _IMMUTABLE_PARAM_TYPES):
+                snapshot.pop(name, None)
+            else:
+                snapshot[name] = deepcopy(value)
+
+    def _has_unmarked_changes(self) -> bool:
+        """Whether param values or overrides were edited in place since the last snapshot"""
+        params = self.params
+        return self.param_pair_overrides != self._overrides_snapshot or any(
+            params.get(k) != v for k, v in self._mutable_params_snapshot.items()
+        )
+
+    def _refresh(self, force: bool = False):
+        if self._batch_depth and not force:
+            return
+        refresh_all = force or self._refresh_all
+        dirty_param_names = self._dirty_param_names
+        if not refresh_all:
+            if dirty_param_names:
+                self._update_snapshot(dirty_param_names)
+            if self._has_unmarked_changes():
+                refresh_all = True
+            elif not dirty_param_names:
+                return
+        self._refresh_all = False
+        self._dirty_param_names = {}
+        # Reads while validating must not refresh again
+        self._batch_depth += 1
+        try:
+            param_names = None if refresh_all else self._get_changed_param_names(dirty_param_names)
+            if param_names is None:
+                self._index_names("inputs")
+                self._index_names("outputs")
+                self._set_job_params(self._param_to_job_params())
+                self._take_snapshot()
+                self.validate_parameters()
+            else:
+                self._update_job_params(param_names)
+                self._validate_changed_params(dirty_param_names)
+        except Exception:
+            # Incremental state may be partially updated, start from scratch next time
+            self._refresh_all = True
+            raise
+        finally:
+            self._batch_depth -= 1
 
     # ------------------------------------------------
     #                   Schema hooks
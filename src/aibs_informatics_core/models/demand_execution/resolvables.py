@@ -12,12 +12,18 @@ __all__ = [
 
 import re
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from enum import Enum
+from functools import cache, lru_cache
 from re import Pattern
 from typing import Any, ClassVar, Generic, TypeVar
 
-from pydantic import SerializerFunctionWrapHandler, model_serializer, model_validator
+from pydantic import (
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    model_serializer,
+    model_validator,
+)
 from pydantic import ValidationError as PydanticValidationError
 
 from aibs_informatics_core.collections import ValidatedStr
@@ -34,11 +40,47 @@ PATH_PATTERN = r"(?:\/)?(?:[^\0]+\/?)*"
 REMOTE_PATTERN = r"[^\s]*"
 LOCAL_PATTERN = r"(?:\/)?(?:[^/\0]+\/?)*"
 
+RESOLVABLE_STR_CACHE_SIZE = 2**16
+
+_URI_COMPONENT_PATTERN = re.compile(r"\S+")
+
 T = TypeVar("T", bound=str)
 STRINGIFIED_RESOLVABLE = TypeVar("STRINGIFIED_RESOLVABLE", bound="StringifiedResolvable")
 RESOLVABLE = TypeVar("RESOLVABLE", bound="ResolvableBase")
 
 
+@lru_cache(maxsize=RESOLVABLE_STR_CACHE_SIZE)
+def _parse_resolvable_str(value: str) -> tuple[str, str | None]:
+    """Splits a stringified resolvable into its source and destination in a single pass
+
+    This is equivalent to a full match against `StringifiedResolvable.regex_pattern`:
+    the value is either a single URI or two URIs separated by `ACTION_PATTERN`, where
+    a URI is any non-empty string without whitespace.
+
+    Args:
+        value (str): stringified resolvable
+
+    Raises:
+        ValidationError: if the value is not a valid stringified resolvable
+
+    Returns:
+        tuple of source and destination (None if not specified)
+    """
+    source, sep, destination = value.partition(ACTION_PATTERN)
+    if _URI_COMPONENT_PATTERN.fullmatch(source) and (
+        not sep or _URI_COMPONENT_PATTERN.fullmatch(destination)
+    ):
+        return source, (destination if sep else None)
+    raise ValidationError(
+        f"{value} did not satisfy {StringifiedResolvable.regex_pattern} "
+        "pattern validation statement."
+    )
+
+
+def _get_default_local(remote: str) -> str:
+    return f"tmp{sha256_hexdigest(remote)[:8]}"
+
+
 class StringifiedResolvable(ValidatedStr):
     """Stringified representation of a Resolvable object.
 
@@ -61,13 +103,19 @@ class StringifiedResolvable(ValidatedStr):
         rf"(?:({URI_PATTERN})(?:{ACTION_PATTERN})({URI_PATTERN}))|({URI_PATTERN})"
     )
 
+    def _validate(self):
+        try:
+            _parse_resolvable_str(self)
+        except ValidationError as e:
+            raise ValidationError(f"{e} type: {type(self)}") from e
+
     @property
     def source(self) -> str:
-        return self.get_match_groups()[0] or self.get_match_groups()[-1]
+        return _parse_resolvable_str(self)[0]
 
     @property
     def destination(self) -> str | None:
-        return self.get_match_groups()[1]
+        return _parse_resolvable_str(self)[1]
 
     @property
     @abstractmethod
@@ -91,7 +139,7 @@ class StringifiedResolvable(ValidatedStr):
 class StringifiedDownloadable(StringifiedResolvable):
     @property
     def local(self) -> str:
-        return self.destination or f"tmp{sha256_hexdigest(self.remote)[:8]}"
+        return self.destination or _get_default_local(self.remote)
 
     @property
     def remote(self) -> str:
@@ -124,6 +172,7 @@ class ResolvableBase(PydanticBaseModel, Generic[T]):
         return ResolvableAction.LOCALIZE
 
     @classmethod
+    @cache
     def get_resolvable_type(cls: type[RESOLVABLE]) -> type[T]:
         # Use the concrete annotation on the 'remote' field rather than
         # __orig_bases__, which Pydantic v2's metaclass can strip __args__ from.
@@ -152,11 +201,7 @@ class ResolvableBase(PydanticBaseModel, Generic[T]):
                 defaults["local"] = default_local
             if default_remote is not None:
                 defaults["remote"] = default_remote
-            value = {**defaults, **value}
-            obj = cls.from_dict(value)
-            obj.remote = obj.remote or default_remote
-            obj.to_dict(validate=True)
-            return obj
+            return cls.from_dict(cls._merge_defaults(value, default_local, default_remote))
         elif isinstance(value, str):
             return cls.from_str(value, default_local=default_local, default_remote=default_remote)
         else:
@@ -169,21 +214,77 @@ class ResolvableBase(PydanticBaseModel, Generic[T]):
         default_local: str | None = None,
         default_remote: T | None = None,
     ) -> RESOLVABLE:
-        str_resolvable_cls = (
-            StringifiedUploadable
-            if cls.get_action() == ResolvableAction.DELOCALIZE
-            else StringifiedDownloadable
-        )
+        data = cls._parse_str(value, default_local, default_remote)
+        if data["remote"] is not None:
+            data["remote"] = cls.get_resolvable_type()(data["remote"])
+        return cls(**data)
 
-        stringified_resolvable = str_resolvable_cls(value)
+    @classmethod
+    def from_many(
+        cls: type[RESOLVABLE],
+        values: Iterable[Any],
+        default_local: str | None = None,
+        default_remote: T | None = None,
+    ) -> list[RESOLVABLE]:
+        """Construct resolvables from many strings, dicts or resolvables at once
+
+        Equivalent to calling `from_any` on each value, but strings are parsed without
+        constructing intermediate stringified objects and all values (including remote
+        type conversion) are validated with a single pydantic validator call.
+
+        Args:
+            values (Iterable[Any]): strings, dicts or instances of this class
+            default_local (Optional[str], optional): local used if not specified.
+            default_remote (Optional[T], optional): remote used if not specified.
+
+        Raises:
+            ValueError: if a value is not a dict, str or instance of this class
+            ValidationError: if any value cannot be converted
+
+        Returns:
+            list of resolvables in the same order as values
+        """
+        data: list[Any] = []
+        for value in values:
+            if isinstance(value, cls):
+                data.append(value)
+            elif isinstance(value, dict):
+                data.append(cls._merge_defaults(value, default_local, default_remote))
+            elif isinstance(value, str):
+                data.append(cls._parse_str(value, default_local, default_remote))
+            else:
+                raise ValueError(f"Value {value} is not a dict or str. Cannot create {cls}")
+        try:
+            return _get_list_type_adapter(cls).validate_python(data)
+        except PydanticValidationError as e:
+            raise ValidationError(str(e)) from e
 
-        local = stringified_resolvable.local or default_local
-        assert local is not None, f"Local is None for {value}"
-        if stringified_resolvable.remote:
-            remote = cls.get_resolvable_type()(stringified_resolvable.remote)
+    @classmethod
+    def _merge_defaults(
+        cls, value: dict[str, Any], default_local: str | None, default_remote: T | None
+    ) -> dict[str, Any]:
+        data = dict(value)
+        if default_local is not None:
+            data.setdefault("local", default_local)
+        if default_remote is not None and not data.get("remote"):
+            data["remote"] = default_remote
+        return data
+
+    @classmethod
+    def _parse_str(
+        cls, value: str, default_local: str | None, default_remote: T | None
+    ) -> dict[str, Any]:
+        source, destination = _parse_resolvable_str(value)
+        local: str | None
+        remote: str | None
+        if cls.get_action() == ResolvableAction.DELOCALIZE:
+            local, remote = source, destination
         else:
-            remote = default_remote
-        return cls(local=local, remote=remote)
+            local, remote = destination or _get_default_local(source), source
+
+        local = local or default_local
+        assert local is not None, f"Local is None for {value}"
+        return {"local": local, "remote": remote or default_remote}
 
     def to_str(self) -> StringifiedDownloadable | StringifiedUploadable:
         if self.get_action() == ResolvableAction.LOCALIZE:
@@ -215,6 +316,11 @@ class ResolvableBase(PydanticBaseModel, Generic[T]):
 R = TypeVar("R", bound=ResolvableBase)
 
 
+@cache
+def _get_list_type_adapter(resolvable_class: type[R]) -> TypeAdapter[list[R]]:
+    return TypeAdapter(list[resolvable_class])  # type: ignore[valid-type]
+
+
 def get_resolvable_from_value(value: Any, resolvable_classes: Sequence[type[R]]) -> R:
     """Construct resolvable object from string or dict
 
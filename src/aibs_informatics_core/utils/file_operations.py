@@ -1,11 +1,18 @@
 __all__ = [
     "ArchiveType",
+    "CompressionType",
+    "open_path",
     "extract_archive",
     "make_archive",
+    "write_tar_archive",
     "move_path",
     "copy_path",
     "remove_path",
     "get_path_size_bytes",
+    "PathUsageStats",
+    "summarize_path_usage",
+    "write_path_usage",
+    "iter_path_usage",
     "find_paths",
     "get_path_with_root",
     "strip_path_root",
@@ -15,30 +22,42 @@ __all__ = [
 
 import errno
 import fcntl
+import gzip
 import hashlib
+import json
 import logging
 import os
 import re
 import shutil
+import stat
+import struct
 import tarfile
 import tempfile
 import zipfile
+import zlib
 from collections import deque
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from re import Pattern
-from typing import Literal, Union, cast
+from typing import IO, Any, Literal, Union, cast
 
-from aibs_informatics_core.utils.os_operations import find_all_paths
+from aibs_informatics_core.utils.os_operations import iter_paths
 
 ArchiveFile = Union[tarfile.TarFile, zipfile.ZipFile]
 
 
 logger = logging.getLogger(__name__)
 
+# Size of the blocks of a gzip stream that are compressed in parallel
+GZIP_BLOCK_SIZE = 1024 * 1024
+# Size of the deflate window, the end of each block primes the compression of the next
+GZIP_WINDOW_SIZE = 32 * 1024
+
 
 ArchiveFormat = Literal[
     "tar",
@@ -147,6 +166,84 @@ class ArchiveType(Enum):
         return None
 
 
+class CompressionType(Enum):
+    """Enumeration of supported single-file compression formats.
+
+    Compression is inferred from the file suffix (e.g. ``model.json.gz``).
+    """
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffixes(self) -> tuple[str, ...]:
+        """Return the file suffixes associated with this compression type."""
+        if self == CompressionType.GZIP:
+            return (".gz", ".gzip")
+        return (".zst", ".zstd")
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "CompressionType | None":
+        """Infer the compression type from a file path suffix.
+
+        Args:
+            path: Path to check.
+
+        Returns:
+            The inferred ``CompressionType``, or None if the suffix is not a known
+            compression suffix.
+        """
+        suffix = Path(path).suffix.lower()
+        for compression_type in cls:
+            if suffix in compression_type.suffixes:
+                return compression_type
+        return None
+
+
+def open_path(path: str | Path, mode: str = "rb", **kwargs: Any) -> IO[Any]:
+    """Open a file, transparently (de)compressing based on its suffix.
+
+    Files ending in ``.gz``/``.gzip`` are opened with :mod:`gzip` and files ending
+    in ``.zst``/``.zstd`` are opened with zstandard. All other files are opened as-is.
+
+    Zstandard support uses :mod:`compression.zstd` when available (Python 3.14+)
+    and otherwise falls back to the optional ``zstandard`` package.
+
+    Args:
+        path: Path of the file to open.
+        mode: File mode (e.g. "rb", "wt"). Defaults to "rb".
+        **kwargs: Additional keyword arguments (e.g. ``encoding``) passed to the opener.
+
+    Raises:
+        ImportError: If the path requires zstandard and no implementation is installed.
+
+    Returns:
+        A file object
+    """
+    compression_type = CompressionType.from_path(path)
+    if compression_type == CompressionType.GZIP:
+        return cast(IO[Any], gzip.open(path, mode, **kwargs))
+    elif compression_type == CompressionType.ZSTD:
+        return _open_zstd(path, mode, **kwargs)
+    return open(path, mode, **kwargs)
+
+
+def _open_zstd(path: str | Path, mode: str, **kwargs: Any) -> IO[Any]:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.open(path, mode, **kwargs)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise ImportError(
+            f"Cannot open {path}: zstandard compression requires the 'zstandard' package"
+        ) from e
+    return zstandard.open(path, mode, **kwargs)
+
+
 def extract_archive(source_path: Path, destination_path: Path | None = None) -> Path:
     """Untar/unzip data batch into a dedicate folder
     Example: batch_of_samples.tar.gz -> batch_of_samples
@@ -178,45 +275,270 @@ def make_archive(
     source_path: Path,
     destination_path: Path | None = None,
     archive_type: ArchiveType | ArchiveFormat = ArchiveType.TAR_GZ,
+    max_workers: int | None = None,
 ) -> Path:
     """tar/zip data batch from a folder
     Example: batch_of_samples -> batch_of_samples.tar.gz
 
+    tar and gztar archives are streamed directly to the destination with
+    `write_tar_archive`. Other formats are created with `shutil.make_archive`.
+
     Args:
         source_path (Path): folder of data to archive
         destination_path (Optional[Path]): Optional destination path for archived file.
             If none, then tmp file is created and used
+        archive_type (ArchiveType | ArchiveFormat, optional): archive format.
+            Defaults to gztar.
+        max_workers (int, optional): If greater than 1, gztar archives are compressed in
+            a thread pool of this size. Defaults to None (sequential).
 
     Raises:
-        RuntimeError: If archiving operation fails
+        ValueError: If archiving operation fails
 
     Returns:
-        path to the untarred data
+        path to the archive
     """
-
-    archive_path = destination_path or Path(tempfile.mktemp())
     if not isinstance(archive_type, ArchiveType):
         archive_type = ArchiveType(archive_type)
+    if destination_path is None:
+        fd, tmp_path = tempfile.mkstemp()
+        os.close(fd)
+        archive_path = Path(tmp_path)
+    else:
+        archive_path = destination_path
 
     try:
-        actual_archive_path = Path(
-            shutil.make_archive(
-                base_name=str(archive_path.with_suffix("")),
-                root_dir=str(source_path),
-                base_dir=None,
-                format=archive_type.archive_format,
+        if archive_type in (ArchiveType.TAR, ArchiveType.TAR_GZ):
+            write_tar_archive(
+                source_path,
+                archive_path,
+                compression=CompressionType.GZIP if archive_type == ArchiveType.TAR_GZ else None,
+                max_workers=max_workers,
             )
-        )
-
-        # shutil.make_archive takes base name and appends the appropriate suffix.
-        # This means we can't say "write at X". We must move results, but only if different.
-        if actual_archive_path != archive_path:
-            move_path(actual_archive_path, archive_path)
+        else:
+            archive_path.parent.mkdir(parents=True, exist_ok=True)
+            # shutil.make_archive appends a suffix to the base name, so the archive is
+            # created in a private directory next to the destination and moved in place.
+            with tempfile.TemporaryDirectory(dir=archive_path.parent) as tmp_dir:
+                actual_archive_path = shutil.make_archive(
+                    base_name=os.path.join(tmp_dir, "archive"),
+                    root_dir=str(source_path),
+                    base_dir=None,
+                    format=archive_type.archive_format,
+                )
+                os.replace(actual_archive_path, archive_path)
         return archive_path
     except Exception as e:
+        if destination_path is None:
+            remove_path(archive_path)
         raise ValueError(f"Error extracting file {source_path}. [{e}]") from e
 
 
+def write_tar_archive(
+    source_path: str | Path,
+    destination: str | Path | IO[bytes],
+    compression: CompressionType | None = CompressionType.GZIP,
+    compression_level: int | None = None,
+    includes: Sequence[Pattern | str] | None = None,
+    excludes: Sequence[Pattern | str] | None = None,
+    max_workers: int | None = None,
+):
+    """Stream a tar archive of a folder (or file), compressing it on the fly.
+
+    The archive is written in a single pass without seeking, so the destination can be
+    a pipe or an upload stream. Paths are stored relative to the source folder.
+
+    gzip archives are compressed in blocks (like ``pigz``), which are
+    compressed in parallel if max_workers is greater than 1. The output is a single
+    standard gzip stream, identical for any number of workers. zstd archives use the
+    multi-threaded compression of the zstd library.
+
+    Args:
+        source_path (str | Path): folder (or file) to archive
+        destination (str | Path | IO[bytes]): path of the archive file or a writable binary
+            stream. Streams are not closed.
+        compression (CompressionType, optional): compression of the archive.
+            None writes an uncompressed tar. Defaults to gzip.
+        compression_level (int, optional): compression level. Defaults to 6 for gzip
+            and 3 for zstd.
+        includes (Sequence[Pattern | str], optional): regex patterns of paths to include,
+            see `find_paths`. Defaults to all.
+        excludes (Sequence[Pattern | str], optional): regex patterns of paths to exclude,
+            see `find_paths`. Excluded directories are pruned. Defaults to None.
+        max_workers (int, optional): If greater than 1, the source is walked and the archive
+            is compressed in thread pools of this size. Defaults to None (sequential).
+
+    Raises:
+        FileNotFoundError: If the source path does not exist
+        ImportError: If zstd compression is requested and no implementation is installed.
+    """
+    source_path = str(source_path)
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f"Cannot archive {source_path}: path does not exist")
+    root = source_path if os.path.isdir(source_path) else os.path.dirname(source_path) or "."
+    paths = find_paths(
+        source_path,
+        includes=includes,
+        excludes=excludes,
+        prune_excluded_dirs=True,
+        max_workers=max_workers,
+    )
+
+    if not isinstance(destination, (str, Path)):
+        _write_tar_stream(destination, root, paths, compression, compression_level, max_workers)
+        return
+
+    # never archive the (partially written) archive itself
+    destination_path = os.path.abspath(destination)
+    paths = [path for path in paths if os.path.abspath(path) != destination_path]
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(destination, "wb") as f:
+            _write_tar_stream(f, root, paths, compression, compression_level, max_workers)
+    except BaseException:
+        remove_path(Path(destination))
+        raise
+
+
+def _write_tar_stream(
+    fileobj: IO[bytes],
+    root: str,
+    paths: list[str],
+    compression: CompressionType | None,
+    compression_level: int | None,
+    max_workers: int | None,
+):
+    with _open_compressed_writer(fileobj, compression, compression_level, max_workers) as f:
+        with tarfile.open(fileobj=f, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for path in paths:
+                tar.add(path, arcname=os.path.relpath(path, root), recursive=False)
+
+
+@contextmanager
+def _open_compressed_writer(
+    fileobj: IO[bytes],
+    compression: CompressionType | None,
+    compression_level: int | None,
+    max_workers: int | None,
+) -> Iterator[IO[bytes]]:
+    """Yields a writer compressing into fileobj. fileobj is not closed"""
+    if compression is None:
+        yield fileobj
+    elif compression == CompressionType.GZIP:
+        level = 6 if compression_level is None else compression_level
+        with _ParallelGzipWriter(fileobj, level, max_workers) as writer:
+            yield cast(IO[bytes], writer)
+    else:
+        level = 3 if compression_level is None else compression_level
+        with _open_zstd_writer(fileobj, level, max_workers) as writer:
+            yield writer
+
+
+def _open_zstd_writer(fileobj: IO[bytes], level: int, max_workers: int | None) -> IO[bytes]:
+    threads = max_workers if max_workers and max_workers > 1 else 0
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        options = {
+            zstd.CompressionParameter.compression_level: level,
+            zstd.CompressionParameter.nb_workers: threads,
+        }
+        return zstd.ZstdFile(fileobj, "wb", options=options)
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise ImportError("zstandard compression requires the 'zstandard' package") from e
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+    return compressor.stream_writer(fileobj, closefd=False)
+
+
+class _ParallelGzipWriter:
+    """Writes a gzip stream, compressing blocks of the input in a thread pool.
+
+    Each block is deflated on its own, primed with the end of the previous block as
+    dictionary and ended with a sync flush (byte aligned), so the compressed blocks can
+    be concatenated into a single deflate stream (the approach of ``pigz``).
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        level: int,
+        max_workers: int | None = None,
+        block_size: int = GZIP_BLOCK_SIZE,
+    ):
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if max_workers and max_workers > 1
+            else None
+        )
+        # Bounds the memory used by blocks waiting to be written
+        self._max_pending = 2 * (max_workers or 1)
+        self._pending: deque[Future[bytes]] = deque()
+        # header: magic, deflate, no flags, no mtime, no extra flags, unknown OS
+        self._fileobj.write(b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff")
+
+    def __enter__(self) -> "_ParallelGzipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        if len(self._buffer) >= self._block_size:
+            view = memoryview(self._buffer)
+            end = len(self._buffer) - len(self._buffer) % self._block_size
+            for start in range(0, end, self._block_size):
+                self._submit(bytes(view[start : start + self._block_size]))
+            view.release()
+            del self._buffer[:end]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        if self._executor is not None:
+            self._executor.shutdown()
+        # empty final block, followed by the trailer
+        self._fileobj.write(b"\x03\x00")
+        self._fileobj.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+
+    def _submit(self, block: bytes):
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        dictionary, self._dictionary = self._dictionary, block[-GZIP_WINDOW_SIZE:]
+        if self._executor is None:
+            self._fileobj.write(_deflate_block(block, self._level, dictionary))
+            return
+        self._pending.append(self._executor.submit(_deflate_block, block, self._level, dictionary))
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def _deflate_block(block: bytes, level: int, dictionary: bytes) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
 def find_filesystem_boundary(starting_path: Path) -> Path:
     """Given some starting Path, determine the nearest filesystem boundary (mount point).
     If no mount is found, then this function will return the first parent directory PRIOR
@@ -312,19 +634,30 @@ def remove_path(path: Path, ignore_errors: bool = True):
             return
 
 
-def get_path_size_bytes(path: Path) -> int:
+def get_path_size_bytes(path: Path, max_workers: int | None = None) -> int:
     """Calculate the total size in bytes of all files under a path.
 
     Handles ``FileNotFoundError`` and stale NFS file handles gracefully.
 
     Args:
         path: A file or directory path.
+        max_workers: If greater than 1, directories are listed and files are stat'ed in
+            a thread pool of this size. Defaults to None (sequential).
 
     Returns:
         The total size in bytes.
     """
     size_bytes = 0
-    file_paths = deque(find_all_paths(path, include_dirs=False, include_files=True))
+    # Stats of directory entries are reused. Paths that could not be stat'ed while
+    # walking are checked again below.
+    file_paths: deque[str] = deque()
+    for file_path, stat_result in iter_paths(
+        path, include_dirs=False, include_files=True, with_stat=True, max_workers=max_workers
+    ):
+        if stat_result is None:
+            file_paths.append(file_path)
+        else:
+            size_bytes += stat_result.st_size
     while file_paths:
         file_path = file_paths.popleft()
         path = Path(file_path)
@@ -349,12 +682,206 @@ def get_path_size_bytes(path: Path) -> int:
     return size_bytes
 
 
+@dataclass
+class PathUsageStats:
+    """Disk usage of a directory (or file), including everything below it.
+
+    Mirrors the fields of ``S3PathStats`` so that local and S3 usage can be handled alike.
+
+    Attributes:
+        path (str): path of the directory (or file)
+        depth (int): depth of the path below the summarized root (the root is at depth 0)
+        size_bytes (int): total size of all files below the path
+        object_count (int): number of files below the path
+        last_modified (datetime, optional): newest modification time (UTC) of all files
+            below the path. None if there are no files.
+    """
+
+    path: str
+    depth: int
+    size_bytes: int = 0
+    object_count: int = 0
+    last_modified: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a JSON serializable dictionary of the stats"""
+        data: dict[str, Any] = {
+            "path": self.path,
+            "depth": self.depth,
+            "size_bytes": self.size_bytes,
+            "object_count": self.object_count,
+        }
+        if self.last_modified is not None:
+            data["last_modified"] = self.last_modified.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PathUsageStats":
+        """Creates stats from a dictionary created by `to_dict`"""
+        last_modified = data.get("last_modified")
+        return cls(
+            path=data["path"],
+            depth=data["depth"],
+            size_bytes=data.get("size_bytes", 0),
+            object_count=data.get("object_count", 0),
+            last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+        )
+
+
+def summarize_path_usage(
+    root: str | Path,
+    depth: int = 1,
+    use_blocks: bool = False,
+    max_workers: int | None = None,
+) -> list[PathUsageStats]:
+    """Summarize the disk usage of a path per directory, in a single walk.
+
+    Every directory up to ``depth`` levels below root gets a record that rolls up the
+    size, file count and newest modification time of all files below it (at any depth).
+    Symlinks to directories are not followed.
+
+    Args:
+        root (str | Path): directory (or file) to summarize
+        depth (int, optional): max depth of directories to report. 0 only reports
+            the root. Defaults to 1.
+        use_blocks (bool, optional): If True, sizes are the space allocated on disk
+            (``st_blocks``) rather than the apparent file sizes, and hard linked files
+            are only counted once (like ``du``). Defaults to False.
+        max_workers (int, optional): If greater than 1, directories are listed and files
+            are stat'ed in a thread pool of this size. Defaults to None (sequential).
+
+    Raises:
+        ValueError: If depth is negative
+
+    Returns:
+        stats of root and the directories below it, in `os.walk` order (parents first)
+    """
+    if depth < 0:
+        raise ValueError(f"depth must be non-negative, got {depth}")
+    str_root = os.path.normpath(root)
+    root_stats = PathUsageStats(path=str_root, depth=0)
+    # Files count towards the record of their directory (or its ancestor at max depth).
+    # Records are rolled up into their parents once all files have been counted.
+    stats: list[PathUsageStats] = [root_stats]
+    parent_indices: list[int] = [0]
+    dir_indices: dict[str, int] = {str_root: 0}
+    newest_mtime_ns: list[int | None] = [None]
+    seen_inodes: set[tuple[int, int]] = set()
+
+    for path, stat_result in iter_paths(
+        str_root, include_dirs=True, include_files=True, with_stat=True, max_workers=max_workers
+    ):
+        if stat_result is None:
+            logger.warning(f"Could not stat {path}. Skipping it.")
+            continue
+        parent_index = _get_dir_index(dir_indices, os.path.dirname(path))
+        if stat.S_ISDIR(stat_result.st_mode):
+            parent_stats = stats[parent_index]
+            if parent_stats.depth < depth and not os.path.islink(path):
+                dir_indices[path] = len(stats)
+                stats.append(PathUsageStats(path=path, depth=parent_stats.depth + 1))
+                parent_indices.append(parent_index)
+                newest_mtime_ns.append(None)
+            else:
+                dir_indices[path] = parent_index
+            continue
+        size_bytes = _get_usage_bytes(stat_result, use_blocks, seen_inodes)
+        if size_bytes is None:
+            continue
+        file_stats = stats[parent_index]
+        file_stats.size_bytes += size_bytes
+        file_stats.object_count += 1
+        newest_mtime_ns[parent_index] = _max_mtime_ns(
+            newest_mtime_ns[parent_index], stat_result.st_mtime_ns
+        )
+
+    # Children are always recorded after their parents
+    for index in range(len(stats) - 1, 0, -1):
+        parent_index = parent_indices[index]
+        stats[parent_index].size_bytes += stats[index].size_bytes
+        stats[parent_index].object_count += stats[index].object_count
+        newest_mtime_ns[parent_index] = _max_mtime_ns(
+            newest_mtime_ns[parent_index], newest_mtime_ns[index]
+        )
+    for path_stats, mtime_ns in zip(stats, newest_mtime_ns):
+        if mtime_ns is not None:
+            path_stats.last_modified = datetime.fromtimestamp(mtime_ns / 1e9, tz=timezone.utc)
+    return stats
+
+
+def _get_usage_bytes(
+    stat_result: os.stat_result, use_blocks: bool, seen_inodes: set[tuple[int, int]]
+) -> int | None:
+    # Returns None for hard links of files that were already counted
+    if not use_blocks:
+        return stat_result.st_size
+    if stat_result.st_nlink > 1:
+        inode = (stat_result.st_dev, stat_result.st_ino)
+        if inode in seen_inodes:
+            return None
+        seen_inodes.add(inode)
+    return stat_result.st_blocks * 512
+
+
+def _max_mtime_ns(mtime_ns: int | None, other_mtime_ns: int | None) -> int | None:
+    if mtime_ns is None or other_mtime_ns is None:
+        return other_mtime_ns if mtime_ns is None else mtime_ns
+    return max(mtime_ns, other_mtime_ns)
+
+
+def _get_dir_index(dir_indices: dict[str, int], dir_path: str) -> int:
+    # Directories that could not be stat'ed are missing, their contents count towards
+    # the nearest known ancestor.
+    if (index := dir_indices.get(dir_path)) is None:
+        parent_path = os.path.dirname(dir_path)
+        index = 0 if parent_path == dir_path else _get_dir_index(dir_indices, parent_path)
+        dir_indices[dir_path] = index
+    return index
+
+
+def write_path_usage(stats: Iterable[PathUsageStats], path_or_stream: str | Path | IO):
+    """Write path usage stats as compact JSON-lines, one record per line.
+
+    Args:
+        stats (Iterable[PathUsageStats]): stats to write
+        path_or_stream (str | Path | IO): path of the output file (compression suffixes
+            are handled transparently) or an open text stream
+    """
+    if isinstance(path_or_stream, (str, Path)):
+        with open_path(path_or_stream, "wt") as f:
+            write_path_usage(stats, f)
+        return
+    for path_stats in stats:
+        path_or_stream.write(json.dumps(path_stats.to_dict(), separators=(",", ":")) + "\n")
+
+
+def iter_path_usage(path_or_stream: str | Path | IO) -> Iterator[PathUsageStats]:
+    """Iterate over path usage stats written by `write_path_usage`
+
+    Args:
+        path_or_stream (str | Path | IO): path of the JSON-lines file (compression
+            suffixes are handled transparently) or an open text or binary stream
+
+    Yields:
+        path usage stats in file order
+    """
+    if isinstance(path_or_stream, (str, Path)):
+        with open_path(path_or_stream, "rt") as f:
+            yield from iter_path_usage(f)
+        return
+    for line in path_or_stream:
+        if line.strip():
+            yield PathUsageStats.from_dict(json.loads(line))
+
+
 def find_paths(
     root: str | Path,
     include_dirs: bool = True,
     include_files: bool = True,
     includes: Sequence[Pattern | str] | None = None,
     excludes: Sequence[Pattern | str] | None = None,
+    prune_excluded_dirs: bool = False,
+    max_workers: int | None = None,
 ) -> list[str]:
     """Find paths that match criteria
 
@@ -365,33 +892,34 @@ def find_paths(
 
         includes (Sequence[str], optional): list of regex patterns to include. Defaults to all.
         excludes (Sequence[str], optional): list of regex patterns to exclude. Defaults to None.
+        prune_excluded_dirs (bool, optional): If True, nothing below an excluded directory
+            is visited (or returned). Otherwise, paths below excluded directories are
+            matched individually. Defaults to False.
+        max_workers (int, optional): If greater than 1, directories are listed in a thread
+            pool of this size. Defaults to None (sequential).
 
     Returns:
         list of paths matching criteria
     """
-
-    paths_to_return = []
-    paths = find_all_paths(root, include_dirs=include_dirs, include_files=include_files)
-
-    if not includes and not excludes:
-        return paths
-
     include_patterns = [re.compile(include) for include in includes or [r".*"]]
     exclude_patterns = [re.compile(exclude) for exclude in excludes or []]
 
-    for path in paths:
-        target_path = path  # if check_absolute_path else strip_path_root(root=root, path=path)
-        # First check exclude patterns
-        for exclude_pattern in exclude_patterns:
-            if exclude_pattern.fullmatch(target_path):
-                break
-        else:
-            # Now check include patterns
-            for include_pattern in include_patterns:
-                if include_pattern.fullmatch(target_path):
-                    paths_to_return.append(path)
-                    break
-    return paths_to_return
+    paths = iter_paths(
+        root,
+        include_dirs=include_dirs,
+        include_files=include_files,
+        excludes=exclude_patterns if prune_excluded_dirs else None,
+        max_workers=max_workers,
+    )
+    if not includes and (not excludes or prune_excluded_dirs):
+        return list(paths)
+
+    return [
+        path
+        for path in paths
+        if not any(_.fullmatch(path) for _ in exclude_patterns)
+        and any(_.fullmatch(path) for _ in include_patterns)
+    ]
 
 
 def get_path_with_root(path: str | Path, root: str | Path) -> str:
@@ -451,17 +979,23 @@ class PathLock:
     Providing an explicit lock root is useful if you dont want processes to read the lock file
     from the same directory as the file being locked.
 
+    Shared locks can be held by several processes at once (e.g. readers), but not along with
+    an exclusive lock. The lock file is removed when an exclusive lock is released.
+
     Attributes:
         path (Union[str, Path]): The path to the file.
         lock_root (Optional[Union[str, Path]]): The root directory for lock files. If provided, a
             lock file will be created in this directory with the name of the hash of the path.
             Otherwise, a lock file with the same name as the path and a .lock extension
             will be created. Defaults to None.
+        raise_if_locked (bool): Raise instead of waiting if the lock is held. Defaults to False.
+        shared (bool): Acquire a shared instead of an exclusive lock. Defaults to False.
     """  # noqa: E501
 
     path: str | Path
     lock_root: str | Path | None = None
     raise_if_locked: bool = False
+    shared: bool = False
 
     def __post_init__(self):
         # If lock root is provided, then create a lock file in that directory
@@ -491,12 +1025,19 @@ class PathLock:
         logger.info("Acquiring lock...")
         try:
             self._lock_path.parent.mkdir(parents=True, exist_ok=True)
-            self._lock_file = open(self._lock_path, "w")
-            op = fcntl.LOCK_EX
+            op = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
             if self.raise_if_locked:
                 op |= fcntl.LOCK_NB
-            fcntl.flock(self._lock_file, op)
-            self._lock_file.write(f"{datetime.now().timestamp()}")
+            while True:
+                # Shared locks must not truncate the lock file of other holders
+                self._lock_file = lock_file = open(self._lock_path, "a" if self.shared else "w")
+                fcntl.flock(lock_file, op)
+                if self._is_lock_file_current(lock_file):
+                    break
+                # The previous holder removed the lock file, lock the current one instead
+                lock_file.close()
+            if not self.shared:
+                lock_file.write(f"{datetime.now().timestamp()}")
             logger.info("Lock acquired!")
         except Exception as e:
             msg = f"Could not acquire lock! Reason: {e}"
@@ -507,6 +1048,12 @@ class PathLock:
         """Release the file lock and remove the lock file."""
         logger.info("Releasing lock...")
 
+        if not self.shared:
+            # Removed while still locked, so that processes waiting on the removed file
+            # notice and lock the current one instead (see `acquire`). Other holders of
+            # a shared lock may still use the file, so it is kept.
+            logger.info("Removing lock file")
+            remove_path(self._lock_path)
         if self._lock_file and not self._lock_file.closed:
             try:
                 fcntl.flock(self._lock_file, fcntl.LOCK_UN)
@@ -515,7 +1062,12 @@ class PathLock:
                 logger.warning(f"Lock file doesn't exist. Skipping fcntl.flock and close: {e}")
         else:
             logger.warning("Strange! lock file already closed. not calling fcntl.flock")
-        logger.info("Removing lock file")
-        remove_path(self._lock_path)
 
         logger.info("Lock released!")
+
+    def _is_lock_file_current(self, lock_file: IO) -> bool:
+        """Whether the locked file is still the one at the lock path"""
+        try:
+            return os.fstat(lock_file.fileno()).st_ino == os.stat(self._lock_path).st_ino
+        except FileNotFoundError:
+            return False
@@ -1,9 +1,14 @@
 __all__ = [
     "b64_decoded_str",
     "b64_encoded_str",
+    "FileHashCache",
     "generate_file_hash",
+    "generate_file_hashes",
     "generate_path_hash",
+    "generate_path_hash_tree",
+    "PathHashTree",
     "sha256_hexdigest",
+    "update_json_hash",
     "urlsafe_b64_decoded_str",
     "urlsafe_b64_encoded_str",
     "uuid_str",
@@ -12,19 +17,58 @@ __all__ = [
 import hashlib
 import json
 import logging
+import mmap
+import os
 import re
+import sqlite3
+import threading
+import time
 import uuid
+import zlib
 from base64 import standard_b64decode, standard_b64encode, urlsafe_b64decode, urlsafe_b64encode
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, Protocol
 
+from aibs_informatics_core.utils.file_operations import PathLock
 from aibs_informatics_core.utils.json import JSON
-from aibs_informatics_core.utils.os_operations import find_all_paths
+from aibs_informatics_core.utils.os_operations import iter_paths
 
 logger = logging.getLogger(__name__)
 
 
 HashTypeStr = Literal["md5", "sha256", "sha1"]
+PathHashMode = Literal["flat", "merkle"]
+FileReadStrategy = Literal["buffered", "mmap"]
+FileHashTypeStr = Literal["md5", "sha256", "sha1", "crc32", "crc32c", "s3_etag"]
+
+# Containers with more entries than this are encoded and hashed in chunks of this many entries
+JSON_HASH_CHUNK_SIZE = 256
+
+# Digests of strings up to this length are cached (e.g. paths hashed for default local names)
+SHA256_HEXDIGEST_CACHE_MAX_LEN = 1024
+SHA256_HEXDIGEST_CACHE_SIZE = 2**14
+
+# Buffer sizes used to read files when no explicit buffer size is given. Buffers that fit in
+# the CPU cache hash fastest locally, but network filesystems have high per-request latency,
+# so larger reads are needed to saturate their throughput.
+FILE_HASH_LOCAL_BUFSIZE = 128 * 1024
+FILE_HASH_NETWORK_BUFSIZE = 8 * 1024 * 1024
+# Memory mapped files are hashed in chunks of this size
+FILE_HASH_MMAP_CHUNK_SIZE = 64 * 1024 * 1024
+
+NETWORK_FILESYSTEM_TYPES = frozenset(
+    ["nfs", "nfs4", "efs", "cifs", "smb3", "smbfs", "lustre", "ceph", "9p", "fuse.s3fs"]
+)
+
+
+class _Hash(Protocol):
+    def update(self, data: bytes, /) -> None: ...
 
 
 def uuid_str(content: str | None = None) -> str:
@@ -44,8 +88,9 @@ def uuid_str(content: str | None = None) -> str:
 def sha256_hexdigest(content: JSON | None = None) -> str:
     """Create a SHA 256 Hex Digest string from optional content.
 
-    If content is not provided, a unique Hex Digest is generated from UUID
-
+    If content is not provided, a unique Hex Digest is generated from UUID.
+    Non-string content is hashed as its canonical JSON (`json.dumps(content, sort_keys=True)`),
+    which is streamed into the hash with `update_json_hash` rather than built in memory.
 
     Args:
         content (JSON, optional): Input to base hexdigest off of. Defaults to None.
@@ -53,13 +98,89 @@ def sha256_hexdigest(content: JSON | None = None) -> str:
     Returns:
         a SHA 256 hex digest string.
     """
-    if content is None:
-        content = uuid_str()
-    elif not isinstance(content, str):
-        content = json.dumps(content, sort_keys=True)
+    if isinstance(content, str):
+        if len(content) <= SHA256_HEXDIGEST_CACHE_MAX_LEN:
+            return _sha256_hexdigest_str(content)
+        return hashlib.sha256(content.encode()).hexdigest()
+    elif content is None:
+        return hashlib.sha256(uuid_str().encode()).hexdigest()
+    h = hashlib.sha256()
+    update_json_hash(h, content)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=SHA256_HEXDIGEST_CACHE_SIZE)
+def _sha256_hexdigest_str(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
+def update_json_hash(
+    hash_obj: _Hash, content: JSON, chunk_size: int = JSON_HASH_CHUNK_SIZE
+) -> None:
+    """Feeds the canonical JSON of content into a hash object, chunk by chunk
+
+    The bytes fed are exactly those of `json.dumps(content, sort_keys=True)`, but large
+    dicts and lists (and containers holding them) are encoded `chunk_size` entries at a
+    time, recursing into large nested values, so the full JSON string is never built.
+
+    Args:
+        hash_obj: hash object to update (e.g. `hashlib.sha256()`)
+        content (JSON): content to hash
+        chunk_size (int, optional): max entries encoded at once.
+            Defaults to JSON_HASH_CHUNK_SIZE.
+    """
+    keys: list[str] | None
+    if not _should_stream_json(content, chunk_size):
+        hash_obj.update(json.dumps(content, sort_keys=True).encode())
+        return
+    elif isinstance(content, dict):
+        if not all(isinstance(_, str) for _ in content):
+            # json sorts (and converts) non-str keys differently, defer to json for these
+            hash_obj.update(json.dumps(content, sort_keys=True).encode())
+            return
+        opening, closing = b"{", b"}"
+        keys = sorted(content)
+        values = [content[_] for _ in keys]
+    else:
+        opening, closing = b"[", b"]"
+        keys = None
+        values = list(content)  # type: ignore[arg-type]
+
+    hash_obj.update(opening)
+    for start in range(0, len(values), chunk_size):
+        if start:
+            hash_obj.update(b", ")
+        chunk_keys = keys[start : start + chunk_size] if keys is not None else None
+        chunk_values = values[start : start + chunk_size]
+        if not any(_should_stream_json(_, chunk_size) for _ in chunk_values):
+            # encode the whole chunk at once and strip its brackets
+            chunk: Any = (
+                chunk_values if chunk_keys is None else dict(zip(chunk_keys, chunk_values))
+            )
+            hash_obj.update(json.dumps(chunk, sort_keys=True)[1:-1].encode())
+            continue
+        for i, value in enumerate(chunk_values):
+            if i:
+                hash_obj.update(b", ")
+            if chunk_keys is not None:
+                hash_obj.update(f"{json.dumps(chunk_keys[i])}: ".encode())
+            update_json_hash(hash_obj, value, chunk_size=chunk_size)
+    hash_obj.update(closing)
+
+
+def _should_stream_json(content: Any, chunk_size: int) -> bool:
+    """Whether content is a large container or directly holds one"""
+    if isinstance(content, dict):
+        children: Iterable[Any] = content.values()
+    elif isinstance(content, (list, tuple)):
+        children = content
+    else:
+        return False
+    return len(content) > chunk_size or any(
+        isinstance(_, (dict, list, tuple)) and len(_) > chunk_size for _ in children
+    )
+
+
 def b64_decoded_str(encoded_str: str) -> str:
     """Decodes an encoded base64 string.
 
@@ -118,67 +239,790 @@ def generate_path_hash(
     includes: list[str] | None = None,
     excludes: list[str] | None = None,
     hash_type: HashTypeStr = "sha256",
+    max_workers: int | None = None,
+    mode: PathHashMode = "flat",
+    cache: "FileHashCache | None" = None,
 ) -> str:
     """Generate a hash based on files found under a given path.
 
+    In "flat" mode, file hashes are combined in the order the files are found
+    (`os.walk` order). The result is the same regardless of how many workers are used,
+    but it depends on the filesystem and ignores file names.
+
+    In "merkle" mode, the root digest of `generate_path_hash_tree` is returned. It is
+    independent of filesystem ordering and changes when files are renamed or moved.
+
     Args:
         path (str): path to compute a hash
         includes (List[str], optional): list of regex patterns to include. Defaults to None.
         excludes (List[str], optional): list of regex patterns to exclude. Defaults to None.
         hash_type (Literal["md5", "sha256"], optional): type of hash to generate.
             Defaults to "sha256".
+        max_workers (int, optional): If greater than 1, directories are listed and files
+            are hashed concurrently in thread pools of this size. hashlib releases the GIL
+            while hashing large buffers, so this speeds up hashing of many or large files.
+            Defaults to None (sequential).
+        mode (Literal["flat", "merkle"], optional): how file hashes are combined.
+            Defaults to "flat".
+        cache (FileHashCache, optional): cache of file hashes used to skip unchanged
+            files. Defaults to None.
 
     Returns:
         hash value
     """
-    paths = find_all_paths(path, include_dirs=False)
-    include_patterns = [re.compile(include) for include in includes or [r".*"]]
-    exclude_patterns = [re.compile(exclude) for exclude in excludes or []]
+    if mode == "merkle":
+        tree = generate_path_hash_tree(
+            path,
+            includes=includes,
+            excludes=excludes,
+            hash_type=hash_type,
+            max_workers=max_workers,
+            cache=cache,
+        )
+        return tree.digest
+
+    paths_to_hash = _filter_paths(
+        iter_paths(path, include_dirs=False, max_workers=max_workers), includes, excludes
+    )
 
-    paths_to_hash = []
-    for path in paths:
-        # First check exclude patterns
-        for exclude_pattern in exclude_patterns:
-            if exclude_pattern.fullmatch(path):
-                break
-        else:
-            # Now check include patterns
-            for include_pattern in include_patterns:
-                if include_pattern.fullmatch(path):
-                    paths_to_hash.append(path)
-                    break
     path_hash = hashlib.new(hash_type)
-    for path in paths_to_hash:
-        path_hash.update(generate_file_hash(path, hash_type=hash_type).encode("utf-8"))
+    for file_hash in _iter_file_hashes(paths_to_hash, hash_type, max_workers, cache):
+        path_hash.update(file_hash.encode("utf-8"))
+    if cache is not None:
+        cache.flush()
 
     return path_hash.hexdigest()
 
 
+def generate_path_hash_tree(
+    path: str | Path,
+    includes: list[str] | None = None,
+    excludes: list[str] | None = None,
+    hash_type: HashTypeStr = "sha256",
+    max_workers: int | None = None,
+    cache: "FileHashCache | None" = None,
+) -> "PathHashTree":
+    """Generate a Merkle tree of hashes for files found under a given path.
+
+    Args:
+        path (str): path to compute a hash tree
+        includes (List[str], optional): list of regex patterns to include. Defaults to None.
+        excludes (List[str], optional): list of regex patterns to exclude. Defaults to None.
+        hash_type (Literal["md5", "sha256"], optional): type of hash to generate.
+            Defaults to "sha256".
+        max_workers (int, optional): If greater than 1, directories are listed and files
+            are hashed concurrently in thread pools of this size. Defaults to None.
+        cache (FileHashCache, optional): cache of file hashes used to skip unchanged
+            files. Defaults to None.
+
+    Returns:
+        hash tree with per file and per directory digests
+    """
+    tree = PathHashTree(root=str(path), includes=includes, excludes=excludes, hash_type=hash_type)
+    paths = iter_paths(path, include_dirs=False, max_workers=max_workers)
+    tree.update(paths, max_workers=max_workers, cache=cache)
+    return tree
+
+
+@dataclass
+class PathHashTree:
+    """Merkle tree of file hashes under a root path.
+
+    Each directory digest hashes the sorted (kind, name, digest) entries of its children,
+    where files contribute their file hash and subdirectories their directory digest.
+    Only directories containing (included) files are part of the tree. Paths are
+    relative to the root using "/" as separator, and the root directory is "".
+
+    When files change, `update` rehashes only those files and recomputes the digests of
+    their ancestor directories.
+
+    Attributes:
+        root: root path of the tree
+        includes: regex patterns of paths to include (matched against the full path)
+        excludes: regex patterns of paths to exclude (matched against the full path)
+        hash_type: type of hash used for files and directories
+        file_hashes: mapping of relative file path to file hash
+        dir_hashes: mapping of relative directory path to directory digest
+    """
+
+    root: str
+    includes: list[str] | None = None
+    excludes: list[str] | None = None
+    hash_type: HashTypeStr = "sha256"
+    file_hashes: dict[str, str] = field(default_factory=dict)
+    dir_hashes: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._children: dict[str, set[str]] = {}
+        for rel_path in self.file_hashes:
+            self._add_to_parents(rel_path)
+        self._update_dir_hashes(set(self._children) or {""})
+
+    @property
+    def digest(self) -> str:
+        """Digest of the root directory"""
+        return self.dir_hashes[""]
+
+    def get_digest(self, rel_path: str = "") -> str | None:
+        """Returns the digest of a file or directory relative to root, if part of the tree"""
+        rel_path = rel_path.strip("/")
+        return self.file_hashes.get(rel_path) or self.dir_hashes.get(rel_path)
+
+    def update(
+        self,
+        paths: Iterable[str | Path],
+        max_workers: int | None = None,
+        cache: "FileHashCache | None" = None,
+    ) -> set[str]:
+        """Rehashes the given paths and recomputes the digests of their ancestors.
+
+        Paths that no longer exist (or are filtered out) are removed from the tree.
+
+        Args:
+            paths (Iterable[str | Path]): changed file paths (absolute or relative to the
+                current working directory, like `root`)
+            max_workers (int, optional): If greater than 1, files are hashed concurrently
+                in a thread pool of this size. Defaults to None (sequential).
+            cache (FileHashCache, optional): cache of file hashes used to skip unchanged
+                files. Defaults to None.
+
+        Returns:
+            relative paths of all files and directories whose digest changed
+        """
+        rel_paths: dict[str, str] = {}
+        for path in paths:
+            rel_path = self._get_rel_path(str(path))
+            if rel_path is not None:
+                rel_paths.setdefault(rel_path, self._get_full_path(rel_path))
+        full_paths = _filter_paths(
+            [_ for _ in rel_paths.values() if os.path.isfile(_)], self.includes, self.excludes
+        )
+
+        changed: set[str] = set()
+        new_hashes = dict(
+            zip(full_paths, _iter_file_hashes(full_paths, self.hash_type, max_workers, cache))
+        )
+        if cache is not None:
+            cache.flush()
+        for rel_path, full_path in rel_paths.items():
+            new_hash = new_hashes.get(full_path)
+            if new_hash == self.file_hashes.get(rel_path):
+                continue
+            changed.add(rel_path)
+            if new_hash is None:
+                del self.file_hashes[rel_path]
+                changed |= self._remove_from_parents(rel_path)
+            else:
+                self.file_hashes[rel_path] = new_hash
+                self._add_to_parents(rel_path)
+
+        if changed:
+            dirty = {_get_parent(_) for _ in changed} | {""}
+            changed |= self._update_dir_hashes(dirty)
+        return changed
+
+    def _get_rel_path(self, path: str) -> str | None:
+        if not os.path.isdir(self.root):
+            # Single file tree
+            is_root = os.path.abspath(path) == os.path.abspath(self.root)
+            return os.path.basename(self.root) if is_root else None
+        rel_path = os.path.relpath(path, self.root)
+        if rel_path == os.curdir or rel_path.startswith(os.pardir):
+            return None
+        return rel_path.replace(os.sep, "/")
+
+    def _get_full_path(self, rel_path: str) -> str:
+        if not os.path.isdir(self.root):
+            return self.root
+        return os.path.join(self.root, *rel_path.split("/"))
+
+    def _add_to_parents(self, rel_path: str):
+        while rel_path:
+            parent = _get_parent(rel_path)
+            children = self._children.setdefault(parent, set())
+            if rel_path in children:
+                return
+            children.add(rel_path)
+            rel_path = parent
+
+    def _remove_from_parents(self, rel_path: str) -> set[str]:
+        """Removes a path from its parent and returns directories that became empty"""
+        removed = set()
+        while rel_path:
+            parent = _get_parent(rel_path)
+            children = self._children.get(parent, set())
+            children.discard(rel_path)
+            if children or not parent:
+                break
+            # parent directory is now empty and no longer part of the tree
+            del self._children[parent]
+            self.dir_hashes.pop(parent, None)
+            removed.add(parent)
+            rel_path = parent
+        return removed
+
+    def _update_dir_hashes(self, dirty: set[str]) -> set[str]:
+        """Recomputes digests of dirty directories and their ancestors, deepest first"""
+        pending = set()
+        for rel_dir in dirty:
+            while rel_dir not in pending:
+                pending.add(rel_dir)
+                if not rel_dir:
+                    break
+                rel_dir = _get_parent(rel_dir)
+
+        changed = set()
+        for rel_dir in sorted(pending, key=lambda _: (-_.count("/") - bool(_), _)):
+            if rel_dir and rel_dir not in self._children:
+                # directory was removed from the tree
+                continue
+            h = hashlib.new(self.hash_type)
+            for child in sorted(self._children.get(rel_dir, ())):
+                name = child.rsplit("/", 1)[-1]
+                if child in self.file_hashes:
+                    h.update(f"f\0{name}\0{self.file_hashes[child]}\0".encode())
+                else:
+                    h.update(f"d\0{name}\0{self.dir_hashes[child]}\0".encode())
+            digest = h.hexdigest()
+            if self.dir_hashes.get(rel_dir) != digest:
+                self.dir_hashes[rel_dir] = digest
+                changed.add(rel_dir)
+        return changed
+
+
+def _get_parent(rel_path: str) -> str:
+    return rel_path.rsplit("/", 1)[0] if "/" in rel_path else ""
+
+
+def _filter_paths(
+    paths: Iterable[str], includes: list[str] | None, excludes: list[str] | None
+) -> list[str]:
+    """Returns paths that match an include pattern and no exclude pattern (in order)"""
+    include_patterns = [re.compile(include) for include in includes or [r".*"]]
+    exclude_patterns = [re.compile(exclude) for exclude in excludes or []]
+    return [
+        path
+        for path in paths
+        if not any(_.fullmatch(path) for _ in exclude_patterns)
+        and any(_.fullmatch(path) for _ in include_patterns)
+    ]
+
+
+def _iter_file_hashes(
+    paths: Sequence[str],
+    hash_type: HashTypeStr,
+    max_workers: int | None,
+    cache: "FileHashCache | None" = None,
+) -> Iterator[str]:
+    """Yields the hash of each file in the same order as paths"""
+    if not max_workers or max_workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield _generate_file_hash(path, hash_type=hash_type, cache=cache)
+        return
+
+    # Bound the number of in-flight futures so that memory stays proportional
+    # to max_workers rather than the number of files.
+    pending: deque[Future[str]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for path in paths:
+            future = executor.submit(_generate_file_hash, path, hash_type=hash_type, cache=cache)
+            pending.append(future)
+            if len(pending) >= 4 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def generate_file_hash(
-    filename: str | Path, bufsize: int = 128 * 1024, hash_type: HashTypeStr = "sha256"
+    filename: str | Path,
+    bufsize: int | None = None,
+    hash_type: HashTypeStr = "sha256",
+    cache: "FileHashCache | None" = None,
+    strategy: FileReadStrategy = "buffered",
 ) -> str:
     """Generate a hash for a file
 
     https://stackoverflow.com/a/70215084/4544508
 
+    With the "buffered" strategy, files are read with a buffer sized for the
+    file and filesystem (larger on network filesystems like EFS/NFS). With the "mmap"
+    strategy, the file is memory mapped and hashed without copying it into a buffer.
+    The kernel is advised that reads are sequential in both cases.
+
     Args:
         filename (str|Path): filepath to hash
-        bufsize (int, optional): buffer size. Defaults to 128*1024.
+        bufsize (int, optional): buffer size. If provided, the file is read with a buffer
+            of this size (unless strategy is "mmap"). Defaults to None (adaptive).
         hash_type (Literal["md5", "sha256"], optional): type of hash to generate.
             Defaults to "sha256".
+        cache (FileHashCache, optional): If provided, the hash is looked up in (and saved
+            to) this cache, so unchanged files are not read again. Defaults to None.
+        strategy (Literal["buffered", "mmap"], optional): how the file is read.
+            Defaults to "buffered".
 
     Returns:
         hash value of file
     """
+    hash_value = _generate_file_hash(
+        filename, bufsize=bufsize, hash_type=hash_type, cache=cache, strategy=strategy
+    )
+    if cache is not None:
+        cache.flush()
+    return hash_value
+
+
+def _generate_file_hash(
+    filename: str | Path,
+    bufsize: int | None = None,
+    hash_type: HashTypeStr = "sha256",
+    cache: "FileHashCache | None" = None,
+    strategy: FileReadStrategy = "buffered",
+) -> str:
+    """Same as `generate_file_hash`, but leaves cache writes buffered"""
     filename = str(filename)
+    if cache is not None:
+        stat_result = os.stat(filename)
+        cached_hash = cache.get(filename, hash_type=hash_type, stat_result=stat_result)
+        if cached_hash is not None:
+            return cached_hash
+
     h = hashlib.new(hash_type)
+    _update_hash_from_file(h, filename, bufsize=bufsize, strategy=strategy)
+    hash_value = h.hexdigest()
+
+    # Only cache the hash if the file did not change while it was read
+    if cache is not None and _get_stat_key(os.stat(filename)) == _get_stat_key(stat_result):
+        cache.put(filename, hash_value, hash_type=hash_type, stat_result=stat_result)
+    return hash_value
+
+
+def generate_file_hashes(
+    filename: str | Path,
+    hash_types: Sequence[FileHashTypeStr] = ("md5", "sha256"),
+    multipart_chunk_size: int | None = None,
+    bufsize: int | None = None,
+    strategy: FileReadStrategy = "buffered",
+) -> dict[FileHashTypeStr, str]:
+    """Generate several hashes for a file, reading it only once.
+
+    Besides hashlib digests, this supports CRC32 / CRC32C checksums (as 8 hex characters;
+    CRC32C requires the `crc32c` package) and "s3_etag", the ETag that S3 assigns to an
+    object uploaded with the given multipart chunk size.
+
+    Args:
+        filename (str|Path): filepath to hash
+        hash_types (Sequence[str], optional): types of hashes to generate.
+            Defaults to ("md5", "sha256").
+        multipart_chunk_size (int, optional): part size of a multipart upload, used for
+            "s3_etag". If None, the ETag of a single part upload (the MD5) is generated.
+            Defaults to None.
+        bufsize (int, optional): buffer size. Defaults to None (adaptive).
+        strategy (Literal["buffered", "mmap"], optional): how the file is read.
+            Defaults to "buffered".
+
+    Raises:
+        ValueError: if a hash type is not supported
+        ImportError: if "crc32c" is requested but the `crc32c` package is not installed
+
+    Returns:
+        mapping of hash type to hash value
+    """
+    hash_objs = {
+        hash_type: _new_file_hash(hash_type, multipart_chunk_size) for hash_type in hash_types
+    }
+    _update_hash_from_file(
+        _MultiHash(list(hash_objs.values())), str(filename), bufsize=bufsize, strategy=strategy
+    )
+    return {hash_type: hash_obj.hexdigest() for hash_type, hash_obj in hash_objs.items()}
+
+
+class _HexHash(_Hash, Protocol):
+    def hexdigest(self) -> str: ...
+
+
+def _new_file_hash(hash_type: FileHashTypeStr, multipart_chunk_size: int | None) -> _HexHash:
+    if hash_type == "s3_etag":
+        return _S3ETagHash(multipart_chunk_size)
+    elif hash_type == "crc32":
+        return _CRCHash(zlib.crc32)
+    elif hash_type == "crc32c":
+        try:
+            import crc32c  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError("crc32c checksums require the 'crc32c' package") from e
+        return _CRCHash(crc32c.crc32c)
+    elif hash_type in ("md5", "sha256", "sha1"):
+        return hashlib.new(hash_type)
+    raise ValueError(f"Unsupported hash type: {hash_type}")
+
+
+class _MultiHash:
+    """Feeds the same data into several hash objects"""
+
+    def __init__(self, hash_objs: Sequence[_Hash]):
+        self._hash_objs = hash_objs
 
-    buffer = bytearray(bufsize)
-    buffer_view = memoryview(buffer)
+    def update(self, data: bytes, /) -> None:
+        for hash_obj in self._hash_objs:
+            hash_obj.update(data)
+
+
+class _CRCHash:
+    """hashlib-like wrapper of a CRC function with a `func(data, value)` signature"""
+
+    def __init__(self, crc_func: Callable[[bytes, int], int]):
+        self._crc_func = crc_func
+        self._value = 0
+
+    def update(self, data: bytes, /) -> None:
+        self._value = self._crc_func(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+class _S3ETagHash:
+    """Computes the ETag of an S3 object uploaded in parts of a given size
+
+    The ETag of a multipart upload is the MD5 of the concatenated MD5 digests of all
+    parts, followed by "-" and the number of parts. Without a part size, this is the
+    ETag of a single part upload (the MD5 of the content).
+    """
+
+    def __init__(self, multipart_chunk_size: int | None):
+        if multipart_chunk_size is not None and multipart_chunk_size <= 0:
+            raise ValueError(f"Invalid multipart chunk size: {multipart_chunk_size}")
+        self._chunk_size = multipart_chunk_size
+        self._part_hash = hashlib.md5()
+        self._part_bytes = 0
+        self._part_digests: list[bytes] = []
+
+    def update(self, data: bytes, /) -> None:
+        if self._chunk_size is None:
+            self._part_hash.update(data)
+            return
+        view = memoryview(data)
+        while len(view):
+            if self._part_bytes == self._chunk_size:
+                self._part_digests.append(self._part_hash.digest())
+                self._part_hash = hashlib.md5()
+                self._part_bytes = 0
+            n = min(len(view), self._chunk_size - self._part_bytes)
+            self._part_hash.update(view[:n])
+            self._part_bytes += n
+            view = view[n:]
+
+    def hexdigest(self) -> str:
+        if self._chunk_size is None:
+            return self._part_hash.hexdigest()
+        digests = [*self._part_digests, self._part_hash.digest()]
+        return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def _update_hash_from_file(
+    hash_obj: _Hash, filename: str, bufsize: int | None, strategy: FileReadStrategy
+) -> None:
+    """Feeds the contents of a file into a hash object"""
     with open(filename, "rb", buffering=0) as f:
+        fd = f.fileno()
+        stat_result = os.fstat(fd)
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:  # pragma: no cover
+                pass
+
+        if strategy == "mmap" and stat_result.st_size:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    for start in range(0, len(view), FILE_HASH_MMAP_CHUNK_SIZE):
+                        with view[start : start + FILE_HASH_MMAP_CHUNK_SIZE] as chunk:
+                            hash_obj.update(chunk)
+            return
+
+        bufsize = bufsize or _get_file_bufsize(filename, stat_result)
+        buffer = bytearray(bufsize)
+        buffer_view = memoryview(buffer)
         while True:
-            n = f.readinto(buffer_view)  # type: ignore
+            n = f.readinto(buffer_view)
             if not n:
                 break
-            h.update(buffer_view[:n])
-    return h.hexdigest()
+            hash_obj.update(buffer_view[:n])
+
+
+def _get_file_bufsize(filename: str, stat_result: os.stat_result) -> int:
+    """Returns a page aligned buffer size suited to the file size and filesystem"""
+    if _is_network_filesystem(filename, stat_result.st_dev):
+        max_bufsize = FILE_HASH_NETWORK_BUFSIZE
+    else:
+        max_bufsize = FILE_HASH_LOCAL_BUFSIZE
+    # One extra byte so that files fitting in the buffer are read in a single call
+    size = stat_result.st_size + 1
+    return min(max_bufsize, -(-size // mmap.PAGESIZE) * mmap.PAGESIZE)
+
+
+_NETWORK_FILESYSTEM_DEVICES: dict[int, bool] = {}
+
+
+def _is_network_filesystem(path: str, st_dev: int) -> bool:
+    """Returns whether a path is on a network filesystem (cached per device)"""
+    is_network = _NETWORK_FILESYSTEM_DEVICES.get(st_dev)
+    if is_network is None:
+        real_path = os.path.realpath(path)
+        mount_points = [
+            (mount_point, fs_type)
+            for mount_point, fs_type in _get_mount_points()
+            if os.path.commonpath([mount_point, real_path]) == mount_point
+        ]
+        fs_type = max(mount_points, key=lambda _: len(_[0]))[1] if mount_points else ""
+        is_network = fs_type in NETWORK_FILESYSTEM_TYPES
+        _NETWORK_FILESYSTEM_DEVICES[st_dev] = is_network
+    return is_network
+
+
+@lru_cache
+def _get_mount_points() -> tuple[tuple[str, str], ...]:
+    """Returns (mount point, filesystem type) of all mounts (empty if unknown)"""
+    try:
+        with open("/proc/mounts") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return ()
+    mount_points = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 3:
+            # mount points escape whitespace as octal sequences (e.g. "\040")
+            mount_point = re.sub(r"\\([0-7]{3})", lambda m: chr(int(m[1], 8)), parts[1])
+            mount_points.append((mount_point, parts[2]))
+    return tuple(mount_points)
+
+
+FILE_HASH_CACHE_NAME = "file_hashes.sqlite3"
+FILE_HASH_CACHE_MAX_ENTRIES = 1_000_000
+# Approximate storage overhead of a cache entry, excluding path and hash value
+FILE_HASH_CACHE_ENTRY_OVERHEAD_BYTES = 64
+
+_FileHashCacheKey = tuple[str, str]
+_FileHashCacheRow = tuple[str, str, int, int, int, str, int, int]
+
+
+@dataclass
+class FileHashCache:
+    """Persistent cache of file hashes keyed on file metadata.
+
+    Hashes are stored in a SQLite database under `root`, one entry per (path, hash type).
+    An entry is only used if the size, mtime (ns) and inode of the file still match the
+    values recorded when it was hashed, so unchanged files are never read again.
+
+    New entries and access times of cache hits are buffered in memory and written in
+    batches of `batch_size`, on `flush` and when used as a context manager. SQLite file
+    locking is unreliable on network filesystems (EFS/NFS), so reads take a shared and
+    writes an exclusive `PathLock`. A single connection is opened per cache and reused
+    until `close` (or the end of the context). After each batch, least recently used
+    entries are evicted until the cache is within `max_entries` and `max_bytes`
+    (approximate size of entries).
+
+    Attributes:
+        root: directory in which the cache database is stored
+        max_entries: maximum number of entries. Defaults to FILE_HASH_CACHE_MAX_ENTRIES.
+        max_bytes: maximum approximate size of all entries. Defaults to None (no limit).
+        batch_size: number of buffered writes before they are flushed. Defaults to 256.
+    """
+
+    root: str | Path
+    max_entries: int | None = FILE_HASH_CACHE_MAX_ENTRIES
+    max_bytes: int | None = None
+    batch_size: int = 256
+
+    def __post_init__(self):
+        self._db_path = Path(self.root) / FILE_HASH_CACHE_NAME
+        self._pending: dict[_FileHashCacheKey, _FileHashCacheRow] = {}
+        self._accessed: dict[_FileHashCacheKey, int] = {}
+        # guards the buffers, which are shared by threads hashing files concurrently
+        self._buffer_lock = threading.Lock()
+        # guards the connection, which is shared by threads as well
+        self._connection_lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._write() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes ("
+                " path TEXT NOT NULL,"
+                " hash_type TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " inode INTEGER NOT NULL,"
+                " hash_value TEXT NOT NULL,"
+                " entry_bytes INTEGER NOT NULL,"
+                " last_used_ns INTEGER NOT NULL,"
+                " PRIMARY KEY (path, hash_type))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS file_hashes_last_used_ns ON file_hashes (last_used_ns)"
+            )
+
+    def __enter__(self) -> "FileHashCache":
+        return self
+
+    def __exit__(self, exec_type, exec_val, exec_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._read() as conn:
+            return conn.execute("SELECT COUNT(*) FROM file_hashes").fetchone()[0]
+
+    def get(
+        self,
+        path: str | Path,
+        hash_type: HashTypeStr = "sha256",
+        stat_result: os.stat_result | None = None,
+    ) -> str | None:
+        """Returns the cached hash of a file if the file has not changed since it was hashed
+
+        Args:
+            path (str | Path): file path
+            hash_type (Literal["md5", "sha256", "sha1"], optional): type of hash.
+                Defaults to "sha256".
+            stat_result (os.stat_result, optional): stat of the file, if already known.
+
+        Returns:
+            cached hash value or None
+        """
+        key = (os.path.abspath(path), hash_type)
+        stat_result = stat_result or os.stat(key[0])
+        row: Sequence[Any] | None = self._pending.get(key)
+        if row is None:
+            with self._read() as conn:
+                row = conn.execute(
+                    "SELECT * FROM file_hashes WHERE path = ? AND hash_type = ?", key
+                ).fetchone()
+        if row is None or tuple(row[2:5]) != _get_stat_key(stat_result):
+            return None
+        with self._buffer_lock:
+            self._accessed[key] = time.time_ns()
+        self._flush_if_full()
+        return row[5]
+
+    def put(
+        self,
+        path: str | Path,
+        hash_value: str,
+        hash_type: HashTypeStr = "sha256",
+        stat_result: os.stat_result | None = None,
+    ):
+        """Saves the hash of a file along with its current size, mtime and inode
+
+        Args:
+            path (str | Path): file path
+            hash_value (str): hash of the file
+            hash_type (Literal["md5", "sha256", "sha1"], optional): type of hash.
+                Defaults to "sha256".
+            stat_result (os.stat_result, optional): stat of the file when it was hashed.
+        """
+        path = os.path.abspath(path)
+        size, mtime_ns, inode = _get_stat_key(stat_result or os.stat(path))
+        entry_bytes = len(path) + len(hash_value) + FILE_HASH_CACHE_ENTRY_OVERHEAD_BYTES
+        row = (path, hash_type, size, mtime_ns, inode, hash_value, entry_bytes, time.time_ns())
+        with self._buffer_lock:
+            self._pending[(path, hash_type)] = row
+        self._flush_if_full()
+
+    def close(self):
+        """Flushes buffered writes and closes the connection (reopened if the cache is used)"""
+        self.flush()
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def flush(self):
+        """Writes buffered entries and access times and evicts entries over the limits"""
+        if self._pending or self._accessed:
+            with self._write() as conn:
+                self._evict(conn)
+
+    def evict(self) -> int:
+        """Evicts least recently used entries until the cache is within its limits
+
+        Returns:
+            number of entries evicted
+        """
+        with self._write() as conn:
+            return self._evict(conn)
+
+    def clear(self):
+        """Removes all entries from the cache"""
+        with self._write() as conn:
+            conn.execute("DELETE FROM file_hashes")
+
+    def _flush_if_full(self):
+        if len(self._pending) + len(self._accessed) >= self.batch_size:
+            self.flush()
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        num_entries, num_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(entry_bytes), 0) FROM file_hashes"
+        ).fetchone()
+        excess_entries = max(num_entries - self.max_entries, 0) if self.max_entries else 0
+        excess_bytes = max(num_bytes - self.max_bytes, 0) if self.max_bytes else 0
+        if not excess_entries and not excess_bytes:
+            return 0
+
+        to_evict = excess_entries
+        if excess_bytes:
+            # Find how many of the least recently used entries cover the excess bytes
+            evicted_bytes = 0
+            for i, (entry_bytes,) in enumerate(
+                conn.execute("SELECT entry_bytes FROM file_hashes ORDER BY last_used_ns"),
+                start=1,
+            ):
+                evicted_bytes += entry_bytes
+                if evicted_bytes >= excess_bytes:
+                    to_evict = max(to_evict, i)
+                    break
+        conn.execute(
+            "DELETE FROM file_hashes WHERE rowid IN"
+            " (SELECT rowid FROM file_hashes ORDER BY last_used_ns LIMIT ?)",
+            (to_evict,),
+        )
+        logger.debug(f"Evicted {to_evict} entries from {self._db_path}")
+        return to_evict
+
+    @contextmanager
+    def _connect(self, shared: bool) -> Iterator[sqlite3.Connection]:
+        """Locks the database (shared for reads) and yields the connection of this cache"""
+        with self._connection_lock, PathLock(self._db_path, shared=shared):
+            if self._connection is None:
+                self._connection = sqlite3.connect(
+                    self._db_path, timeout=60, check_same_thread=False
+                )
+            yield self._connection
+
+    def _read(self) -> AbstractContextManager[sqlite3.Connection]:
+        return self._connect(shared=True)
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._connect(shared=False) as conn, conn:
+            with self._buffer_lock:
+                pending, self._pending = self._pending, {}
+                accessed, self._accessed = self._accessed, {}
+            if pending:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    pending.values(),
+                )
+            if accessed:
+                conn.executemany(
+                    "UPDATE file_hashes SET last_used_ns = ? WHERE path = ? AND hash_type = ?",
+                    ((last_used_ns, *key) for key, last_used_ns in accessed.items()),
+                )
+            yield conn
+
+
+def _get_stat_key(stat_result: os.stat_result) -> tuple[int, int, int]:
+    return stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino
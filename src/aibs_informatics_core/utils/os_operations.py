@@ -1,6 +1,7 @@
 __all__ = [
     "expandvars",
     "find_all_paths",
+    "iter_paths",
     "get_env_var",
     "set_env_var",
     "to_env_var_dict",
@@ -17,13 +18,16 @@ __all__ = [
     "EnvVarCollection",
 ]
 
+import errno
 import os
 import re
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from re import Pattern
 from typing import (
     Any,
     Literal,
@@ -33,6 +37,9 @@ from typing import (
     overload,
 )
 
+# Number of times listing a directory is retried when it fails with a stale file handle
+SCANDIR_ESTALE_RETRIES = 3
+
 
 def expandvars(path, default=None, skip_escaped=False):
     """Expand environment variables of form $var and ${var}.
@@ -50,7 +57,10 @@ def expandvars(path, default=None, skip_escaped=False):
 
 
 def find_all_paths(
-    root: str | Path, include_dirs: bool = True, include_files: bool = True
+    root: str | Path,
+    include_dirs: bool = True,
+    include_files: bool = True,
+    max_workers: int | None = None,
 ) -> list[str]:
     """Find all paths below root path
 
@@ -58,19 +68,177 @@ def find_all_paths(
         root (str | Path): root path to start
         include_dirs (bool, optional): Whether to include directories. Defaults to True.
         include_files (bool, optional): whether to include files. Defaults to True.
+        max_workers (int, optional): If greater than 1, directories are read in a thread
+            pool of this size. Defaults to None (sequential).
     Returns:
         list of paths found under root
     """
-    paths = []
+    return list(
+        iter_paths(
+            root, include_dirs=include_dirs, include_files=include_files, max_workers=max_workers
+        )
+    )
+
+
+@overload
+def iter_paths(
+    root: str | Path,
+    include_dirs: bool = True,
+    include_files: bool = True,
+    excludes: Sequence[Pattern | str] | None = None,
+    with_stat: Literal[False] = False,
+    max_workers: int | None = None,
+) -> Iterator[str]: ...  # pragma: no cover
+
+
+@overload
+def iter_paths(
+    root: str | Path,
+    include_dirs: bool = True,
+    include_files: bool = True,
+    excludes: Sequence[Pattern | str] | None = None,
+    *,
+    with_stat: Literal[True],
+    max_workers: int | None = None,
+) -> Iterator[tuple[str, os.stat_result | None]]: ...  # pragma: no cover
+
+
+def iter_paths(
+    root: str | Path,
+    include_dirs: bool = True,
+    include_files: bool = True,
+    excludes: Sequence[Pattern | str] | None = None,
+    with_stat: bool = False,
+    max_workers: int | None = None,
+) -> Iterator[str] | Iterator[tuple[str, os.stat_result | None]]:
+    """Iterate over all paths below root path, without listing them all up front
+
+    Paths are yielded in the same order as `os.walk` (top down, directories before files
+    of each directory) and symlinks to directories are not followed. Directories that
+    cannot be listed are skipped (listings failing with ESTALE are retried first).
+
+    Args:
+        root (str | Path): root path to start
+        include_dirs (bool, optional): Whether to include directories. Defaults to True.
+        include_files (bool, optional): whether to include files. Defaults to True.
+        excludes (Sequence[Pattern | str], optional): regex patterns of paths to exclude.
+            Excluded directories are pruned: nothing below them is visited.
+            Defaults to None.
+        with_stat (bool, optional): If True, yields (path, stat) tuples. Stats come from
+            the directory entries (following symlinks) and are None if the path could not
+            be stat'ed (e.g. removed while iterating). Defaults to False.
+        max_workers (int, optional): If greater than 1, directories (and stats) are read
+            ahead of iteration in a thread pool of this size. This hides the per request
+            latency of network filesystems (EFS/NFS). Paths are still yielded in the same
+            order. Defaults to None (sequential).
+
+    Yields:
+        paths (or (path, stat) tuples) found under root
+    """
     str_root = str(root) if isinstance(root, Path) else root
-    if os.path.isfile(str_root) and include_files:
-        paths.append(str_root)
-    for parent, dirs, files in os.walk(str_root):
-        if include_dirs:
-            paths.extend([os.path.join(parent, name) for name in dirs])
-        if include_files:
-            paths.extend([os.path.join(parent, name) for name in files])
-    return paths
+    exclude_patterns = [re.compile(exclude) for exclude in excludes or []]
+
+    if os.path.isfile(str_root):
+        if include_files and not any(_.fullmatch(str_root) for _ in exclude_patterns):
+            yield (str_root, _get_stat(str_root)) if with_stat else str_root
+        return
+
+    def list_dir(path: str) -> tuple[list[os.DirEntry], list[os.DirEntry]]:
+        dir_entries, file_entries = _scandir(path, exclude_patterns)
+        selected_entries = (dir_entries if include_dirs else []) + (
+            file_entries if include_files else []
+        )
+        if with_stat:
+            # read stats here (in a worker thread when reading ahead), entries cache them
+            for entry in selected_entries:
+                _get_stat(entry)
+        return dir_entries, selected_entries
+
+    for _, selected_entries in _iter_dir_listings(str_root, list_dir, max_workers):
+        for entry in selected_entries:
+            yield (entry.path, _get_stat(entry)) if with_stat else entry.path
+
+
+_DirListing = tuple[list[os.DirEntry], list[os.DirEntry]]
+
+
+def _iter_dir_listings(
+    root: str, list_dir: Callable[[str], _DirListing], max_workers: int | None
+) -> Iterator[_DirListing]:
+    """Yields listings of root and all directories below it in os.walk order
+
+    Args:
+        root (str): root directory
+        list_dir (Callable): returns the directory entries to descend into and the entries
+            to yield for a directory
+        max_workers (int, optional): If greater than 1, the listings of the next directories
+            to be visited are read ahead in a thread pool of this size.
+    """
+    # Directories are visited depth first, in listing order (same as os.walk)
+    if not max_workers or max_workers <= 1:
+        pending_dirs = [root]
+        while pending_dirs:
+            listing = list_dir(pending_dirs.pop())
+            yield listing
+            pending_dirs.extend(
+                entry.path for entry in reversed(listing[0]) if not _is_symlink(entry)
+            )
+        return
+
+    # Stack of directories to visit, with futures of their listings once submitted. Only
+    # the directories visited next are read ahead, which bounds memory use.
+    read_ahead = 4 * max_workers
+    pending: list[tuple[str, Future[_DirListing] | None]] = [(root, None)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            for i in range(len(pending) - 1, max(len(pending) - 1 - read_ahead, -1), -1):
+                path, future = pending[i]
+                if future is None:
+                    pending[i] = (path, executor.submit(list_dir, path))
+            listing = cast(Future[_DirListing], pending.pop()[1]).result()
+            yield listing
+            pending.extend(
+                (entry.path, None) for entry in reversed(listing[0]) if not _is_symlink(entry)
+            )
+
+
+def _scandir(
+    path: str, exclude_patterns: list[Pattern], estale_retries: int = SCANDIR_ESTALE_RETRIES
+) -> _DirListing:
+    """Returns directory and file entries of a directory, skipping excluded paths"""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        # Stale file handles on NFS are often transient, try again if the path still exists
+        if e.errno == errno.ESTALE and estale_retries > 0 and os.path.exists(path):
+            return _scandir(path, exclude_patterns, estale_retries - 1)
+        return [], []
+    dir_entries: list[os.DirEntry] = []
+    file_entries: list[os.DirEntry] = []
+    for entry in entries:
+        if exclude_patterns and any(_.fullmatch(entry.path) for _ in exclude_patterns):
+            continue
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        (dir_entries if is_dir else file_entries).append(entry)
+    return dir_entries, file_entries
+
+
+def _get_stat(path: str | os.DirEntry) -> os.stat_result | None:
+    try:
+        return path.stat() if isinstance(path, os.DirEntry) else os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_symlink(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_symlink()
+    except OSError:
+        return False
 
 
 @overload
@@ -1,3 +1,5 @@
+import gzip
+import io
 import json
 import uuid
 from datetime import datetime
@@ -7,10 +9,12 @@ from tempfile import TemporaryDirectory
 import pytest
 import yaml
 from aibs_informatics_test_resources import does_not_raise
+from pydantic import field_validator
 
 from aibs_informatics_core.exceptions import ValidationError
 from aibs_informatics_core.models.base._pydantic_fields import IsoDateTime
 from aibs_informatics_core.models.base._pydantic_model import PydanticBaseModel
+from test.base import run_benchmark
 
 
 class Empty(PydanticBaseModel):
@@ -266,6 +270,204 @@ def test__PydanticBaseModel__to_path__from_path():
     assert new_model == model
 
 
+def test__PydanticBaseModel__to_path__from_path__compressed():
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "model.json.gz"
+        model = SimpleNested(empty=Empty(), required_simple=Simple(str_value="s", int_value=1))
+        model.to_path(path)
+        assert gzip.decompress(path.read_bytes()).startswith(b"{")
+        new_model = SimpleNested.from_path(path)
+    assert new_model == model
+
+
+def test__PydanticBaseModel__from_path__raises_validation_error():
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "model.json"
+        path.write_text(json.dumps({"str_value": 1}))
+        with pytest.raises(ValidationError):
+            Simple.from_path(path)
+
+
+def test__PydanticBaseModel__from_path__uses_custom_from_dict():
+    class CustomSimple(Simple):
+        @classmethod
+        def from_dict(cls, data, **kwargs):
+            return super().from_dict({**data, "int_value": 2}, **kwargs)
+
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "model.json"
+        path.write_text(json.dumps({"str_value": "s", "int_value": 1}))
+        new_model = CustomSimple.from_path(path)
+    assert new_model.int_value == 2
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        pytest.param("models.jsonl", id="jsonl"),
+        pytest.param("models.jsonl.gz", id="jsonl.gz"),
+        pytest.param("models.json", id="json list"),
+        pytest.param("models.json.gz", id="json.gz list"),
+    ],
+)
+def test__PydanticBaseModel__many_to_path__iter_from_path(filename: str):
+    models = [Simple(str_value=f"s{i}", int_value=i) for i in range(5)]
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / filename
+        Simple.many_to_path((_ for _ in models), path)
+        new_models = list(Simple.iter_from_path(path))
+    assert new_models == models
+
+
+def test__PydanticBaseModel__from_path__jsonl_raises_error():
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "models.jsonl"
+        Simple(str_value="s", int_value=1).to_path(path)
+        assert list(Simple.iter_from_path(path)) == [Simple(str_value="s", int_value=1)]
+        with pytest.raises(ValueError):
+            Simple.from_path(path)
+
+
+def test__PydanticBaseModel__iter_from_path__non_list_raises_error():
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "models.yaml"
+        path.write_text(yaml.safe_dump({"str_value": "s", "int_value": 1}))
+        with pytest.raises(ValueError):
+            list(Simple.iter_from_path(path))
+
+
+# ------------------------------------------------------------------
+#                  is_valid
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "model_cls, data, kwargs, expected",
+    [
+        pytest.param(Simple, {"str_value": "s", "int_value": 1}, {}, True, id="valid"),
+        pytest.param(Simple, {"strValue": "s", "intValue": "1"}, {}, True, id="valid aliases"),
+        pytest.param(Simple, {"str_value": "s"}, {}, False, id="missing field"),
+        pytest.param(Simple, {"str_value": 1, "int_value": 1}, {}, False, id="wrong type"),
+        pytest.param(Simple, "not a dict", {}, False, id="not a dict"),
+        pytest.param(
+            Simple, {"str_value": "s", "int_value": "1"}, {"strict": True}, False, id="strict"
+        ),
+        pytest.param(
+            Simple, {"str_value": "s", "int_value": 1}, {"partial": True}, True, id="extra kwargs"
+        ),
+        pytest.param(
+            SimpleNested,
+            {"empty": {}, "required_simple": {"str_value": "s"}},
+            {},
+            False,
+            id="invalid nested",
+        ),
+    ],
+)
+def test__PydanticBaseModel__is_valid(model_cls, data, kwargs, expected):
+    assert model_cls.is_valid(data, **kwargs) == expected
+
+
+def test__PydanticBaseModel__is_valid__uses_custom_from_dict():
+    class CustomSimple(Simple):
+        @classmethod
+        def from_dict(cls, data, **kwargs):
+            if data.get("str_value") == "forbidden":
+                raise ValueError("forbidden")
+            return super().from_dict(data, **kwargs)
+
+    assert CustomSimple.is_valid({"str_value": "allowed", "int_value": 1})
+    assert not CustomSimple.is_valid({"str_value": "forbidden", "int_value": 1})
+
+
+# ------------------------------------------------------------------
+#                  iter_from_jsonl / write_jsonl
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test__PydanticBaseModel__write_jsonl__iter_from_jsonl__path(max_workers):
+    models = [Simple(str_value=f"s{i}", int_value=i) for i in range(25)]
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "models.jsonl.gz"
+        Simple.write_jsonl((_ for _ in models), path)
+        new_models = list(Simple.iter_from_jsonl(path, max_workers=max_workers, chunk_size=4))
+    assert new_models == models
+
+
+def test__PydanticBaseModel__write_jsonl__iter_from_jsonl__binary_stream():
+    models = [
+        SimpleNested(empty=Empty(), required_simple=Simple(str_value="a", int_value=1)),
+        SimpleNested(empty=Empty(), required_simple=Simple(str_value="b", int_value=2)),
+    ]
+    stream = io.BytesIO()
+    SimpleNested.write_jsonl(models, stream)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    # exclude_none=True by default
+    assert "optional_simple" not in json.loads(lines[0])
+
+    stream.seek(0)
+    assert list(SimpleNested.iter_from_jsonl(stream)) == models
+
+
+def test__PydanticBaseModel__write_jsonl__iter_from_jsonl__text_stream():
+    models = [Simple(str_value="a", int_value=1), Simple(str_value="b", int_value=2)]
+    stream = io.StringIO()
+    Simple.write_jsonl(models, stream, by_alias=True)
+    assert json.loads(stream.getvalue().splitlines()[0]) == {"strValue": "a", "intValue": 1}
+
+    stream = io.StringIO(stream.getvalue() + "\n\n")
+    assert list(Simple.iter_from_jsonl(stream)) == models
+
+
+def test__PydanticBaseModel__write_jsonl__iter_from_jsonl__subclass_instances():
+    models = [
+        SimpleChild(str_value="a", int_value=1, bool_value=True),
+        SimpleChild(str_value="b", int_value=2, bool_value=False),
+    ]
+    stream = io.BytesIO()
+    Simple.write_jsonl(models, stream)
+    assert json.loads(stream.getvalue().splitlines()[0]) == {
+        "str_value": "a",
+        "int_value": 1,
+        "bool_value": True,
+    }
+
+    stream.seek(0)
+    assert list(SimpleChild.iter_from_jsonl(stream)) == models
+
+    with TemporaryDirectory("w") as tmpdir:
+        path = Path(tmpdir) / "models.jsonl"
+        Simple.many_to_path(models, path)
+        assert list(SimpleChild.iter_from_path(path)) == models
+
+
+def test__PydanticBaseModel__iter_from_jsonl__reports_invalid_line():
+    stream = io.BytesIO(b'{"str_value": "a", "int_value": 1}\n{"str_value": "b"}\n')
+    models = Simple.iter_from_jsonl(stream)
+    assert next(models) == Simple(str_value="a", int_value=1)
+    with pytest.raises(ValidationError, match="line 2"):
+        next(models)
+
+
+def test__PydanticBaseModel__write_jsonl__iter_from_jsonl__custom_from_dict_to_dict():
+    class CustomSimple(Simple):
+        @classmethod
+        def from_dict(cls, data, **kwargs):
+            return super().from_dict({**data, "int_value": data["int_value"] + 1}, **kwargs)
+
+        def to_dict(self, **kwargs):
+            return {**super().to_dict(**kwargs), "extra": True}
+
+    stream = io.BytesIO()
+    CustomSimple.write_jsonl([CustomSimple(str_value="a", int_value=1)], stream)
+    assert json.loads(stream.getvalue()) == {"str_value": "a", "int_value": 1, "extra": True}
+
+    stream.seek(0)
+    assert list(CustomSimple.iter_from_jsonl(stream)) == [CustomSimple(str_value="a", int_value=2)]
+
+
 # ------------------------------------------------------------------
 #                  from_json / to_json
 # ------------------------------------------------------------------
@@ -414,3 +616,164 @@ def test__PydanticBaseModel__to_dict__mode_and_exclude_none_defaults():
     # override exclude_none
     result_with_none = model.to_dict(exclude_none=False)
     assert "optional_simple" in result_with_none
+
+
+# ------------------------------------------------------------------
+#                  from_dict_lazy / from_json_lazy
+# ------------------------------------------------------------------
+
+
+def test__PydanticBaseModel__from_dict_lazy__validates_lazy_fields_on_access():
+    data = {
+        "empty": {},
+        "requiredSimple": {"strValue": "s", "intValue": "1"},
+    }
+    model = SimpleNested.from_dict_lazy(data, lazy_fields=["required_simple"])
+    assert isinstance(model, SimpleNested)
+    assert model.is_lazy
+    assert model.__dict__["required_simple"] == {"strValue": "s", "intValue": "1"}
+
+    assert model.required_simple == Simple(str_value="s", int_value=1)
+    assert model.required_simple is model.required_simple
+    assert not model.is_lazy
+
+
+def test__PydanticBaseModel__from_dict_lazy__defers_validation_errors():
+    data = {"empty": {}, "required_simple": {"str_value": "s", "int_value": "not-an-int"}}
+    with pytest.raises(ValidationError):
+        SimpleNested.from_dict(data)
+
+    model = SimpleNested.from_dict_lazy(data, lazy_fields=["required_simple"])
+    assert model.empty == Empty()
+    with pytest.raises(ValidationError):
+        model.required_simple
+    with pytest.raises(ValidationError):
+        model.validate_lazy_fields()
+
+
+def test__PydanticBaseModel__from_dict_lazy__validate_lazy_fields_and_to_dict():
+    expected = SimpleCollection(
+        simples=[Simple(str_value="a", int_value=1), Simple(str_value="b", int_value=2)]
+    )
+    data = {"simples": [{"strValue": "a", "intValue": 1}, {"str_value": "b", "int_value": 2}]}
+
+    model = SimpleCollection.from_dict_lazy(data)
+    assert model.to_dict() == expected.to_dict()
+    assert model.is_lazy
+
+    validated_model = model.validate_lazy_fields()
+    assert type(validated_model) is SimpleCollection
+    assert not validated_model.is_lazy
+    assert validated_model == expected
+    assert expected.validate_lazy_fields() is expected
+
+
+def test__PydanticBaseModel__from_json_lazy():
+    model = ComplexNested.from_json_lazy(
+        json.dumps(
+            {
+                "required": {
+                    "uuid_value": "dfe7b672-91e0-4c2d-ac06-30dd1ac2eb96",
+                    "dt_value": "2022-03-11T08:23:51.248794+00:00",
+                }
+            }
+        ),
+        lazy_fields=["required", "optional"],
+    )
+    assert model.optional is None
+    assert model.required.uuid_value == uuid.UUID("dfe7b672-91e0-4c2d-ac06-30dd1ac2eb96")
+
+
+def test__PydanticBaseModel__from_dict_lazy__unknown_field_raises_error():
+    with pytest.raises(ValueError):
+        Simple.from_dict_lazy({"str_value": "s", "int_value": 1}, lazy_fields=["unknown"])
+
+
+class FieldValidated(PydanticBaseModel):
+    simple: Simple
+    names: list[str]
+
+    @field_validator("names")
+    @classmethod
+    def upper_names(cls, v: list[str]) -> list[str]:
+        return [_.upper() for _ in v]
+
+
+def test__PydanticBaseModel__from_dict_lazy__field_validator_raises_error():
+    data = {"simple": {"str_value": "s", "int_value": 1}, "names": ["a"]}
+    with pytest.raises(ValueError):
+        FieldValidated.from_dict_lazy(data, lazy_fields=["names"])
+
+
+def test__PydanticBaseModel__from_dict_lazy__skips_fields_with_validators_by_default():
+    data = {"simple": {"str_value": "s", "int_value": 1}, "names": ["a", "b"]}
+    model = FieldValidated.from_dict_lazy(data)
+    assert model.__dict__["names"] == ["A", "B"]
+    assert model.__dict__["simple"] == {"str_value": "s", "int_value": 1}
+    assert model.simple == Simple(str_value="s", int_value=1)
+    assert model.validate_lazy_fields() == FieldValidated.from_dict(data)
+
+
+def test__PydanticBaseModel__from_dict_lazy__validate_lazy_fields_skips_eager_fields():
+    calls: list[list[str]] = []
+
+    class CountingFieldValidated(PydanticBaseModel):
+        simple: Simple
+        other: Simple
+        names: list[str]
+
+        @field_validator("names")
+        @classmethod
+        def count_names(cls, v: list[str]) -> list[str]:
+            calls.append(v)
+            return v
+
+    data = {
+        "simple": {"str_value": "s", "int_value": 1},
+        "other": {"str_value": "o", "int_value": 2},
+        "names": ["a", "b"],
+    }
+    model = CountingFieldValidated.from_dict_lazy(data)
+    assert model.simple == Simple(str_value="s", int_value=1)
+    assert len(calls) == 1
+
+    validated_model = model.validate_lazy_fields()
+    assert len(calls) == 1
+    assert type(validated_model) is CountingFieldValidated
+    assert validated_model == CountingFieldValidated.from_dict(data)
+    assert validated_model.model_fields_set == {"simple", "other", "names"}
+
+
+# ------------------------------------------------------------------
+#                  from_dict / to_dict call overhead
+# ------------------------------------------------------------------
+
+
+def test__PydanticBaseModel__accepted_kwargs__resolved_per_class():
+    assert Simple._model_validate_kwargs is not None
+    assert "strict" in Simple._model_validate_kwargs
+    assert Simple._model_dump_kwargs is not None
+    assert {"mode", "exclude_none", "include"}.issubset(Simple._model_dump_kwargs)
+    assert "self" not in Simple._model_dump_kwargs
+
+
+@pytest.mark.benchmark
+def test__PydanticBaseModel__from_dict__to_dict__benchmark():
+    """Micro-benchmark: overhead of from_dict/to_dict over raw pydantic calls"""
+    model = Simple(str_value="s", int_value=1)
+    data = model.to_dict()
+    assert Simple.from_dict(data) == Simple.model_validate(data)
+    assert model.to_dict() == model.model_dump(mode="json", exclude_none=True)
+
+    run_benchmark(
+        "from_dict / to_dict",
+        {
+            "from_dict": lambda: Simple.from_dict(data),
+            "model_validate": lambda: Simple.model_validate(data),
+            "to_dict": lambda: model.to_dict(),
+            "model_dump": lambda: model.model_dump(mode="json", exclude_none=True),
+            "to_dict(**kwargs)": lambda: model.to_dict(by_alias=True, partial=True),
+        },
+        number=2000,
+        repeat=5,
+    )
@@ -1,6 +1,16 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
 from pytest import mark, param, raises
 
-from aibs_informatics_core.models.demand_execution.job_param import JobParam, JobParamRef
+from aibs_informatics_core.models.demand_execution.job_param import (
+    JobParam,
+    JobParamRef,
+    UploadableJobParam,
+)
 
 
 @mark.parametrize(
@@ -63,3 +73,77 @@ def test__JobParam__find_references__works():
     actual = JobParam("param_a", "foo").find_references()
     expected = []
     assert actual == expected
+
+
+def test__JobParam__find_reference_envnames__works():
+    assert JobParam("param_a", "${param_b}_${Param_c}_${param_b}").find_reference_envnames() == {
+        "PARAM_B",
+        "PARAM_C",
+    }
+    assert JobParam("param_a", "foo").find_reference_envnames() == set()
+    assert UploadableJobParam("param_a", "${a}", "s3://${b}").find_reference_envnames() == {
+        "A",
+        "B",
+    }
+
+
+def test__JobParam__as_envname__is_memoized():
+    assert JobParam.as_envname("param-a") is JobParam.as_envname("param-a")
+    assert JobParam.as_envname("param-a") == JobParam.as_envname("PARAM_A") == "PARAM_A"
+
+
+def test__JobParam__envname__cached_until_name_changes():
+    job_param = JobParam("param-a", "foo")
+    envname = job_param.envname
+
+    assert envname == "PARAM_A"
+    assert job_param.envname is envname
+
+    job_param.name = "param-b"
+    assert job_param.envname == "PARAM_B"
+    assert job_param == JobParam("param-b", "foo")
+
+
+def test__JobParam__hash__does_not_collide_across_field_boundaries():
+    assert hash(JobParam("ab", "c")) != hash(JobParam("a", "bc"))
+    assert hash(UploadableJobParam("a", "bc", "d")) != hash(UploadableJobParam("ab", "c", "d"))
+    assert len({JobParam("ab", "c"), JobParam("a", "bc"), JobParam("ab", "c")}) == 2
+
+
+def test__JobParam__hash__cached_and_invalidated_on_mutation():
+    job_param = UploadableJobParam("param_a", "${param_b}", "s3://bucket/${param_b}")
+    original_hash = hash(job_param)
+    assert hash(job_param) == original_hash
+
+    job_param.replace_references({"PARAM_B": "foo"})
+
+    assert hash(job_param) == hash(UploadableJobParam("param_a", "foo", "s3://bucket/foo"))
+    assert hash(job_param) != original_hash
+    assert job_param in {UploadableJobParam("param_a", "foo", "s3://bucket/foo")}
+
+
+def test__JobParam__pickle__does_not_carry_cached_hash():
+    # Pickle a hashed param in a process with a different str hash seed
+    code = (
+        "import pickle, sys\n"
+        "from aibs_informatics_core.models.demand_execution.job_param import JobParam\n"
+        "job_param = JobParam('param-a', 'value')\n"
+        "hash(job_param), job_param.envname\n"
+        "sys.stdout.buffer.write(pickle.dumps(job_param))\n"
+    )
+    pickled = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+        capture_output=True,
+        check=True,
+    ).stdout
+
+    job_param = pickle.loads(pickled)
+    assert "_hash" not in job_param.__dict__
+    assert job_param in {JobParam("param-a", "value")}
+    assert job_param.envname == "PARAM_A"
+
+    hash(job_param)
+    copied = copy.copy(job_param)
+    assert "_hash" not in copied.__dict__
+    assert copied == job_param
@@ -116,3 +116,48 @@ def test__JobParamResolver__resolve_references__behaves_as_intended(
         actual = JobParamResolver.resolve_references(job_params)
     if expected is not None:
         assert actual == expected
+
+
+@mark.parametrize(
+    "job_params, expected_message",
+    [
+        param(
+            [JobParam("param_a", "${param_a}")],
+            "PARAM_A -> PARAM_A",
+            id="self reference",
+        ),
+        param(
+            [
+                JobParam("param_x", "${param_a}"),
+                JobParam("param_a", "${param_b}"),
+                JobParam("param_b", "${param_c}"),
+                JobParam("param_c", "${param_a}"),
+            ],
+            "PARAM_A -> PARAM_B -> PARAM_C -> PARAM_A",
+            id="cycle with dependent",
+        ),
+        param(
+            [JobParam("param_a", "${param_b}")],
+            "reference params that do not exist: {'PARAM_A': {'PARAM_B'}}",
+            id="missing reference",
+        ),
+    ],
+)
+def test__JobParamResolver__resolve_references__error_reports_cause(
+    job_params: list[JobParam], expected_message: str
+):
+    with raises(ValidationError, match=expected_message):
+        JobParamResolver.resolve_references(job_params)
+
+
+def test__JobParamResolver__resolve_references__resolves_long_chain_without_mutating_inputs():
+    job_params = [JobParam("param_0", "0")] + [
+        JobParam(f"param_{i}", f"${{param_{i - 1}}}/{i}") for i in range(1, 500)
+    ]
+    job_params.reverse()
+
+    actual = JobParamResolver.resolve_references(job_params)
+
+    assert actual[0] == JobParam("param_499", "/".join(map(str, range(500))))
+    assert actual[-1] is job_params[-1]
+    assert job_params[0] == JobParam("param_499", "${param_498}/499")
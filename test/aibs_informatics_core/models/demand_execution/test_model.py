@@ -5,7 +5,10 @@ from pytest import mark, param
 
 from aibs_informatics_core.models.aws.s3 import S3Path
 from aibs_informatics_core.models.demand_execution.metadata import DemandExecutionMetadata
-from aibs_informatics_core.models.demand_execution.model import DemandExecution
+from aibs_informatics_core.models.demand_execution.model import (
+    DemandExecution,
+    dedupe_executions,
+)
 from aibs_informatics_core.models.demand_execution.parameters import DemandExecutionParameters
 from aibs_informatics_core.models.demand_execution.platform import (
     AWSBatchExecutionPlatform,
@@ -13,6 +16,7 @@ from aibs_informatics_core.models.demand_execution.platform import (
 )
 from aibs_informatics_core.models.demand_execution.resolvables import Uploadable
 from aibs_informatics_core.models.unique_ids import UniqueID
+from aibs_informatics_core.utils.hashing import sha256_hexdigest
 
 THIS_UUID = UniqueID.create()
 ANOTHER_UUID = UniqueID.create()
@@ -205,6 +209,99 @@ def test__DemandExecution__get_execution_hash__behaves_as_intended(
         assert this_strict_hash != that_strict_hash
 
 
+def test__DemandExecution__get_execution_hash__matches_hash_of_components():
+    demand_execution = get_any_demand_execution(
+        execution_parameters=DemandExecutionParameters(
+            command=["my_exe", "${a}"],
+            params={f"param_{i}": f"value_{i}" for i in range(1000)} | {"a": "b"},
+            inputs=["a"],
+        )
+    )
+    parameters = demand_execution.execution_parameters
+
+    assert demand_execution.get_execution_hash(False) == sha256_hexdigest(
+        [demand_execution.execution_type, demand_execution.execution_image, ["my_exe", "${a}"]]
+    )
+    assert demand_execution.get_execution_hash(True) == sha256_hexdigest(
+        [
+            demand_execution.execution_type,
+            demand_execution.execution_image,
+            parameters.command,
+            demand_execution.execution_id,
+            parameters.sanitize_serialized_params(parameters.params),
+            parameters.inputs,
+            parameters.outputs,
+        ]
+    )
+
+
+def test__DemandExecution__get_execution_hash__reflects_changes():
+    demand_execution = get_any_demand_execution(
+        execution_parameters=DemandExecutionParameters(command=["my_exe"], params={"a": "a"})
+    )
+    original_hash = demand_execution.get_execution_hash()
+    assert demand_execution.get_execution_hash() == original_hash
+
+    demand_execution.execution_parameters.update_params(a="b")
+    updated_hash = demand_execution.get_execution_hash()
+    assert updated_hash != original_hash
+
+    demand_execution.execution_parameters.command.append("--flag")
+    assert demand_execution.get_execution_hash() != updated_hash
+
+    demand_execution.execution_id = str(ANOTHER_UUID)
+    assert demand_execution.get_execution_hash(False) == get_any_demand_execution(
+        execution_parameters=DemandExecutionParameters(command=["my_exe", "--flag"])
+    ).get_execution_hash(False)
+
+
+def test__DemandExecution__get_execution_hash__reflects_in_place_edits():
+    demand_execution = get_any_demand_execution(
+        execution_parameters=DemandExecutionParameters(command=["my_exe"], params={"a": "a"})
+    )
+    other_execution = demand_execution.model_copy(deep=True)
+    original_hash = demand_execution.get_execution_hash()
+    assert demand_execution == other_execution
+
+    demand_execution.execution_parameters.params["a"] = "b"
+    assert demand_execution.get_execution_hash() != original_hash
+    assert (
+        demand_execution.get_execution_hash()
+        == get_any_demand_execution(
+            execution_parameters=DemandExecutionParameters(command=["my_exe"], params={"a": "b"})
+        ).get_execution_hash()
+    )
+    assert list(dedupe_executions([demand_execution, other_execution])) == [
+        demand_execution,
+        other_execution,
+    ]
+
+    demand_execution.execution_parameters.inputs.append("a")
+    assert (
+        demand_execution.get_execution_hash()
+        == get_any_demand_execution(
+            execution_parameters=DemandExecutionParameters(
+                command=["my_exe"], params={"a": "b"}, inputs=["a"]
+            )
+        ).get_execution_hash()
+    )
+
+
+def test__dedupe_executions__drops_duplicates_in_order():
+    executions = [
+        get_any_demand_execution(execution_id=execution_id, execution_type=execution_type)
+        for execution_id, execution_type in [
+            (THIS_UUID, "a"),
+            (THIS_UUID, "b"),
+            (THIS_UUID, "a"),
+            (ANOTHER_UUID, "a"),
+        ]
+    ]
+
+    assert list(dedupe_executions(executions)) == [executions[0], executions[1], executions[3]]
+    assert list(dedupe_executions(iter(executions), strict=False)) == executions[:2]
+
+
 class DemandExecutionTests(unittest.TestCase):
     def test__generate_execution_name__generates_correct_pattern(self):
         demand_execution = get_any_demand_execution()
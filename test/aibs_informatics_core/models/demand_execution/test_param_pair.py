@@ -9,6 +9,7 @@ from aibs_informatics_core.models.demand_execution.param_pair import (
     JobParamPair,
     JobParamSetPair,
     ParamPair,
+    ParamPairGraph,
     ParamSetPair,
     ResolvedParamSetPair,
 )
@@ -427,3 +428,57 @@ def test__ResolvedParamSetPair__outputs_only():
     p = ResolvedParamSetPair(outputs={r1})
     assert p.inputs == frozenset()
     assert p.outputs == frozenset({r1})
+
+
+@mark.parametrize(
+    "inputs, outputs",
+    [
+        param([], [], id="no input and no output"),
+        param(["i1", "i2"], [], id="multiple inputs and no outputs"),
+        param([], ["o1", "o2"], id="no inputs and multiple outputs"),
+        param(["i1", "i2"], ["o1", "o2", "o1"], id="multi inputs and outputs"),
+    ],
+)
+def test__ParamSetPair__from_sets__matches_grouped_pairs(inputs, outputs):
+    actual = ParamSetPair.from_sets(inputs=inputs, outputs=outputs)
+    expected = ParamSetPair.from_pairs(*ParamPair.from_sets(inputs=inputs, outputs=outputs))
+    assert actual == expected
+
+
+def test__ParamPairGraph__iterates_and_queries_without_materializing_pairs():
+    set_pairs = [
+        ParamSetPair(inputs={"i1", "i2"}, outputs={"o1", "o2"}),
+        ParamSetPair(inputs={"i2", "i3"}, outputs={"o3"}),
+        ParamSetPair(inputs={"i4"}),
+        ParamSetPair(outputs={"o4"}),
+    ]
+    graph = ParamPairGraph.from_set_pairs(*set_pairs)
+
+    assert list(graph) == [(_.input, _.output) for _ in ParamPair.from_set_pairs(*set_pairs)]
+    assert len(graph) == 8
+    assert graph.inputs == {"i1", "i2", "i3", "i4"}
+    assert graph.outputs == {"o1", "o2", "o3", "o4"}
+
+    assert ("i2", "o3") in graph
+    assert ParamPair(input="i1", output="o2") in graph
+    assert ("i4", None) in graph
+    assert (None, "o4") in graph
+    assert ("i1", "o3") not in graph
+    assert ("i1", None) not in graph
+    assert "i1" not in graph
+
+    assert graph.get_outputs("i2") == {"o1", "o2", "o3"}
+    assert graph.get_outputs("i4") == set()
+    assert graph.get_outputs("missing") == set()
+    assert graph.get_inputs("o3") == {"i2", "i3"}
+    assert graph.get_inputs("o4") == set()
+
+
+def test__ParamPairGraph__large_cross_product_is_not_materialized():
+    inputs = [f"i{i}" for i in range(500)]
+    outputs = [f"o{i}" for i in range(500)]
+    graph = ParamPairGraph.from_set_pairs(ParamSetPair(inputs=inputs, outputs=outputs))
+
+    assert len(graph) == 250_000
+    assert ("i499", "o0") in graph
+    assert graph.get_outputs("i0") == frozenset(outputs)
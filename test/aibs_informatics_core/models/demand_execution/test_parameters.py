@@ -1,3 +1,5 @@
+import copy
+import pickle
 from unittest import mock
 
 from pydantic import ValidationError as PydanticValidationError
@@ -786,3 +788,313 @@ def test__error_if_outputs_and_no_output_s3_prefix():
             inputs=["param_in"],
             outputs=["param_out"],
         )
+
+
+def test__update_params__incrementally_re_resolves_dependents():
+    parameters = DemandExecutionParameters(
+        params={"a": "x", "b": "${a}_y", "c": "${b}_z", "d": "w"},
+        inputs=["d"],
+    )
+
+    parameters.update_params(a="q")
+    parameters.update_params(e="${c}!")
+
+    assert parameters.job_params == [
+        JobParam("a", "q"),
+        JobParam("b", "q_y"),
+        JobParam("c", "q_y_z"),
+        DownloadableJobParam("d", mock.ANY, "w"),
+        JobParam("e", "q_y_z!"),
+    ]
+    assert (
+        parameters.job_params
+        == DemandExecutionParameters(params=parameters.params, inputs=["d"]).job_params
+    )
+
+
+def test__add_inputs_and_outputs__incremental_refresh_matches_full_refresh():
+    parameters = DemandExecutionParameters(output_s3_prefix=S3_PREFIX)
+    for i in range(20):
+        parameters.update_params(**{f"param-{i}": f"${{param_{i - 1}}}/{i}" if i else "root"})
+        parameters.add_inputs(**{f"in-{i}": f"s3://bucket/${{PARAM_{i}}}"})
+        parameters.add_outputs(**{f"out-{i}": f"${{param_{i}}}"})
+
+    expected = DemandExecutionParameters(
+        params=parameters.params,
+        inputs=parameters.inputs,
+        outputs=parameters.outputs,
+        output_s3_prefix=S3_PREFIX,
+    )
+    assert parameters.job_params == expected.job_params
+    assert parameters.job_param_outputs[-1] == UploadableJobParam(
+        "out-19", "root/1/2/3/4/5/6/7/8/9/10/11/12/13/14/15/16/17/18/19", mock.ANY
+    )
+
+
+def test__update_params__colliding_envname_raises_error():
+    parameters = DemandExecutionParameters(params={"param-a": "a"})
+
+    with raises(ValidationError):
+        parameters.update_params(PARAM_A="b")
+
+
+def test__refresh__skipped_without_changes(demand_execution_parameters: DemandExecutionParameters):
+    with (
+        mock.patch.object(
+            DemandExecutionParameters, "_set_job_params", autospec=True
+        ) as mock_set_job_params,
+        mock.patch.object(
+            DemandExecutionParameters, "_update_job_params", autospec=True
+        ) as mock_update_job_params,
+    ):
+        demand_execution_parameters.job_param_inputs
+        demand_execution_parameters.job_param_outputs
+
+    mock_set_job_params.assert_not_called()
+    mock_update_job_params.assert_not_called()
+
+
+def test__refresh__field_assignment_and_model_copy_trigger_full_refresh(
+    demand_execution_parameters: DemandExecutionParameters,
+):
+    demand_execution_parameters.outputs = ["param"]
+    assert demand_execution_parameters.job_param_outputs == [
+        UploadableJobParam("param", "foo", "s3://bucket/prefix/foo")
+    ]
+
+    copied = demand_execution_parameters.model_copy(update={"inputs": []})
+    assert copied.job_param_inputs == []
+    assert isinstance(copied.get_job_param("param_in"), JobParam)
+    assert isinstance(demand_execution_parameters.get_job_param("param_in"), DownloadableJobParam)
+
+
+def test__refresh__picks_up_in_place_edits(demand_execution_parameters: DemandExecutionParameters):
+    parameters = demand_execution_parameters
+    parameters.command.append("${param}")
+    assert parameters.resolved_command == ["foo"]
+
+    parameters.params["param"] = "foo2"
+    assert parameters.get_job_param("param") == JobParam("param", "foo2")
+    assert parameters.resolved_command == ["foo2"]
+
+    parameters.params["param"] = 1
+    assert parameters.job_param_map["PARAM"] == JobParam("param", "1")
+    parameters.params["param"] = True
+    assert parameters.job_param_map["PARAM"] == JobParam("param", "True")
+
+    parameters.params["nested"] = {"a": [1]}
+    assert parameters.job_param_map["NESTED"] == JobParam("nested", "{'a': [1]}")
+    parameters.params["nested"]["a"].append(2)
+    assert parameters.job_param_map["NESTED"] == JobParam("nested", "{'a': [1, 2]}")
+
+    parameters.inputs.append("param")
+    parameters.params["param"] = ANOTHER_S3_URI
+    assert parameters.job_param_inputs[-1] == DownloadableJobParam(
+        "param", mock.ANY, ANOTHER_S3_URI
+    )
+    assert len(parameters.job_params) == len(parameters.params)
+
+
+def test__refresh__picks_up_removals_in_copies_and_pickles(
+    demand_execution_parameters: DemandExecutionParameters,
+):
+    for parameters in [
+        copy.copy(demand_execution_parameters),
+        copy.deepcopy(demand_execution_parameters),
+        pickle.loads(pickle.dumps(demand_execution_parameters)),
+    ]:
+        parameters.outputs.remove("param_out")
+        del parameters.params["param_out"]
+        assert parameters.job_param_outputs == []
+        assert parameters.get_job_param("param_out") is None
+
+        parameters.add_outputs("param_out", param_out="bar")
+        parameters.params |= {"param": "foo2"}
+        assert parameters.job_param_outputs == [
+            UploadableJobParam("param_out", "bar", "s3://bucket/prefix/bar")
+        ]
+        assert parameters.get_job_param("param") == JobParam("param", "foo2")
+
+
+def test__refresh__work_does_not_grow_with_number_of_inputs():
+    def count_envname_calls(num_inputs: int) -> int:
+        parameters = DemandExecutionParameters(params={"nested": {"a": [1]}})
+        for i in range(num_inputs):
+            parameters.add_inputs(**{f"in_{i}": f"s3://bucket/{i}"})
+
+        with (
+            mock.patch.object(
+                JobParam, "as_envname", side_effect=JobParam.as_envname
+            ) as mock_as_envname,
+            mock.patch.object(
+                DemandExecutionParameters, "_set_job_params", autospec=True
+            ) as mock_set_job_params,
+            mock.patch.object(
+                DemandExecutionParameters, "validate_parameters", autospec=True
+            ) as mock_validate_parameters,
+        ):
+            parameters.add_inputs(new_input=S3_URI)
+            assert parameters.get_input_job_param("new_input") == DownloadableJobParam(
+                "new_input", mock.ANY, S3_URI
+            )
+        mock_set_job_params.assert_not_called()
+        mock_validate_parameters.assert_not_called()
+        return mock_as_envname.call_count
+
+    assert count_envname_calls(10) == count_envname_calls(500)
+
+
+def test__refresh__mutators_refresh_incrementally(
+    demand_execution_parameters: DemandExecutionParameters,
+):
+    parameters = demand_execution_parameters
+    with mock.patch.object(
+        DemandExecutionParameters, "_set_job_params", autospec=True
+    ) as mock_set_job_params:
+        parameters.update_params(param="foo2", new_param="new")
+        parameters.add_inputs(another_param_in=ANOTHER_S3_URI)
+        assert parameters.job_param_map["NEW_PARAM"] == JobParam("new_param", "new")
+        assert parameters.job_param_inputs[-1] == DownloadableJobParam(
+            "another_param_in", mock.ANY, ANOTHER_S3_URI
+        )
+    mock_set_job_params.assert_not_called()
+
+
+def test__eq__ignores_refresh_state(demand_execution_parameters: DemandExecutionParameters):
+    parameters = DemandExecutionParameters(**demand_execution_parameters.model_dump())
+    parameters.update_params(param="foo2")
+    parameters.add_inputs("lowercase_param")
+    parameters.job_param_set_pairs
+
+    expected = DemandExecutionParameters(**parameters.model_dump())
+    assert parameters == expected
+    assert parameters != demand_execution_parameters
+    assert parameters != "not parameters"
+
+
+def test__batch_update__defers_refresh_until_exit():
+    parameters = DemandExecutionParameters(params={"a": "x"})
+
+    with mock.patch.object(
+        DemandExecutionParameters,
+        "_update_job_params",
+        autospec=True,
+        side_effect=DemandExecutionParameters._update_job_params,
+    ) as mock_update_job_params:
+        with parameters.batch_update():
+            # Inputs can be added before their params without failing validation
+            parameters.add_inputs("b")
+            with parameters.batch_update():
+                parameters.update_params(b="${a}/b", c="c")
+            parameters.add_outputs(d="${B}/d @ s3://bucket/d")
+            assert parameters.job_params == [JobParam("a", "x")]
+            mock_update_job_params.assert_not_called()
+
+    mock_update_job_params.assert_called_once()
+    assert parameters.job_params == [
+        JobParam("a", "x"),
+        DownloadableJobParam("b", mock.ANY, "x/b"),
+        JobParam("c", "c"),
+        UploadableJobParam("d", mock.ANY, "s3://bucket/d"),
+    ]
+
+
+def test__batch_update__validates_on_exit():
+    parameters = DemandExecutionParameters(params={"a": "x"})
+
+    with raises(ValidationError):
+        with parameters.batch_update():
+            parameters.add_inputs("b")
+
+
+def test__batch_update__error_in_block_skips_refresh():
+    parameters = DemandExecutionParameters(params={"a": "x"})
+
+    with raises(RuntimeError):
+        with parameters.batch_update():
+            parameters.update_params(a="y")
+            raise RuntimeError("oops")
+
+    # pending changes are applied on next access
+    assert parameters.job_params == [JobParam("a", "y")]
+    assert parameters.job_param_inputs == []
+
+
+def test__resolved_command__fills_environment_and_reflects_changes():
+    parameters = DemandExecutionParameters(
+        command=["run", "--a=${param_a}/${PARAM_B}", "${ENV_VAR_FOR_COMMAND}"],
+        params={"param-a": "foo", "param_b": "${Param_A}_bar"},
+    )
+
+    with mock.patch.dict("os.environ", {"ENV_VAR_FOR_COMMAND": "env"}):
+        resolved_command = parameters.resolved_command
+        assert resolved_command == ["run", "--a=foo/foo_bar", "env"]
+        resolved_command.append("mutated")
+        assert parameters.resolved_command == ["run", "--a=foo/foo_bar", "env"]
+
+        parameters.update_params(**{"param-a": "qaz"})
+        assert parameters.resolved_command == ["run", "--a=qaz/qaz_bar", "env"]
+
+        parameters.command.append("${param_b}")
+        assert parameters.resolved_command == ["run", "--a=qaz/qaz_bar", "env", "qaz_bar"]
+
+        parameters.params["param_b"] = "baz"
+        assert parameters.resolved_command == ["run", "--a=qaz/baz", "env", "baz"]
+        assert parameters == DemandExecutionParameters(**parameters.model_dump())
+
+    with mock.patch.dict("os.environ", {"ENV_VAR_FOR_COMMAND": "other"}):
+        assert parameters.resolved_command[2] == "other"
+
+
+def test__resolved_command__raises_for_missing_reference():
+    parameters = DemandExecutionParameters(command=["${MISSING_COMMAND_REFERENCE}"])
+
+    with raises(ValueError, match="MISSING_COMMAND_REFERENCE"):
+        parameters.resolved_command
+
+
+def test__param_set_pairs__cached_until_refresh(
+    demand_execution_parameters: DemandExecutionParameters,
+):
+    param_set_pairs = demand_execution_parameters.param_set_pairs
+    job_param_set_pairs = demand_execution_parameters.job_param_set_pairs
+
+    with (
+        mock.patch.object(
+            DemandExecutionParameters, "_build_param_set_pairs", autospec=True
+        ) as mock_build_param_set_pairs,
+        mock.patch.object(
+            DemandExecutionParameters, "_build_job_param_set_pairs", autospec=True
+        ) as mock_build_job_param_set_pairs,
+    ):
+        assert demand_execution_parameters.param_set_pairs == param_set_pairs
+        assert demand_execution_parameters.job_param_set_pairs == job_param_set_pairs
+        assert demand_execution_parameters.param_pair_graph.get_outputs("param_in") == {
+            "param_out"
+        }
+    mock_build_param_set_pairs.assert_not_called()
+    mock_build_job_param_set_pairs.assert_not_called()
+
+    # changing returned pairs does not affect the cached pairs
+    demand_execution_parameters.param_set_pairs[0].add_inputs("param")
+    demand_execution_parameters.job_param_set_pairs[0].remove_inputs(
+        *job_param_set_pairs[0].inputs
+    )
+    assert demand_execution_parameters.param_set_pairs == [
+        ParamSetPair(inputs={"param_in"}, outputs={"param_out"})
+    ]
+    assert len(demand_execution_parameters.job_param_set_pairs[0].inputs) == 1
+
+    demand_execution_parameters.add_outputs("param")
+    assert demand_execution_parameters.param_set_pairs == [
+        ParamSetPair(inputs={"param_in"}, outputs={"param_out"}),
+        ParamSetPair(inputs={"param_in"}, outputs={"param"}),
+    ]
+    assert len(demand_execution_parameters.job_param_set_pairs) == 2
+
+    demand_execution_parameters.param_pair_overrides = [ParamPair(output="param")]
+    assert demand_execution_parameters.param_set_pairs == [
+        ParamSetPair(inputs={"param_in"}, outputs={"param_out"}),
+        ParamSetPair(outputs={"param"}),
+    ]
+    assert demand_execution_parameters.param_pair_graph.get_outputs("param_in") == {"param_out"}
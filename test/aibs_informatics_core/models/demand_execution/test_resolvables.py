@@ -297,3 +297,77 @@ def test__to_str__works(value: Resolvable, expected: str, raise_expectation):
     with raise_expectation:
         actual = value.to_str()
         assert actual == expected
+
+
+@mark.parametrize(
+    "resolvable_class, values, default_remote, raise_expectation",
+    [
+        param(
+            S3Resolvable,
+            [
+                "s3://bucket/key",
+                "s3://bucket/key @ /tmp/somefile",
+                {"local": "/tmp/other"},
+                {"local": "/tmp/another", "remote": "s3://bucket/another"},
+                S3Resolvable(local="/tmp/x", remote=S3Path("s3://bucket/x")),
+            ],
+            S3Path("s3://bucket/default"),
+            does_not_raise(),
+            id="mixed values",
+        ),
+        param(
+            Uploadable,
+            ["/tmp/somefile @ s3://bucket/key", {"local": "/tmp/x", "remote": "s3://bucket/x"}],
+            None,
+            does_not_raise(),
+            id="uploadables",
+        ),
+        param(
+            S3Resolvable,
+            ["s3://bucket/key", {"local": "/tmp/x", "remote": "not-s3"}],
+            None,
+            raises(ValidationError),
+            id="ERROR: invalid dict",
+        ),
+        param(
+            S3Resolvable,
+            ["s3://bucket/key something @ ./local_path"],
+            None,
+            raises(ValidationError),
+            id="ERROR: invalid string",
+        ),
+        param(
+            S3Resolvable,
+            ["s3://bucket/key", 42],
+            None,
+            raises(ValueError),
+            id="ERROR: invalid type",
+        ),
+    ],
+)
+def test__from_many__matches_from_any(
+    resolvable_class: type[R],
+    values: list[Any],
+    default_remote: str | None,
+    raise_expectation,
+):
+    with raise_expectation:
+        actual = resolvable_class.from_many(values, default_remote=default_remote)
+        expected = [
+            resolvable_class.from_any(value, default_remote=default_remote) for value in values
+        ]
+        assert actual == expected
+        assert all(type(_) is resolvable_class for _ in actual)
+
+
+def test__from_many__does_not_modify_input_dicts():
+    value = {"local": "/tmp/x", "remote": "s3://bucket/x", "action": "LOCALIZE"}
+    (actual,) = S3Resolvable.from_many([value])
+    assert actual == S3Resolvable(local="/tmp/x", remote=S3Path("s3://bucket/x"))
+    assert value == {"local": "/tmp/x", "remote": "s3://bucket/x", "action": "LOCALIZE"}
+
+
+def test__get_resolvable_type__is_cached_per_class():
+    assert S3Resolvable.get_resolvable_type() is S3Path
+    assert Resolvable.get_resolvable_type() is str
+    assert Uploadable.get_resolvable_type() is str
@@ -1,6 +1,11 @@
 from pathlib import Path
 
+import pytest
+from pydantic import AliasChoices, AliasPath, Field
+
+from aibs_informatics_core.exceptions import ValidationError
 from aibs_informatics_core.models.aws.s3 import S3KeyPrefix, S3Path
+from aibs_informatics_core.models.base import PydanticBaseModel
 from aibs_informatics_core.models.data_sync import (
     BatchDataSyncRequest,
     BatchDataSyncResponse,
@@ -12,6 +17,7 @@ from aibs_informatics_core.models.data_sync import (
     JSONContent,
     JSONReference,
     PrepareBatchDataSyncResponse,
+    _get_required_field_keys,
 )
 
 S3_URI = S3Path.build(bucket_name="bucket", key="key")
@@ -113,6 +119,34 @@ def test__BatchDataSyncRequest__from_dict():
     actual = BatchDataSyncRequest.from_dict(single_request)
     assert actual == expected
 
+    # handles single request with camelCase keys
+    actual = BatchDataSyncRequest.from_dict(
+        {"sourcePath": str(S3_URI), "destinationPath": str(S3_URI), "sourcePathPrefix": "prefix"}
+    )
+    assert actual == expected
+
+
+def test__get_required_field_keys__derived_from_model_fields():
+    assert _get_required_field_keys(DataSyncRequest) == (
+        frozenset({"source_path", "sourcePath"}),
+        frozenset({"destination_path", "destinationPath"}),
+    )
+
+    class AliasedModel(PydanticBaseModel):
+        a: int = Field(validation_alias=AliasChoices("x", AliasPath("y", 0)))
+        b: int = Field(alias="B")
+        c: int = 0
+
+    assert _get_required_field_keys(AliasedModel) == (
+        frozenset({"a", "x", "y"}),
+        frozenset({"b", "B"}),
+    )
+
+
+def test__BatchDataSyncRequest__from_dict__invalid_single_request_raises_error():
+    with pytest.raises(ValidationError):
+        BatchDataSyncRequest.from_dict({"source_path": str(S3_URI), "destination_path": 1})
+
 
 def test__BatchDataSyncRequest__to_dict():
     request = BatchDataSyncRequest(
@@ -1,4 +1,6 @@
 import errno
+import gzip
+import io
 import os
 import tarfile
 import threading
@@ -13,17 +15,26 @@ from pytest import mark, param, raises
 
 from aibs_informatics_core.utils.file_operations import (
     ArchiveType,
+    CannotAcquirePathLockError,
+    CompressionType,
     PathLock,
+    PathUsageStats,
+    _ParallelGzipWriter,
     copy_path,
     extract_archive,
     find_filesystem_boundary,
     find_paths,
     get_path_size_bytes,
     get_path_with_root,
+    iter_path_usage,
     make_archive,
     move_path,
+    open_path,
     remove_path,
     strip_path_root,
+    summarize_path_usage,
+    write_path_usage,
+    write_tar_archive,
 )
 
 
@@ -191,6 +202,130 @@ class ArchiveTests(FileOperationsBaseTest):
         with self.assertRaises(ValueError):
             make_archive(self.tmp_path() / "non-existent-path")
 
+    def test__make_archive__does_not_leave_tmp_file_on_failure(self):
+        tmp_dir = self.tmp_path()
+        with patch("tempfile.tempdir", str(tmp_dir)):
+            with self.assertRaises(ValueError):
+                make_archive(self.tmp_path() / "non-existent-path")
+        self.assertEqual(list(tmp_dir.iterdir()), [])
+
+    def test__make_archive__excludes_destination_inside_source(self):
+        dir_path = self.tmp_path()
+        paths = ["a.txt", "c/c.txt"]
+        self.create_dir(dir_path, paths)
+        archive_path = make_archive(dir_path, destination_path=dir_path / "archive.tar.gz")
+        with tarfile.open(archive_path) as tar:
+            self.assertEqual(sorted(tar.getnames()), ["a.txt", "c", "c/c.txt"])
+
+    def test__write_tar_archive__writes_gzip_independent_of_max_workers(self):
+        dir_path = self.tmp_path()
+        self.create_dir(dir_path, [("a.txt", "a" * 3_000_000), "b.txt", "c/c.txt"])
+        (dir_path / "empty").mkdir()
+        archive_path = self.tmp_path() / "archive.tar.gz"
+        write_tar_archive(dir_path, archive_path)
+        self.assertEqual(ArchiveType.TAR_GZ, ArchiveType.from_path(archive_path))
+        extracted_path = extract_archive(archive_path, self.tmp_path())
+        self.assertDirectoryContents(extracted_path, ["a.txt", "b.txt", "c/c.txt"])
+        self.assertTrue((extracted_path / "empty").is_dir())
+
+        other_archive_path = self.tmp_path() / "other.tar.gz"
+        write_tar_archive(dir_path, other_archive_path, max_workers=4)
+        self.assertEqual(archive_path.read_bytes(), other_archive_path.read_bytes())
+
+    def test__write_tar_archive__writes_filtered_paths_to_stream(self):
+        dir_path = self.tmp_path()
+        self.create_dir(dir_path, ["a.txt", "b.log", "c/c.txt", "d/d.txt"])
+        stream = io.BytesIO()
+        write_tar_archive(
+            dir_path, stream, compression=None, includes=[r".*\.txt"], excludes=[r".*/d"]
+        )
+        self.assertFalse(stream.closed)
+        stream.seek(0)
+        with tarfile.open(fileobj=stream) as tar:
+            self.assertEqual(sorted(tar.getnames()), ["a.txt", "c/c.txt"])
+
+    def test__write_tar_archive__handles_file(self):
+        path = self.tmp_path() / "a.txt"
+        path.write_text("hello")
+        stream = io.BytesIO()
+        write_tar_archive(path, stream)
+        with tarfile.open(fileobj=io.BytesIO(stream.getvalue())) as tar:
+            self.assertEqual(tar.getnames(), ["a.txt"])
+
+    def test__write_tar_archive__removes_partial_archive_on_failure(self):
+        dir_path = self.tmp_path()
+        self.create_dir(dir_path, ["a.txt"])
+        archive_path = self.tmp_path() / "archive.tar.gz"
+        with patch("tarfile.TarFile.add", side_effect=OSError("boom")):
+            with self.assertRaises(OSError):
+                write_tar_archive(dir_path, archive_path)
+        self.assertFalse(archive_path.exists())
+        with self.assertRaises(FileNotFoundError):
+            write_tar_archive(dir_path / "missing", archive_path)
+        self.assertFalse(archive_path.exists())
+
+    def test__write_tar_archive__zstd(self):
+        class Writer(io.BytesIO):
+            def close(self):
+                written.append(self.getvalue())
+
+        written: list[bytes] = []
+        zstandard = MagicMock()
+        zstandard.ZstdCompressor.return_value.stream_writer.side_effect = lambda *_, **__: Writer()
+        dir_path = self.tmp_path()
+        self.create_dir(dir_path, ["a.txt"])
+        stream = io.BytesIO()
+        with patch.dict("sys.modules", {"compression": None, "zstandard": zstandard}):
+            write_tar_archive(dir_path, stream, compression=CompressionType.ZSTD, max_workers=4)
+        zstandard.ZstdCompressor.assert_called_once_with(level=3, threads=4)
+        with tarfile.open(fileobj=io.BytesIO(written[0])) as tar:
+            self.assertEqual(tar.getnames(), ["a.txt"])
+
+        with patch.dict("sys.modules", {"compression": None, "zstandard": None}):
+            with raises(ImportError):
+                write_tar_archive(dir_path, stream, compression=CompressionType.ZSTD)
+
+    def test__ParallelGzipWriter__writes_single_gzip_stream(self):
+        data = os.urandom(50_000) + b"abc" * 100_000
+        outputs = []
+        for max_workers in (None, 3):
+            stream = io.BytesIO()
+            with _ParallelGzipWriter(stream, 6, max_workers, block_size=7_000) as writer:
+                for i in range(0, len(data), 9_999):
+                    writer.write(data[i : i + 9_999])
+            outputs.append(stream.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(gzip.decompress(outputs[0]), data)
+        # blocks are primed with the previous block, repetitive data stays small
+        self.assertLess(len(outputs[0]), 55_000)
+
+
+class CompressionTests(FileOperationsBaseTest):
+    def test__CompressionType__from_path__infers_from_suffix(self):
+        self.assertEqual(CompressionType.from_path("a.json.gz"), CompressionType.GZIP)
+        self.assertEqual(CompressionType.from_path(Path("a.jsonl.zst")), CompressionType.ZSTD)
+        self.assertIsNone(CompressionType.from_path("a.json"))
+
+    def test__open_path__handles_uncompressed(self):
+        path = self.tmp_path() / "file.txt"
+        with open_path(path, "wt") as f:
+            f.write("hello")
+        self.assertEqual(path.read_text(), "hello")
+
+    def test__open_path__handles_gzip(self):
+        path = self.tmp_path() / "file.txt.gz"
+        with open_path(path, "wt") as f:
+            f.write("hello")
+        self.assertEqual(gzip.decompress(path.read_bytes()), b"hello")
+        with open_path(path, "rt") as f:
+            self.assertEqual(f.read(), "hello")
+
+    def test__open_path__zstd_raises_error_if_unavailable(self):
+        path = self.tmp_path() / "file.txt.zst"
+        with patch.dict("sys.modules", {"compression": None, "zstandard": None}):
+            with raises(ImportError):
+                open_path(path, "wb")
+
 
 class FileOperationsTests(FileOperationsBaseTest):
     def setUp(self) -> None:
@@ -210,10 +345,11 @@ class FileOperationsTests(FileOperationsBaseTest):
         path.write_text("_" * 5)
         self.assertEqual(get_path_size_bytes(path), 5)
 
-    @patch("aibs_informatics_core.utils.file_operations.find_all_paths")
+    @patch("aibs_informatics_core.utils.file_operations.iter_paths")
     @patch("aibs_informatics_core.utils.file_operations.Path")
-    def test__get_path_size_bytes__handles_errors(self, mock_Path, mock_find_all_paths):
-        mock_find_all_paths.return_value = ["a", "b"]
+    def test__get_path_size_bytes__handles_errors(self, mock_Path, mock_iter_paths):
+        # paths that could not be stat'ed while walking are checked again
+        mock_iter_paths.return_value = [("a", None), ("b", None)]
         path = self.tmp_path()
         # first constructed path outside of try-except clause
         p1 = MagicMock()
@@ -238,10 +374,120 @@ class FileOperationsTests(FileOperationsBaseTest):
         with self.assertRaises(OSError):
             ose.errno = errno.ETIME
             p1.stat.side_effect = ose
-            mock_find_all_paths.return_value = ["a"]
+            mock_iter_paths.return_value = [("a", None)]
             mock_Path.side_effect = [p1]
             get_path_size_bytes(path)
 
+    def test__get_path_size_bytes__reuses_stats_from_walk(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a.txt", "sub/b.txt"])
+        (root / "a.txt").write_text("_" * 5)
+        (root / "sub" / "b.txt").write_text("_" * 7)
+        with patch("aibs_informatics_core.utils.file_operations.Path") as mock_Path:
+            self.assertEqual(get_path_size_bytes(root), 12)
+        mock_Path.assert_not_called()
+
+    def test__get_path_size_bytes__max_workers(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a.txt", "sub/b.txt", "sub/sub/c.txt"])
+        (root / "a.txt").write_text("_" * 5)
+        (root / "sub" / "sub" / "c.txt").write_text("_" * 7)
+        expected = get_path_size_bytes(root)
+        self.assertEqual(get_path_size_bytes(root, max_workers=4), expected)
+
+    def test__summarize_path_usage__rolls_up_to_depth(self):
+        root = self.tmp_path()
+        self.create_dir(
+            root,
+            [("a", "_" * 1), ("x/b", "_" * 2), ("x/y/c", "_" * 4), ("x/y/z/d", "_" * 8)],
+        )
+        (root / "empty").mkdir()
+        os.utime(root / "x" / "y" / "z" / "d", ns=(0, 3_000_000_000))
+        os.utime(root / "x" / "y" / "c", ns=(0, 2_000_000_000))
+        os.utime(root / "x" / "b", ns=(0, 5_000_000_000))
+        os.utime(root / "a", ns=(0, 1_000_000_000))
+
+        stats = {os.path.relpath(_.path, root): _ for _ in summarize_path_usage(root, depth=2)}
+        self.assertEqual(sorted(stats), [".", "empty", "x", "x/y"])
+        self.assertEqual(
+            [(stats[_].depth, stats[_].size_bytes, stats[_].object_count) for _ in sorted(stats)],
+            [(0, 15, 4), (1, 0, 0), (1, 14, 3), (2, 12, 2)],
+        )
+        self.assertEqual(stats["."].last_modified.timestamp(), 5)  # type: ignore[union-attr]
+        self.assertEqual(stats["x/y"].last_modified.timestamp(), 3)  # type: ignore[union-attr]
+        self.assertIsNone(stats["empty"].last_modified)
+        self.assertEqual(stats["."].size_bytes, get_path_size_bytes(root))
+
+    def test__summarize_path_usage__depth_0_and_max_workers(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a", "x/b", "x/y/c", "w/d"])
+        (stats,) = summarize_path_usage(root, depth=0)
+        self.assertEqual((stats.path, stats.object_count), (str(root), 4))
+        self.assertEqual(
+            summarize_path_usage(root, depth=5, max_workers=4),
+            summarize_path_usage(root, depth=5),
+        )
+        with self.assertRaises(ValueError):
+            summarize_path_usage(root, depth=-1)
+
+    def test__summarize_path_usage__handles_file(self):
+        path = self.tmp_file()
+        path.write_text("_" * 5)
+        (stats,) = summarize_path_usage(path)
+        self.assertEqual((stats.depth, stats.size_bytes, stats.object_count), (0, 5, 1))
+
+    def test__summarize_path_usage__use_blocks_counts_hard_links_once(self):
+        root = self.tmp_path()
+        self.create_dir(root, [("a", "_" * 10_000)])
+        os.link(root / "a", root / "b")
+        block_bytes = os.stat(root / "a").st_blocks * 512
+        (stats,) = summarize_path_usage(root, depth=0, use_blocks=True)
+        self.assertEqual((stats.size_bytes, stats.object_count), (block_bytes, 1))
+        (stats,) = summarize_path_usage(root, depth=0)
+        self.assertEqual((stats.size_bytes, stats.object_count), (20_000, 2))
+
+    def test__write_path_usage__iter_path_usage__round_trip(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a", "x/b", "y/c"])
+        (root / "empty").mkdir()
+        stats = summarize_path_usage(root)
+        for suffix in (".jsonl", ".jsonl.gz"):
+            path = self.tmp_path() / f"usage{suffix}"
+            write_path_usage(stats, path)
+            self.assertEqual(list(iter_path_usage(path)), stats)
+        with open(path.with_suffix(""), "w") as f:
+            write_path_usage(stats, f)
+        with open(path.with_suffix("")) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertNotIn(" ", lines[0].replace(str(root), ""))
+        self.assertEqual(
+            PathUsageStats.from_dict({"path": "p", "depth": 0}), PathUsageStats("p", 0)
+        )
+
+    def test__find_paths__max_workers(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a.txt", "b.log", "sub/c.txt", "sub/d/e.txt"])
+        self.assertEqual(
+            find_paths(root, includes=[r".*\.txt"], max_workers=4),
+            find_paths(root, includes=[r".*\.txt"]),
+        )
+
+    def test__find_paths__prunes_excluded_dirs(self):
+        root = self.tmp_path()
+        self.create_dir(root, ["a.txt", "sub/b.txt", "sub/c.txt", "other/sub/d.txt"])
+        excludes = [r".*/sub"]
+        result = find_paths(root, excludes=excludes)
+        self.assertNotIn(str(root / "sub"), result)
+        self.assertIn(str(root / "sub" / "b.txt"), result)
+
+        result = find_paths(root, excludes=excludes, prune_excluded_dirs=True)
+        self.assertEqual(sorted(result), sorted([str(root / "a.txt"), str(root / "other")]))
+        result = find_paths(
+            root, includes=[r".*\.txt"], excludes=excludes, prune_excluded_dirs=True
+        )
+        self.assertEqual(result, [str(root / "a.txt")])
+
     def test__find_paths__returns_all_paths_when_no_filters(self):
         root = self.tmp_path()
         self.create_dir(root, ["a.txt", "b.txt", "sub/c.txt"])
@@ -498,6 +744,40 @@ class FileOperationsTests(FileOperationsBaseTest):
             except Exception:
                 pass
 
+    def test__PathLock__shared_locks_exclude_exclusive_lock(self):
+        path = self.tmp_path()
+        with PathLock(path, shared=True) as lock:
+            with PathLock(path, shared=True, raise_if_locked=True):
+                pass
+            with self.assertRaises(CannotAcquirePathLockError):
+                with PathLock(path, raise_if_locked=True):
+                    pass
+            # shared locks keep the lock file for other holders
+            self.assertTrue(lock._lock_path.exists())
+
+        with PathLock(path):
+            with self.assertRaises(CannotAcquirePathLockError):
+                with PathLock(path, shared=True, raise_if_locked=True):
+                    pass
+
+    def test__PathLock__relocks_lock_file_replaced_while_waiting(self):
+        path = self.tmp_path()
+        lock1 = PathLock(path)
+        lock1.acquire()
+        lock2 = PathLock(path)
+        t = threading.Thread(target=lock2.acquire)
+        t.start()
+        t.join(timeout=0.2)
+        # lock2 waits on the lock file, which lock1 removes on release
+        lock1.release()
+        t.join()
+        try:
+            with self.assertRaises(CannotAcquirePathLockError):
+                with PathLock(path, raise_if_locked=True):
+                    pass
+        finally:
+            lock2.release()
+
     def test__find_filesystem_boundary__finds_root(self):
         path = self.tmp_path()
         expected = Path("/") / path.parts[1]
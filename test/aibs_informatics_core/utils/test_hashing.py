@@ -1,19 +1,38 @@
+import hashlib
+import json
+import os
 import re
+import shutil
+import sys
+import zlib
 from re import Pattern
+from unittest import mock
 
-from pytest import mark, param, raises
+from pytest import importorskip, mark, param, raises
 
+from aibs_informatics_core.utils import hashing
 from aibs_informatics_core.utils.hashing import (
+    FILE_HASH_LOCAL_BUFSIZE,
+    FILE_HASH_NETWORK_BUFSIZE,
+    FileHashCache,
+    PathHashTree,
+    _get_file_bufsize,
+    _get_mount_points,
+    _is_network_filesystem,
     b64_decoded_str,
     b64_encoded_str,
+    generate_file_hash,
+    generate_file_hashes,
     generate_path_hash,
+    generate_path_hash_tree,
     sha256_hexdigest,
+    update_json_hash,
     urlsafe_b64_decoded_str,
     urlsafe_b64_encoded_str,
     uuid_str,
 )
 from aibs_informatics_core.utils.json import JSON
-from test.base import BaseTest, does_not_raise
+from test.base import BaseTest, does_not_raise, run_benchmark
 
 
 @mark.parametrize(
@@ -76,6 +95,45 @@ def test__sha256_hexdigest(value: JSON | None, expected: str | Pattern, raises_e
         assert expected.fullmatch(actual_again) is not None
 
 
+@mark.parametrize(
+    "content",
+    [
+        param({}, id="empty dict"),
+        param({f"k{i}": i for i in range(10)}, id="large flat dict"),
+        param(
+            {"b": [{"y": 1, "x": [1, 2, 3, 4, 5]}] * 5, "a": ("é", None, 1.5, True)},
+            id="large nested containers",
+        ),
+        param([{1: "a", 2: "b", 3: "c", 4: "d"}] * 2, id="non-str keys"),
+        param({"a": {"b": {f"k{i}": [i] for i in range(10)}}}, id="small containers of large"),
+    ],
+)
+def test__update_json_hash__matches_hash_of_canonical_json(content: JSON):
+    hash_obj = hashlib.sha256()
+    update_json_hash(hash_obj, content, chunk_size=3)
+
+    expected = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+    assert hash_obj.hexdigest() == expected
+
+
+def test__update_json_hash__streams_large_containers_nested_in_small_ones():
+    content = {"params": {f"key_{i}": {"value": i} for i in range(10)}}
+    hash_obj = mock.MagicMock()
+    update_json_hash(hash_obj, content, chunk_size=3)
+
+    chunks = [_.args[0] for _ in hash_obj.update.call_args_list]
+    assert b"".join(chunks) == json.dumps(content, sort_keys=True).encode()
+    assert max(len(_) for _ in chunks) < 100
+
+
+def test__sha256_hexdigest__matches_hash_of_canonical_json():
+    content = {"params": {f"key_{i}": {"value": [i] * 3} for i in range(1000)}}
+    expected = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+    assert sha256_hexdigest(content) == expected
+    long_str = "x" * 5000
+    assert sha256_hexdigest(long_str) == hashlib.sha256(long_str.encode()).hexdigest()
+
+
 def test__uuid_str__is_deterministic_only_with_same_input():
     assert uuid_str("123") == uuid_str("123")
     assert uuid_str("123") != uuid_str("1234")
@@ -168,3 +226,352 @@ class HashingTests(BaseTest):
         (self.asset_path / "dir1" / "c.txt").write_text("c = 'hallo'")
         new_hash = generate_path_hash(str(self.asset_path), includes=excludes, excludes=excludes)
         assert original_hash == new_hash
+
+    def test__generate_path_hash__max_workers_does_not_change_hash(self):
+        expected = generate_path_hash(self.asset_path)
+        for max_workers in (1, 2, 8):
+            assert generate_path_hash(self.asset_path, max_workers=max_workers) == expected
+        expected = generate_path_hash(self.asset_path, excludes=[r".*\.txt"], hash_type="md5")
+        actual = generate_path_hash(
+            self.asset_path, excludes=[r".*\.txt"], hash_type="md5", max_workers=4
+        )
+        assert actual == expected
+
+    def test__generate_path_hash__max_workers_raises_file_errors(self):
+        with mock.patch(
+            "aibs_informatics_core.utils.hashing._generate_file_hash",
+            side_effect=PermissionError("denied"),
+        ):
+            with self.assertRaises(PermissionError):
+                generate_path_hash(self.asset_path, max_workers=4)
+
+    def test__generate_path_hash__merkle_mode_changes_when_file_renamed(self):
+        original_hash = generate_path_hash(self.asset_path, mode="merkle")
+        assert original_hash == generate_path_hash_tree(self.asset_path).digest
+        (self.asset_path / "x.txt").rename(self.asset_path / "y.txt")
+        assert generate_path_hash(self.asset_path) == generate_path_hash(self.asset_path)
+        new_hash = generate_path_hash(self.asset_path, mode="merkle")
+        assert original_hash != new_hash
+
+    def test__generate_path_hash__merkle_mode_is_independent_of_root_and_workers(self):
+        other_path = self.tmp_path()
+        shutil.copytree(self.asset_path, other_path, dirs_exist_ok=True)
+        expected = generate_path_hash(self.asset_path, mode="merkle")
+        assert generate_path_hash(other_path, mode="merkle") == expected
+        assert generate_path_hash(other_path, mode="merkle", max_workers=4) == expected
+
+    def test__generate_path_hash_tree__has_per_directory_digests(self):
+        tree = generate_path_hash_tree(self.asset_path, excludes=[r".*\.txt"])
+        assert set(tree.file_hashes) == {
+            "a.py",
+            "b.py",
+            "dir1/__init__.py",
+            "dir1/a.py",
+            "dir1/b.py",
+            "dir1/c.py",
+        }
+        assert set(tree.dir_hashes) == {"", "dir1"}
+        assert tree.get_digest() == tree.digest
+        assert tree.get_digest("dir1/") == tree.dir_hashes["dir1"]
+        assert tree.get_digest("dir1/a.py") == tree.file_hashes["a.py"]
+        assert tree.get_digest("missing") is None
+
+        other_path = self.tmp_path()
+        shutil.copytree(self.asset_path / "dir1", other_path / "dir1")
+        other_tree = generate_path_hash_tree(other_path)
+        assert other_tree.dir_hashes["dir1"] == tree.dir_hashes["dir1"]
+        assert other_tree.digest != tree.digest
+
+    def test__PathHashTree__update_only_changes_affected_directories(self):
+        tree = generate_path_hash_tree(self.asset_path)
+        dir1_digest = tree.dir_hashes["dir1"]
+
+        (self.asset_path / "dir2" / "sub").mkdir(parents=True)
+        (self.asset_path / "dir2" / "sub" / "new.py").write_text("new = 1")
+        (self.asset_path / "a.py").write_text('a = "changed"')
+        (self.asset_path / "b.py").unlink()
+        changed = tree.update(
+            [
+                self.asset_path / "dir2" / "sub" / "new.py",
+                self.asset_path / "a.py",
+                self.asset_path / "b.py",
+                self.asset_path / "dir1" / "a.py",
+            ]
+        )
+
+        assert changed == {"", "a.py", "b.py", "dir2", "dir2/sub", "dir2/sub/new.py"}
+        assert tree.dir_hashes["dir1"] == dir1_digest
+        assert tree.digest == generate_path_hash_tree(self.asset_path).digest
+
+        (self.asset_path / "dir2" / "sub" / "new.py").unlink()
+        changed = tree.update([self.asset_path / "dir2" / "sub" / "new.py"])
+        assert changed == {"", "dir2", "dir2/sub", "dir2/sub/new.py"}
+        assert "dir2" not in tree.dir_hashes
+        assert tree.digest == generate_path_hash_tree(self.asset_path).digest
+        assert tree.update([self.asset_path / "x.txt", "/outside/of/root"]) == set()
+
+    def test__PathHashTree__from_file_hashes_matches_generated_tree(self):
+        tree = generate_path_hash_tree(self.asset_path)
+        restored = PathHashTree(root=str(self.asset_path), file_hashes=dict(tree.file_hashes))
+        assert restored.dir_hashes == tree.dir_hashes
+
+    def test__generate_path_hash_tree__single_file(self):
+        tree = generate_path_hash_tree(self.asset_path / "x.txt")
+        assert set(tree.file_hashes) == {"x.txt"}
+        (self.asset_path / "x.txt").write_text("changed")
+        assert tree.update([self.asset_path / "x.txt", self.asset_path / "a.py"]) == {
+            "",
+            "x.txt",
+        }
+
+    def test__generate_file_hash__cache_skips_reading_unchanged_files(self):
+        cache = FileHashCache(self.tmp_path())
+        path = self.asset_path / "x.txt"
+        expected = generate_file_hash(path)
+        assert generate_file_hash(path, cache=cache) == expected
+        assert len(cache) == 1
+
+        with mock.patch(
+            "aibs_informatics_core.utils.hashing.open",
+            side_effect=AssertionError("file was read"),
+            create=True,
+        ):
+            assert generate_file_hash(path, cache=cache) == expected
+        # a new cache instance with the same root reuses the entries
+        other_cache = FileHashCache(cache.root)
+        with mock.patch(
+            "aibs_informatics_core.utils.hashing.open",
+            side_effect=AssertionError("file was read"),
+            create=True,
+        ):
+            assert generate_file_hash(path, cache=other_cache) == expected
+
+        # entries are per hash type
+        assert cache.get(path, hash_type="md5") is None
+        assert generate_file_hash(path, hash_type="md5", cache=cache) == generate_file_hash(
+            path, hash_type="md5"
+        )
+        assert len(cache) == 2
+
+    def test__FileHashCache__reads_with_shared_lock_and_one_connection(self):
+        path = self.asset_path / "x.txt"
+        with FileHashCache(self.tmp_path()) as cache:
+            expected = generate_file_hash(path, cache=cache)
+            with (
+                mock.patch.object(hashing, "PathLock", wraps=hashing.PathLock) as mock_lock,
+                mock.patch.object(hashing.sqlite3, "connect") as mock_connect,
+            ):
+                assert cache.get(path) == expected
+                assert cache.get(path) == expected
+            mock_connect.assert_not_called()
+            assert mock_lock.call_args_list == [mock.call(cache._db_path, shared=True)] * 2
+        assert cache._connection is None
+
+        # the connection is reopened if the cache is used after closing it
+        assert cache.get(path) == expected
+
+    def test__generate_file_hash__cache_rehashes_changed_files(self):
+        cache = FileHashCache(self.tmp_path())
+        path = self.asset_path / "x.txt"
+        original_hash = generate_file_hash(path, cache=cache)
+
+        path.write_text("I've changed")
+        new_hash = generate_file_hash(path, cache=cache)
+        assert new_hash != original_hash
+        assert new_hash == generate_file_hash(path)
+        assert cache.get(path) == new_hash
+
+        # same size, different mtime
+        path.write_text("I'vx changed")
+        os.utime(path, ns=(0, 0))
+        assert cache.get(path) is None
+        assert generate_file_hash(path, cache=cache) == generate_file_hash(path)
+
+    def test__FileHashCache__evicts_least_recently_used_entries(self):
+        cache = FileHashCache(self.tmp_path(), max_entries=3, batch_size=1000)
+        paths = sorted(self.asset_path.rglob("*.py"))
+        for path in paths[:4]:
+            cache.put(path, generate_file_hash(path))
+        # touch the first entry so that it is the most recently used
+        assert cache.get(paths[0]) is not None
+        cache.flush()
+
+        assert len(cache) == 3
+        assert cache.get(paths[0]) is not None
+        assert cache.get(paths[1]) is None
+        assert cache.evict() == 0
+
+        cache.max_entries = None
+        cache.max_bytes = 1
+        assert cache.evict() == 3
+        assert len(cache) == 0
+
+    def test__FileHashCache__flushes_and_evicts_every_batch_size_writes(self):
+        cache = FileHashCache(self.tmp_path(), max_entries=2, batch_size=2)
+        other_cache = FileHashCache(cache.root)
+        paths = sorted(self.asset_path.rglob("*.py"))
+        for path in paths[:3]:
+            cache.put(path, generate_file_hash(path))
+        # the first batch was written, the third entry is still buffered
+        assert other_cache.get(paths[0]) == generate_file_hash(paths[0])
+        assert other_cache.get(paths[2]) is None
+        assert len(cache) == 2
+        assert other_cache.get(paths[2]) == generate_file_hash(paths[2])
+        cache.clear()
+        assert len(cache) == 0
+
+    def test__generate_path_hash__with_cache(self):
+        cache = FileHashCache(self.tmp_path())
+        expected = generate_path_hash(self.asset_path)
+        assert generate_path_hash(self.asset_path, cache=cache, max_workers=4) == expected
+        assert generate_path_hash(self.asset_path, cache=cache) == expected
+        assert len(cache) == 7
+        expected = generate_path_hash(self.asset_path, mode="merkle")
+        assert generate_path_hash(self.asset_path, mode="merkle", cache=cache) == expected
+
+    def test__generate_path_hash__max_workers__many_files(self):
+        root = self.tmp_path()
+        for i in range(500):
+            (root / "small" / str(i % 10)).mkdir(parents=True, exist_ok=True)
+            (root / "small" / str(i % 10) / f"{i}.txt").write_text(f"file {i}")
+        for i in range(4):
+            (root / f"large_{i}.bin").write_bytes(os.urandom(2 * 1024 * 1024))
+
+        assert generate_path_hash(root, max_workers=4) == generate_path_hash(root)
+        expected = generate_path_hash(root, mode="merkle")
+        assert generate_path_hash(root, mode="merkle", max_workers=4) == expected
+
+
+@mark.parametrize("size", [0, 1, 4096, 1024 * 1024 + 7, 20 * 1024 * 1024])
+@mark.parametrize("hash_type", ["md5", "sha256"])
+def test__generate_file_hash__strategies_produce_same_hash(tmp_path, size: int, hash_type):
+    path = tmp_path / "file.bin"
+    content = os.urandom(size)
+    path.write_bytes(content)
+    expected = hashlib.new(hash_type, content).hexdigest()
+
+    assert generate_file_hash(path, hash_type=hash_type) == expected
+    assert generate_file_hash(path, hash_type=hash_type, strategy="mmap") == expected
+    assert generate_file_hash(path, hash_type=hash_type, strategy="buffered") == expected
+    assert generate_file_hash(path, bufsize=1000, hash_type=hash_type) == expected
+
+
+def test__get_file_bufsize__adapts_to_file_size_and_filesystem(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x" * 5000)
+    stat_result = os.stat(path)
+    with mock.patch(
+        "aibs_informatics_core.utils.hashing._is_network_filesystem", return_value=False
+    ):
+        assert _get_file_bufsize(str(path), stat_result) == 8192
+        large_stat = os.stat_result((0, 0, 0, 0, 0, 0, 2**30, 0, 0, 0))
+        assert _get_file_bufsize(str(path), large_stat) == FILE_HASH_LOCAL_BUFSIZE
+    with mock.patch(
+        "aibs_informatics_core.utils.hashing._is_network_filesystem", return_value=True
+    ):
+        assert _get_file_bufsize(str(path), large_stat) == FILE_HASH_NETWORK_BUFSIZE
+
+
+def test__is_network_filesystem__uses_most_specific_mount_point():
+    mount_points = (("/", "ext4"), ("/efs", "nfs4"), ("/efs/local", "ext4"), ("/my mnt", "efs"))
+    with mock.patch(
+        "aibs_informatics_core.utils.hashing._get_mount_points", return_value=mount_points
+    ):
+        assert _is_network_filesystem("/efs/data/file", -1) is True
+        # results are cached per device
+        assert _is_network_filesystem("/tmp/file", -1) is True
+        assert _is_network_filesystem("/efs/local/file", -2) is False
+        assert _is_network_filesystem("/efsx/file", -3) is False
+        assert _is_network_filesystem("/my mnt/file", -4) is True
+
+
+def test__get_mount_points__unescapes_mount_points():
+    _get_mount_points.cache_clear()
+    mounts = "server:/ /my\\040mnt nfs4 rw 0 0\n/dev/root / ext4 rw 0 0\n"
+    try:
+        with mock.patch("builtins.open", mock.mock_open(read_data=mounts)):
+            assert _get_mount_points() == (("/my mnt", "nfs4"), ("/", "ext4"))
+    finally:
+        _get_mount_points.cache_clear()
+
+
+@mark.parametrize("size", [0, 10, 5 * 1024 * 1024, 5 * 1024 * 1024 + 1, 12 * 1024 * 1024])
+def test__generate_file_hashes__computes_all_hashes_in_a_single_read(tmp_path, size: int):
+    path = tmp_path / "file.bin"
+    content = os.urandom(size)
+    path.write_bytes(content)
+    chunk_size = 5 * 1024 * 1024
+
+    with mock.patch(
+        "aibs_informatics_core.utils.hashing._update_hash_from_file",
+        wraps=hashing._update_hash_from_file,
+    ) as mock_update:
+        actual = generate_file_hashes(
+            path,
+            hash_types=["md5", "sha256", "sha1", "crc32", "s3_etag"],
+            multipart_chunk_size=chunk_size,
+            bufsize=1024 * 1024 + 3,
+        )
+    mock_update.assert_called_once()
+
+    parts = [content[i : i + chunk_size] for i in range(0, size, chunk_size)] or [b""]
+    part_digests = b"".join(hashlib.md5(_).digest() for _ in parts)
+    assert actual == {
+        "md5": hashlib.md5(content).hexdigest(),
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "sha1": hashlib.sha1(content).hexdigest(),
+        "crc32": f"{zlib.crc32(content):08x}",
+        "s3_etag": f"{hashlib.md5(part_digests).hexdigest()}-{len(parts)}",
+    }
+
+
+def test__generate_file_hashes__single_part_s3_etag_is_md5(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"hello world")
+    actual = generate_file_hashes(path, hash_types=["s3_etag"], strategy="mmap")
+    assert actual == {"s3_etag": hashlib.md5(b"hello world").hexdigest()}
+
+
+def test__generate_file_hashes__fails_for_invalid_arguments(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"hello world")
+    with raises(ValueError):
+        generate_file_hashes(path, hash_types=["sha512"])  # type: ignore[list-item]
+    with raises(ValueError):
+        generate_file_hashes(path, hash_types=["s3_etag"], multipart_chunk_size=0)
+    with mock.patch.dict(sys.modules, {"crc32c": None}):
+        with raises(ImportError):
+            generate_file_hashes(path, hash_types=["crc32c"])
+
+
+def test__generate_file_hashes__crc32c(tmp_path):
+    crc32c = importorskip("crc32c")
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"hello world")
+    actual = generate_file_hashes(path, hash_types=["crc32c"])
+    assert actual == {"crc32c": f"{crc32c.crc32c(b'hello world'):08x}"}
+
+
+@mark.benchmark
+@mark.parametrize(
+    "size, number",
+    [
+        param(4 * 1024, 200, id="4KiB"),
+        param(1024 * 1024, 20, id="1MiB"),
+        param(64 * 1024 * 1024, 1, id="64MiB"),
+    ],
+)
+def test__generate_file_hash__strategies__benchmark(tmp_path, size: int, number: int):
+    """Micro-benchmark: adaptive strategies compared to a fixed 128 KiB buffer"""
+    path = tmp_path / "file.bin"
+    path.write_bytes(os.urandom(size))
+
+    run_benchmark(
+        f"generate_file_hash of {size} bytes",
+        {
+            "fixed 128KiB buffer": lambda: generate_file_hash(path, bufsize=128 * 1024),
+            "adaptive buffer": lambda: generate_file_hash(path),
+            "mmap": lambda: generate_file_hash(path, strategy="mmap"),
+        },
+        number=number,
+    )
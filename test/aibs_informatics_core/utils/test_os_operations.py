@@ -1,3 +1,10 @@
+import errno
+import os
+import re
+import stat
+import time
+from unittest import mock
+
 import pytest
 from aibs_informatics_test_resources import does_not_raise
 
@@ -10,6 +17,7 @@ from aibs_informatics_core.utils.os_operations import (
     find_all_paths,
     generate_env_file_content,
     get_env_var,
+    iter_paths,
     order_env_vars,
     to_env_var_dict,
     to_env_var_list,
@@ -61,6 +69,124 @@ class OSOperationsTests(BaseTest):
         self.assertListEqual(sorted(actual_dirs), sorted([str(p) for p in expected_dirs]))
         self.assertListEqual(sorted(actual_files), sorted([str(p) for p in expected_files]))
 
+    def test__find_all_paths__matches_os_walk_order(self):
+        root = self.tmp_path()
+        for path in ["b/y/z", "a/x", "c"]:
+            (root / path).mkdir(parents=True)
+        for path in ["f1", "b/f2", "b/y/f3", "a/x/f4", "c/f5"]:
+            (root / path).touch()
+        (root / "link").symlink_to(root / "b", target_is_directory=True)
+
+        expected = []
+        for parent, dirs, files in os.walk(root):
+            expected.extend([os.path.join(parent, name) for name in dirs])
+            expected.extend([os.path.join(parent, name) for name in files])
+
+        self.assertListEqual(find_all_paths(root), expected)
+        self.assertListEqual(list(iter_paths(str(root))), expected)
+        self.assertListEqual(find_all_paths(root / "f1"), [str(root / "f1")])
+
+    def test__iter_paths__prunes_excluded_dirs(self):
+        root = self.tmp_path()
+        (root / "keep" / "skip").mkdir(parents=True)
+        (root / "keep" / "a.txt").touch()
+        (root / "keep" / "skip" / "b.txt").touch()
+        (root / "c.log").touch()
+
+        with mock.patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            actual = list(iter_paths(root, excludes=[r".*/skip", re.compile(r".*\.log")]))
+        self.assertListEqual(actual, [str(root / "keep"), str(root / "keep" / "a.txt")])
+        self.assertNotIn(mock.call(str(root / "keep" / "skip")), mock_scandir.call_args_list)
+        self.assertListEqual(list(iter_paths(root / "c.log", excludes=[r".*\.log"])), [])
+
+    def test__iter_paths__yields_stats(self):
+        root = self.tmp_path()
+        (root / "a").mkdir()
+        (root / "a" / "x").write_text("12345")
+        (root / "broken").symlink_to(root / "missing")
+
+        actual = dict(iter_paths(root, with_stat=True))
+        self.assertEqual(actual[str(root / "a" / "x")].st_size, 5)
+        self.assertTrue(stat.S_ISDIR(actual[str(root / "a")].st_mode))
+        self.assertIsNone(actual[str(root / "broken")])
+        self.assertListEqual(
+            [(path, st.st_size) for path, st in iter_paths(root / "a" / "x", with_stat=True)],
+            [(str(root / "a" / "x"), 5)],
+        )
+
+    def _create_tree(self, num_dirs: int = 30, files_per_dir: int = 3):
+        root = self.tmp_path()
+        dirs = [root]
+        for i in range(num_dirs):
+            # deterministic but irregular nesting
+            path = dirs[(i * 7) % len(dirs)] / f"d{i}"
+            path.mkdir()
+            dirs.append(path)
+            for j in range(files_per_dir):
+                (path / f"f{j}").write_text("x" * j)
+        return root
+
+    def test__iter_paths__max_workers_preserves_order(self):
+        root = self._create_tree()
+        (root / "d0" / "skip").mkdir()
+        (root / "d0" / "skip" / "a").touch()
+        expected = list(iter_paths(root))
+        for max_workers in (2, 8):
+            self.assertListEqual(list(iter_paths(root, max_workers=max_workers)), expected)
+            self.assertListEqual(
+                list(iter_paths(root, include_dirs=False, with_stat=True, max_workers=4)),
+                list(iter_paths(root, include_dirs=False, with_stat=True)),
+            )
+            self.assertListEqual(
+                find_all_paths(root, include_files=False, max_workers=max_workers),
+                find_all_paths(root, include_files=False),
+            )
+        self.assertListEqual(
+            list(iter_paths(root, excludes=[r".*/skip"], max_workers=4)),
+            [_ for _ in expected if "/skip" not in _],
+        )
+
+    def test__iter_paths__max_workers_matches_os_walk_with_slow_listings(self):
+        root = self.tmp_path()
+        for i in range(20):
+            (root / f"d{i}" / "sub").mkdir(parents=True)
+            (root / f"d{i}" / "f").touch()
+            (root / f"d{i}" / "sub" / "g").touch()
+        expected = []
+        for parent, dirs, files in os.walk(root):
+            expected.extend([os.path.join(parent, name) for name in dirs])
+            expected.extend([os.path.join(parent, name) for name in files])
+        scandir = os.scandir
+
+        def slow_scandir(path):
+            # listings take varying times, so read ahead listings finish out of order
+            time.sleep(0.001 * (len(path) % 5))
+            return scandir(path)
+
+        with mock.patch("os.scandir", side_effect=slow_scandir):
+            for max_workers in (None, 2, 8):
+                self.assertListEqual(list(iter_paths(root, max_workers=max_workers)), expected)
+
+    def test__iter_paths__retries_stale_directory_listings(self):
+        root = self._create_tree(num_dirs=2, files_per_dir=1)
+        stale = OSError(errno.ESTALE, "Stale file handle")
+        scandir = os.scandir
+        calls = []
+
+        def flaky_scandir(path):
+            calls.append(path)
+            if path == str(root / "d0") and calls.count(path) == 1:
+                raise stale
+            return scandir(path)
+
+        expected = list(iter_paths(root))
+        with mock.patch("os.scandir", side_effect=flaky_scandir):
+            self.assertListEqual(list(iter_paths(root, max_workers=2)), expected)
+        self.assertEqual(calls.count(str(root / "d0")), 2)
+
+        with mock.patch("os.scandir", side_effect=stale):
+            self.assertListEqual(list(iter_paths(root)), [])
+
     def test__expandvars__expands_env_vars_without_brackets(self):
         self.set_env_vars(("V1", "signal"), ("V2", "the"))
         self.assertEqual(expandvars("$V1 between $V2 noise"), "signal between the noise")
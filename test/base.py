@@ -1,6 +1,10 @@
-__all__ = ["BaseTest", "does_not_raise", "reset_environ_after_test"]
+__all__ = ["BaseTest", "does_not_raise", "reset_environ_after_test", "run_benchmark"]
 
 
+import timeit
+from collections.abc import Callable, Mapping
+from typing import Any
+
 from aibs_informatics_test_resources import BaseTest as _BaseTest
 from aibs_informatics_test_resources import does_not_raise
 from aibs_informatics_test_resources import reset_environ_after_test as reset_environ_after_test
@@ -21,3 +25,31 @@ class BaseTest(_BaseTest):
 
     def set_env_base_env_var(self, env_base: EnvBase | None = None):
         self.set_env_vars((ENV_BASE_KEY, env_base or self.env_base))
+
+
+def run_benchmark(
+    name: str, funcs: Mapping[str, Callable[[], Any]], number: int = 1, repeat: int = 3
+) -> dict[str, float]:
+    """Times functions and prints the seconds per call of each (best of `repeat` runs)
+
+    Benchmarks are marked with `@mark.benchmark`, which is deselected by default. They only
+    report timings, as wall-clock comparisons are flaky on shared runners.
+    Run them with `pytest -m benchmark -s`.
+
+    Args:
+        name (str): name of the benchmark
+        funcs (Mapping[str, Callable]): functions to time by label
+        number (int, optional): calls per run. Defaults to 1.
+        repeat (int, optional): number of runs. Defaults to 3.
+
+    Returns:
+        seconds per call by label
+    """
+    timings = {
+        label: min(timeit.repeat(func, number=number, repeat=repeat)) / number
+        for label, func in funcs.items()
+    }
+    print(f"\n{name}")
+    for label, seconds in timings.items():
+        print(f"  {label}: {seconds * 1e6:.1f} us/call")
+    return timings